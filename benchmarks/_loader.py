@@ -0,0 +1,51 @@
+"""
+Import des modules de l'intégration sans exécuter custom_components/nba_live/__init__.py
+
+Le __init__ du package dépend de Home Assistant; les modules de parsing
+(sensori/*, client.py, resilience.py) n'en ont pas besoin. On enregistre
+donc les packages parents comme simples namespaces pointant sur les
+dossiers du dépôt.
+"""
+import asyncio
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures")
+
+
+def _register_package(name, path):
+    if name in sys.modules:
+        return
+    module = types.ModuleType(name)
+    module.__path__ = [path]
+    sys.modules[name] = module
+
+
+def load_integration():
+    """Prépare sys.modules pour `import custom_components.nba_live.<module>`"""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    _register_package("custom_components", os.path.join(ROOT, "custom_components"))
+    _register_package("custom_components.nba_live", os.path.join(ROOT, "custom_components", "nba_live"))
+
+
+class FakeConfig:
+    time_zone = "Europe/Paris"
+
+
+class FakeHass:
+    """hass minimal pour les fonctions de parsing: config.time_zone, data et tâches de fond"""
+
+    def __init__(self, time_zone="Europe/Paris"):
+        self.config = FakeConfig()
+        self.config.time_zone = time_zone
+        self.data = {}
+
+    def async_create_background_task(self, target, name):
+        return asyncio.ensure_future(target)
+
+
+def fixture_path(name):
+    return os.path.join(FIXTURES, name)
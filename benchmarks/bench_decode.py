@@ -0,0 +1,70 @@
+"""
+Benchmark décodage + traitement du scoreboard multi-ligues (basketball/all/scoreboard)
+
+Compare json (stdlib) et orjson pour décoder le payload brut, puis mesure
+process_match_data sur le document décodé (box scores neutralisés).
+
+Usage: python benchmarks/bench_decode.py [--rounds N]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from _loader import FakeHass, fixture_path, load_integration
+
+load_integration()
+
+from custom_components.nba_live.sensori import scoreboard  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+async def _no_player_stats(hass, match_id, match_state):
+    return None
+
+
+def _timed(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(fixture_path("all_scoreboard.json"), "rb") as handle:
+        raw = handle.read()
+
+    scoreboard._get_player_stats = _no_player_stats
+    hass = FakeHass()
+    loop = asyncio.new_event_loop()
+
+    decoders = [("json", json.loads)]
+    if orjson is not None:
+        decoders.append(("orjson", orjson.loads))
+    else:
+        print("orjson non installé: seul json (stdlib) est mesuré")
+
+    print(f"all_scoreboard.json: {len(raw) / 1024:.0f} KiB, {len(json.loads(raw)['events'])} events, {args.rounds} tours")
+    print(f"{'decoder':<8} {'decode ms':>10} {'process ms':>11} {'total ms':>9}")
+    for name, loads in decoders:
+        decode = _timed(lambda: loads(raw), args.rounds)
+        data = loads(raw)
+        process = _timed(lambda: loop.run_until_complete(scoreboard.process_match_data(data, hass)), args.rounds)
+        print(f"{name:<8} {decode * 1000:>10.2f} {process * 1000:>11.2f} {(decode + process) * 1000:>9.2f}")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Suite de benchmarks des chemins de parsing, sur les fixtures de benchmarks/fixtures
+
+Mesure pour chaque cas le débit (ops/s) et le pic d'allocations (tracemalloc),
+puis compare à benchmarks/baseline.json. Le script échoue (code 1) si un cas
+ralentit ou alloue plus que le seuil toléré, ou si un cas ne produit pas le
+résultat attendu (vérifié avant toute mesure).
+
+Les temps sont normalisés par une boucle de calibration pur Python avant la
+comparaison, pour qu'une baseline enregistrée sur une machine reste utilisable
+sur une autre. Après une optimisation volontaire: --update-baseline.
+
+Usage: python benchmarks/bench_parsing.py [--threshold 0.4] [--min-time 0.5] [--update-baseline] [--only NOM]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from _loader import FakeHass, fixture_path, load_integration, ROOT
+
+load_integration()
+
+from custom_components.nba_live.client import json_loads  # noqa: E402
+from custom_components.nba_live.sensori import scoreboard  # noqa: E402
+from custom_components.nba_live.sensori.boxscore import parse_team_boxscore  # noqa: E402
+from custom_components.nba_live.sensori.classifica import classifica_data  # noqa: E402
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.4
+ROUNDS = 21
+# Équipe présente dans scoreboard_15.json: le cas doit sélectionner puis enrichir un match
+NEXT_MATCH_CASE = {"team_name": "Detroit Pistons", "team_id": "8", "next_match_only": True}
+
+
+async def _no_player_stats(hass, match_id, match_state):
+    return None
+
+
+def _load(name):
+    with open(fixture_path(name), "rb") as handle:
+        return json_loads(handle.read())
+
+
+def _calibrate():
+    """Secondes pour une charge pur Python fixe, unité de la normalisation"""
+    start = time.perf_counter()
+    table = {}
+    for i in range(50000):
+        table[str(i % 997)] = i * i
+    sorted(table.items())
+    return time.perf_counter() - start
+
+
+def _build_cases(loop, hass):
+    """(nom, fonction sans argument) pour chaque chemin mesuré"""
+    cases = []
+
+    def process(data, cold=True, **kwargs):
+        def run():
+            if cold:
+                scoreboard._match_memo.clear()
+            loop.run_until_complete(scoreboard.process_match_data(data, hass, **kwargs))
+        return run
+
+    for games in (0, 5, 15):
+        data = _load(f"scoreboard_{games}.json")
+        cases.append((f"process_match_data/scoreboard_{games}", process(data)))
+    scoreboard_15 = _load("scoreboard_15.json")
+    cases.append(("process_match_data/scoreboard_15_warm", process(scoreboard_15, cold=False)))
+    cases.append(("process_match_data/scoreboard_15_next_match", process(scoreboard_15, **NEXT_MATCH_CASE)))
+
+    all_scoreboard = _load("all_scoreboard.json")
+    cases.append(("process_match_data/all_scoreboard", process(all_scoreboard)))
+    cases.append(("process_league_data/all_scoreboard", lambda: scoreboard.process_league_data(all_scoreboard, hass)))
+
+    standings = _load("standings.json")
+    cases.append(("classifica_data/standings", lambda: classifica_data(standings)))
+    cases.append(("classifica_data/standings_east", lambda: classifica_data(standings, "East")))
+
+    players = _load("summary.json")["boxscore"]["players"]
+    cases.append(("parse_team_boxscore/summary", lambda: [parse_team_boxscore(team) for team in players]))
+    return cases
+
+
+def _check_cases(loop, hass):
+    """
+    Vérifie que les cas mesurent bien ce qu'ils annoncent, avant le chronométrage
+
+    Returns:
+        list: messages d'échec, vide si tout est conforme
+    """
+    failures = []
+    scoreboard_15 = _load("scoreboard_15.json")
+
+    # team_id périmé (id d'une autre ligue): le logo vient du nom, jamais de l'adversaire
+    for next_match_only in (False, True):
+        scoreboard._match_memo.clear()
+        result = loop.run_until_complete(scoreboard.process_match_data(
+            scoreboard_15, hass, team_name="Detroit Pistons", team_id="9999", next_match_only=next_match_only
+        ))
+        if not result.get("team_logo", "").endswith("/det.png"):
+            failures.append(f"team_id inconnu (next_match_only={next_match_only}): logo {result.get('team_logo')}")
+
+    scoreboard._match_memo.clear()
+    result = loop.run_until_complete(scoreboard.process_match_data(scoreboard_15, hass, **NEXT_MATCH_CASE))
+    if len(result.get("matches", [])) != 1:
+        failures.append(f"scoreboard_15_next_match: {len(result.get('matches', []))} match(s) au lieu de 1")
+    return failures
+
+
+def _measure(func, min_time):
+    """
+    Coût normalisé, débit et pic mémoire d'un cas
+
+    Chaque tour chronomètre la calibration juste avant le cas: le rapport des
+    deux durées neutralise les variations de fréquence du CPU. Le coût retenu
+    est la médiane des ROUNDS rapports, insensible aux tours perturbés.
+    """
+    func()  # chauffe (caches lru, imports paresseux)
+    ratios, durations = [], []
+    for _ in range(ROUNDS):
+        calibration = _calibrate()
+        iterations = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time / ROUNDS or iterations == 0:
+            func()
+            iterations += 1
+            elapsed = time.perf_counter() - start
+        durations.append(elapsed / iterations)
+        ratios.append(elapsed / iterations / calibration)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(ratios), 1 / statistics.median(durations), peak
+
+
+def _load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return None
+    with open(BASELINE_PATH, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="régression tolérée (0.4 = 40 %% plus lent ou 40 %% d'allocations en plus)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="durée de mesure par cas, en secondes")
+    parser.add_argument("--update-baseline", action="store_true", help="enregistre les résultats comme nouvelle baseline")
+    parser.add_argument("--only", help="ne mesure que les cas dont le nom contient cette chaîne")
+    args = parser.parse_args()
+
+    scoreboard._get_player_stats = _no_player_stats
+    hass = FakeHass()
+    loop = asyncio.new_event_loop()
+
+    failures = _check_cases(loop, hass)
+    if failures:
+        print("CAS INVALIDES:")
+        for failure in failures:
+            print(f"  {failure}")
+        loop.close()
+        return 1
+
+    baseline = _load_baseline()
+    results = {}
+    regressions = []
+
+    print(f"seuil: {args.threshold:.0%}")
+    print(f"{'cas':<48} {'ops/s':>10} {'pic KiB':>9} {'vs base':>8}")
+    for name, func in _build_cases(loop, hass):
+        if args.only and args.only not in name:
+            continue
+        # Coût normalisé: durée d'une opération en unités de calibration
+        cost, ops, peak = _measure(func, args.min_time)
+        results[name] = {"ops_per_sec": round(ops, 1), "cost": cost, "peak_bytes": peak}
+
+        compared = ""
+        reference = (baseline or {}).get("cases", {}).get(name)
+        if reference:
+            ratio = cost / reference["cost"]
+            compared = f"{ratio:>7.2f}x"
+            if ratio > 1 + args.threshold:
+                regressions.append(f"{name}: {ratio:.2f}x plus lent que la baseline")
+            if reference["peak_bytes"] and peak > reference["peak_bytes"] * (1 + args.threshold):
+                regressions.append(f"{name}: pic mémoire {peak / 1024:.0f} KiB (baseline {reference['peak_bytes'] / 1024:.0f} KiB)")
+        print(f"{name:<48} {ops:>10.1f} {peak / 1024:>9.1f} {compared:>8}")
+
+    loop.close()
+
+    if args.update_baseline:
+        cases = dict((baseline or {}).get("cases", {}))
+        cases.update(results)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as handle:
+            json.dump({"python": sys.version.split()[0], "cases": cases}, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"baseline mise à jour: {BASELINE_PATH}")
+        return 0
+
+    if baseline is None:
+        print("pas de baseline: lancer avec --update-baseline pour en créer une")
+        return 0
+
+    if regressions:
+        print("\nRÉGRESSIONS:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("\naucune régression")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+"""
+Génère les fixtures de benchmark au format des réponses ESPN
+
+Les payloads sont construits de façon déterministe (graine fixe) avec la
+structure des endpoints utilisés par l'intégration. Pour benchmarker sur
+des réponses réelles, il suffit de remplacer le fichier correspondant par
+un enregistrement de l'API.
+
+Usage: python benchmarks/fixtures/generate.py
+"""
+import json
+import os
+import random
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+NBA_TEAMS = [
+    ("1", "Atlanta Hawks", "ATL"), ("2", "Boston Celtics", "BOS"), ("17", "Brooklyn Nets", "BKN"),
+    ("30", "Charlotte Hornets", "CHA"), ("4", "Chicago Bulls", "CHI"), ("5", "Cleveland Cavaliers", "CLE"),
+    ("6", "Dallas Mavericks", "DAL"), ("7", "Denver Nuggets", "DEN"), ("8", "Detroit Pistons", "DET"),
+    ("9", "Golden State Warriors", "GS"), ("10", "Houston Rockets", "HOU"), ("11", "Indiana Pacers", "IND"),
+    ("12", "LA Clippers", "LAC"), ("13", "Los Angeles Lakers", "LAL"), ("29", "Memphis Grizzlies", "MEM"),
+    ("14", "Miami Heat", "MIA"), ("15", "Milwaukee Bucks", "MIL"), ("16", "Minnesota Timberwolves", "MIN"),
+    ("3", "New Orleans Pelicans", "NO"), ("18", "New York Knicks", "NY"), ("25", "Oklahoma City Thunder", "OKC"),
+    ("19", "Orlando Magic", "ORL"), ("20", "Philadelphia 76ers", "PHI"), ("21", "Phoenix Suns", "PHX"),
+    ("22", "Portland Trail Blazers", "POR"), ("23", "Sacramento Kings", "SAC"), ("24", "San Antonio Spurs", "SA"),
+    ("28", "Toronto Raptors", "TOR"), ("26", "Utah Jazz", "UTAH"), ("27", "Washington Wizards", "WSH"),
+]
+
+STAT_NAMES = [
+    "rebounds", "avgRebounds", "assists", "fieldGoalsAttempted", "fieldGoalsMade", "fieldGoalPct",
+    "freeThrowPct", "freeThrowsAttempted", "freeThrowsMade", "points", "threePointPct",
+    "threePointFieldGoalsAttempted", "threePointFieldGoalsMade",
+]
+
+FIRST_NAMES = ["James", "Anthony", "Jalen", "Tyrese", "Luka", "Jayson", "Devin", "Kevin", "Stephen", "Donovan"]
+LAST_NAMES = ["Brown", "Williams", "Johnson", "Davis", "Green", "Jackson", "Harris", "Walker", "Young", "Allen"]
+
+
+def _athlete(rng, athlete_id):
+    return {
+        "id": str(athlete_id),
+        "displayName": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "shortName": "X. Player",
+        "headshot": f"https://a.espncdn.com/i/headshots/nba/players/full/{athlete_id}.png",
+        "jersey": str(rng.randint(0, 99)),
+        "position": {"abbreviation": rng.choice(["G", "F", "C", "SG", "PF"])},
+    }
+
+
+def _competitor(rng, team, home_away, state):
+    team_id, name, abbreviation = team
+    score = rng.randint(80, 130) if state != "pre" else 0
+    periods = 4 if state == "post" else (rng.randint(1, 4) if state == "in" else 0)
+    leaders = []
+    for category, display in (("points", "Points"), ("rebounds", "Rebounds"), ("assists", "Assists"), ("rating", "Rating")):
+        value = rng.randint(5, 40)
+        leaders.append({
+            "name": category,
+            "displayName": display,
+            "shortDisplayName": display[:3],
+            "abbreviation": display[:3].upper(),
+            "leaders": [{
+                "displayValue": str(value),
+                "value": float(value),
+                "athlete": _athlete(rng, rng.randint(1000, 5000000)),
+                "team": {"id": team_id},
+            }],
+        })
+    return {
+        "id": team_id,
+        "uid": f"s:40~l:46~t:{team_id}",
+        "type": "team",
+        "order": 0 if home_away == "home" else 1,
+        "homeAway": home_away,
+        "winner": False,
+        "team": {
+            "id": team_id,
+            "uid": f"s:40~l:46~t:{team_id}",
+            "location": name.rsplit(" ", 1)[0],
+            "name": name.rsplit(" ", 1)[-1],
+            "abbreviation": abbreviation,
+            "displayName": name,
+            "shortDisplayName": name.rsplit(" ", 1)[-1],
+            "color": "000000",
+            "alternateColor": "ffffff",
+            "isActive": True,
+            "venue": {"id": str(rng.randint(1000, 9999))},
+            "links": [{"rel": ["clubhouse", "desktop", "team"], "href": f"https://www.espn.com/nba/team/_/name/{abbreviation.lower()}"}],
+            "logo": f"https://a.espncdn.com/i/teamlogos/nba/500/scoreboard/{abbreviation.lower()}.png",
+        },
+        "score": str(score),
+        "linescores": [{"value": float(rng.randint(15, 40)), "displayValue": str(rng.randint(15, 40)), "period": p + 1} for p in range(periods)],
+        "statistics": [
+            {"name": stat, "abbreviation": stat[:3].upper(), "displayValue": str(rng.randint(1, 60))}
+            for stat in STAT_NAMES
+        ],
+        "leaders": leaders,
+        "records": [
+            {"name": "overall", "abbreviation": "Game", "type": "total", "summary": f"{rng.randint(0, 60)}-{rng.randint(0, 60)}"},
+            {"name": "Home", "type": "home", "summary": f"{rng.randint(0, 30)}-{rng.randint(0, 30)}"},
+            {"name": "Road", "type": "road", "summary": f"{rng.randint(0, 30)}-{rng.randint(0, 30)}"},
+        ],
+    }
+
+
+def make_event(rng, event_id, home, away, state, date):
+    status_type = {
+        "pre": {"id": "1", "name": "STATUS_SCHEDULED", "state": "pre", "completed": False, "description": "Scheduled", "detail": "Scheduled", "shortDetail": "Scheduled"},
+        "in": {"id": "2", "name": "STATUS_IN_PROGRESS", "state": "in", "completed": False, "description": "In Progress", "detail": "Q3 5:12", "shortDetail": "Q3 5:12"},
+        "post": {"id": "3", "name": "STATUS_FINAL", "state": "post", "completed": True, "description": "Final", "detail": "Final", "shortDetail": "Final"},
+    }[state]
+    details = []
+    if state != "pre":
+        for _ in range(rng.randint(5, 25)):
+            details.append({
+                "type": {"id": "1", "text": rng.choice(["Jump Shot", "Layup Shot", "Dunk Shot", "Three Point Jumper", "Free Throw"])},
+                "clock": {"value": float(rng.randint(0, 720)), "displayValue": f"{rng.randint(0, 11)}:{rng.randint(0, 59):02d}"},
+                "period": {"number": rng.randint(1, 4)},
+                "scoringPlay": True,
+                "scoreValue": rng.choice([1, 2, 3]),
+                "athletesInvolved": [_athlete(rng, rng.randint(1000, 5000000))],
+            })
+    return {
+        "id": str(event_id),
+        "uid": f"s:40~l:46~e:{event_id}",
+        "date": date,
+        "name": f"{away[1]} at {home[1]}",
+        "shortName": f"{away[2]} @ {home[2]}",
+        "season": {"year": 2025, "type": 2, "slug": "regular-season"},
+        "competitions": [{
+            "id": str(event_id),
+            "date": date,
+            "attendance": rng.randint(10000, 21000),
+            "type": {"id": "1", "abbreviation": "STD"},
+            "timeValid": True,
+            "neutralSite": False,
+            "venue": {"id": "1", "fullName": f"{home[1].rsplit(' ', 1)[0]} Arena", "address": {"city": "City", "state": "ST"}, "indoor": True},
+            "competitors": [_competitor(rng, home, "home", state), _competitor(rng, away, "away", state)],
+            "details": details,
+            "notes": [],
+            "status": {"clock": 312.0, "displayClock": "5:12" if state == "in" else "0.0", "period": 3 if state == "in" else (4 if state == "post" else 0), "type": status_type},
+            "broadcasts": [{"market": "national", "names": ["ESPN"]}],
+            "format": {"regulation": {"periods": 4}},
+            "startDate": date,
+            "geoBroadcasts": [],
+            "headlines": [{"description": "Recap", "type": "Recap", "shortLinkText": "Recap"}] if state == "post" else [],
+        }],
+        "links": [{"rel": ["summary", "desktop", "event"], "href": f"https://www.espn.com/nba/game/_/gameId/{event_id}"}],
+        "status": {"clock": 312.0, "displayClock": "5:12" if state == "in" else "0.0", "period": 3 if state == "in" else (4 if state == "post" else 0), "type": status_type},
+    }
+
+
+def make_league(abbreviation, name, league_id):
+    return {
+        "id": str(league_id),
+        "uid": f"s:40~l:{league_id}",
+        "name": name,
+        "abbreviation": abbreviation,
+        "slug": abbreviation.lower(),
+        "season": {"year": 2025, "startDate": "2024-10-01T07:00Z", "endDate": "2025-06-30T06:59Z", "displayName": "2024-25", "type": {"id": "2", "type": 2, "name": "Regular Season"}},
+        "logos": [{"href": f"https://a.espncdn.com/i/teamlogos/leagues/500/{abbreviation.lower()}.png", "width": 500, "height": 500}],
+        "calendarType": "day",
+        "calendarStartDate": "2024-10-01T07:00Z",
+        "calendarEndDate": "2025-06-30T06:59Z",
+    }
+
+
+def make_scoreboard(seed, game_count, states=("post", "in", "pre")):
+    """Scoreboard NBA avec `game_count` matchs répartis sur 5 jours"""
+    rng = random.Random(seed)
+    events = []
+    for i in range(game_count):
+        home, away = rng.sample(NBA_TEAMS, 2)
+        state = states[i % len(states)]
+        day = 9 + (i % 5)
+        events.append(make_event(rng, 401700000 + i, home, away, state, f"2025-01-{day:02d}T{rng.randint(0, 3):02d}:30Z"))
+    return {"leagues": [make_league("NBA", "National Basketball Association", 46)], "season": {"type": 2, "year": 2025}, "day": {"date": "2025-01-10"}, "events": events}
+
+
+def make_all_scoreboard(seed=9):
+    """Scoreboard multi-ligues (basketball/all/scoreboard)"""
+    rng = random.Random(seed)
+    leagues = [
+        ("NBA", "National Basketball Association", 46, 12), ("WNBA", "Women's National Basketball Association", 59, 6),
+        ("NCAAM", "NCAA Men's Basketball", 41, 60), ("NCAAW", "NCAA Women's Basketball", 54, 50),
+        ("NBL", "National Basketball League", 4, 6), ("G League", "NBA G League", 69, 10),
+        ("FIBA", "FIBA World Cup", 3, 8), ("EuroLeague", "EuroLeague", 8, 9),
+    ]
+    events = []
+    event_id = 401800000
+    for _, _, _, count in leagues:
+        for i in range(count):
+            home, away = rng.sample(NBA_TEAMS, 2)
+            state = rng.choice(("pre", "in", "post"))
+            events.append(make_event(rng, event_id, home, away, state, f"2025-01-10T{rng.randint(0, 23):02d}:{rng.choice(['00', '30'])}Z"))
+            event_id += 1
+    return {"leagues": [make_league(a, n, lid) for a, n, lid, _ in leagues], "events": events}
+
+
+STANDINGS_STATS = (
+    ("wins", "W"), ("losses", "L"), ("winPercent", "PCT"), ("gamesBehind", "GB"), ("Home", "HOME"),
+    ("Road", "AWAY"), ("differential", "DIFF"), ("streak", "STRK"), ("Last Ten Games", "L10"),
+    ("playoffSeed", "SEED"), ("overall", "OVER"), ("clincher", "CLINCH"),
+    ("avgPointsFor", "PPG"), ("avgPointsAgainst", "OPP PPG"), ("divisionWinPercent", "DIV"), ("leagueWinPercent", "CONF"),
+)
+
+
+def _standings_entry(rng, team, seed):
+    team_id, name, abbreviation = team
+    wins = rng.randint(10, 65)
+    losses = 82 - wins - rng.randint(0, 10)
+    pct = wins / (wins + losses)
+    values = {
+        "wins": (wins, str(wins)), "losses": (losses, str(losses)),
+        "winPercent": (pct, f"{pct:.3f}".lstrip("0")), "gamesBehind": (rng.randint(0, 30), str(rng.randint(0, 30))),
+        "Home": (None, f"{rng.randint(5, 35)}-{rng.randint(5, 35)}"), "Road": (None, f"{rng.randint(5, 35)}-{rng.randint(5, 35)}"),
+        "differential": (rng.uniform(-10, 10), f"{rng.uniform(-10, 10):+.1f}"), "streak": (1, rng.choice(["W1", "L2", "W4"])),
+        "Last Ten Games": (None, f"{rng.randint(0, 10)}-{rng.randint(0, 10)}"), "playoffSeed": (seed, str(seed)),
+        "overall": (None, f"{wins}-{losses}"), "clincher": (None, rng.choice(["", "x", "y", "z", "e"])),
+        "avgPointsFor": (rng.uniform(100, 125), "112.3"), "avgPointsAgainst": (rng.uniform(100, 125), "110.1"),
+        "divisionWinPercent": (rng.random(), ".500"), "leagueWinPercent": (rng.random(), ".550"),
+    }
+    return {
+        "team": {
+            "id": team_id, "uid": f"s:40~l:46~t:{team_id}", "location": name.rsplit(" ", 1)[0], "name": name.rsplit(" ", 1)[-1],
+            "abbreviation": abbreviation, "displayName": name, "shortDisplayName": name.rsplit(" ", 1)[-1], "isActive": True,
+            "logos": [{"href": f"https://a.espncdn.com/i/teamlogos/nba/500/{abbreviation.lower()}.png", "width": 500, "height": 500}],
+        },
+        "stats": [
+            {"name": stat, "displayName": stat, "shortDisplayName": short, "abbreviation": short, "type": stat.lower(),
+             **({"value": values[stat][0]} if values[stat][0] is not None else {}), "displayValue": values[stat][1]}
+            for stat, short in STANDINGS_STATS
+        ],
+    }
+
+
+def make_standings(seed=21):
+    """Classement NBA (apis/v2/sports/basketball/nba/standings), deux conférences de 15 équipes"""
+    rng = random.Random(seed)
+    teams = list(NBA_TEAMS)
+    rng.shuffle(teams)
+    children = []
+    for index, (name, abbreviation) in enumerate((("Eastern Conference", "East"), ("Western Conference", "West"))):
+        conference_teams = teams[index * 15:(index + 1) * 15]
+        children.append({
+            "uid": f"s:40~l:46~g:{5 + index}", "id": str(5 + index), "name": name, "abbreviation": abbreviation, "isConference": True,
+            "standings": {
+                "id": str(index), "name": f"{name} Standings", "displayName": f"{name} Standings",
+                "season": 2025, "seasonType": 2, "seasonDisplayName": "2024-25",
+                "entries": [_standings_entry(rng, team, seed) for seed, team in enumerate(conference_teams, start=1)],
+            },
+        })
+    return {"uid": "s:40~l:46~g:9", "id": "0", "name": "National Basketball Association", "abbreviation": "NBA", "children": children}
+
+
+BOXSCORE_LABELS = ["MIN", "FG", "3PT", "FT", "OREB", "DREB", "REB", "AST", "STL", "BLK", "TO", "PF", "+/-", "PTS"]
+
+
+def _boxscore_line(rng):
+    fga, tpa, fta = rng.randint(0, 25), rng.randint(0, 12), rng.randint(0, 12)
+    fgm, tpm, ftm = rng.randint(0, fga), rng.randint(0, tpa), rng.randint(0, fta)
+    oreb, dreb = rng.randint(0, 5), rng.randint(0, 12)
+    return [
+        str(rng.randint(5, 42)), f"{fgm}-{fga}", f"{tpm}-{tpa}", f"{ftm}-{fta}", str(oreb), str(dreb), str(oreb + dreb),
+        str(rng.randint(0, 12)), str(rng.randint(0, 4)), str(rng.randint(0, 4)), str(rng.randint(0, 6)),
+        str(rng.randint(0, 6)), f"{rng.randint(-20, 20):+d}", str(2 * fgm + tpm + ftm),
+    ]
+
+
+def _boxscore_team(rng, team):
+    team_id, name, abbreviation = team
+    groups = []
+    for group_name, count in (("starters", 5), ("bench", 8)):
+        athletes = []
+        for _ in range(count):
+            dnp = group_name == "bench" and rng.random() < 0.15
+            athlete = _athlete(rng, rng.randint(1000, 5000000))
+            # Dans le summary, headshot est un objet (une simple URL dans les leaders du scoreboard)
+            athlete["headshot"] = {"href": athlete["headshot"], "alt": athlete["displayName"]}
+            athletes.append({
+                "active": True, "starter": group_name == "starters", "didNotPlay": dnp, "reason": "COACH'S DECISION" if dnp else "",
+                "athlete": athlete,
+                "stats": [] if dnp else _boxscore_line(rng),
+            })
+        groups.append({"name": group_name, "names": BOXSCORE_LABELS, "labels": BOXSCORE_LABELS, "athletes": athletes})
+    return {
+        "team": {"id": team_id, "abbreviation": abbreviation, "displayName": name, "logo": f"https://a.espncdn.com/i/teamlogos/nba/500/{abbreviation.lower()}.png"},
+        "statistics": groups,
+    }
+
+
+def make_summary(seed=33):
+    """Summary d'un match terminé (site/v2/sports/basketball/nba/summary), box score des deux équipes"""
+    rng = random.Random(seed)
+    home, away = rng.sample(NBA_TEAMS, 2)
+    event = make_event(rng, 401700999, home, away, "post", "2025-01-10T00:30Z")
+    return {
+        "boxscore": {"teams": event["competitions"][0]["competitors"], "players": [_boxscore_team(rng, home), _boxscore_team(rng, away)]},
+        "header": {"id": event["id"], "competitions": event["competitions"]},
+        "plays": [
+            {"id": str(i), "text": "Jump Shot", "period": {"number": 1 + i // 120}, "clock": {"displayValue": "5:00"}, "scoringPlay": bool(i % 2)}
+            for i in range(480)
+        ],
+    }
+
+
+def write(name, payload):
+    with open(os.path.join(HERE, name), "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, separators=(",", ":"))
+
+
+def main():
+    write("all_scoreboard.json", make_all_scoreboard())
+    write("scoreboard_0.json", make_scoreboard(1, 0))
+    write("scoreboard_5.json", make_scoreboard(5, 5))
+    write("scoreboard_15.json", make_scoreboard(15, 15))
+    write("standings.json", make_standings())
+    write("summary.json", make_summary())
+
+
+if __name__ == "__main__":
+    main()
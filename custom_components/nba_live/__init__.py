@@ -1,12 +1,102 @@
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN, _LOGGER
+from .boxscore_store import BoxScoreStore
+from .client import DATA_CLIENT
+from .const import DOMAIN, DATA_BOXSCORE_STORE, DATA_SENSORS, SERVICE_GET_MATCHES, SERVICE_PROFILE, _LOGGER
+from .profiler import MODE_CPROFILE, MODE_SAMPLER, async_run_profile
+from .sensori.scoreboard import cancel_player_stats
+
+PLATFORMS = ["sensor"]
+
+ATTR_MATCH_ID = "match_id"
+ATTR_CYCLES = "cycles"
+ATTR_MODE = "mode"
+ATTR_TOP = "top"
+ATTR_TIMEOUT = "timeout"
+
+GET_MATCHES_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+    vol.Optional(ATTR_MATCH_ID): cv.string,
+})
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CYCLES, default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    vol.Optional(ATTR_MODE, default=MODE_CPROFILE): vol.In([MODE_CPROFILE, MODE_SAMPLER]),
+    vol.Optional(ATTR_TOP, default=20): vol.All(vol.Coerce(int), vol.Range(min=1, max=200)),
+    vol.Optional(ATTR_TIMEOUT, default=900): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+})
+
+
+def _async_register_services(hass: HomeAssistant):
+    """Services de l'intégration, enregistrés une seule fois pour toutes les entrées"""
+    if hass.services.has_service(DOMAIN, SERVICE_GET_MATCHES):
+        return
+
+    async def _async_get_matches(call: ServiceCall) -> ServiceResponse:
+        # Détail complet (box scores, leaders...) servi à la demande, hors recorder
+        sensors = hass.data.get(DOMAIN, {}).get(DATA_SENSORS, {})
+        response = {}
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            sensor = sensors.get(entity_id)
+            if sensor is None:
+                _LOGGER.warning(f"{SERVICE_GET_MATCHES}: {entity_id} n'est pas un capteur {DOMAIN}")
+                continue
+            response[entity_id] = {"matches": sensor.get_matches(call.data.get(ATTR_MATCH_ID))}
+        return response
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_GET_MATCHES, _async_get_matches,
+        schema=GET_MATCHES_SCHEMA, supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_profile(call: ServiceCall) -> ServiceResponse:
+        # Profil des prochains cycles de rafraîchissement, écrit sous <config>/nba_live_profiles
+        return await async_run_profile(
+            hass, call.data[ATTR_CYCLES], call.data[ATTR_MODE], call.data[ATTR_TOP], call.data[ATTR_TIMEOUT]
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile,
+        schema=PROFILE_SCHEMA, supports_response=SupportsResponse.ONLY,
+    )
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    # Les entrées s'installent en parallèle: le store est publié avant tout await
+    # pour qu'elles partagent le même Store, puis chacune attend son chargement
+    boxscore_store = hass.data[DOMAIN].get(DATA_BOXSCORE_STORE)
+    if boxscore_store is None:
+        boxscore_store = BoxScoreStore(hass)
+        hass.data[DOMAIN][DATA_BOXSCORE_STORE] = boxscore_store
+    await boxscore_store.async_load()
+
+    _async_register_services(hass)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+    # Fermer le pool HTTP partagé quand la dernière entrée est retirée
+    remaining = [e for e in hass.config_entries.async_entries(DOMAIN) if e.entry_id != entry.entry_id]
+    if unload_ok and not remaining:
+        # Box scores encore en vol: ils utiliseraient le client fermé ci-dessous
+        cancel_player_stats()
+        client = hass.data.get(DOMAIN, {}).pop(DATA_CLIENT, None)
+        if client is not None:
+            await client.async_close()
+        boxscore_store = hass.data.get(DOMAIN, {}).pop(DATA_BOXSCORE_STORE, None)
+        if boxscore_store is not None:
+            await boxscore_store.async_save()
+        hass.services.async_remove(DOMAIN, SERVICE_GET_MATCHES)
+        hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
+
+    return unload_ok
@@ -0,0 +1,80 @@
+import asyncio
+from collections import OrderedDict
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, _LOGGER
+from .sensori.boxscore import BoxScore
+
+STORAGE_KEY = f"{DOMAIN}.boxscores"
+STORAGE_VERSION = 1
+SAVE_DELAY = 30                 # secondes, regroupe les écritures disque
+DEFAULT_MAX_ENTRIES = 300       # ~ deux mois de matchs NBA
+
+
+class BoxScoreStore:
+    """
+    Cache persistant (.storage) des box scores des matchs terminés, indexé par match_id.
+
+    Un box score final ne change plus: une fois stocké il est servi sans
+    appel réseau, y compris après un redémarrage. L'éviction est LRU.
+    Les entrées sont gardées en mémoire sous forme de BoxScore (colonnes)
+    et sérialisées seulement à l'écriture.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_entries=DEFAULT_MAX_ENTRIES):
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self):
+        """Charge le cache une seule fois; les entrées installées en parallèle attendent le même chargement"""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            data = await self._store.async_load()
+        if not data:
+            return
+        for match_id, stored in data.get("entries", {}).items():
+            try:
+                self._entries[match_id] = BoxScore.from_storage(stored)
+            except (KeyError, IndexError, TypeError, AttributeError) as e:
+                _LOGGER.debug(f"Box score {match_id} illisible dans {STORAGE_KEY}, ignoré: {e!r}")
+        self._evict()
+        _LOGGER.debug(f"{len(self._entries)} box scores chargés depuis {STORAGE_KEY}")
+
+    @callback
+    def get(self, match_id):
+        player_stats = self._entries.get(match_id)
+        if player_stats is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(match_id)
+        return player_stats
+
+    @callback
+    def put(self, match_id, player_stats):
+        self._entries[match_id] = player_stats
+        self._entries.move_to_end(match_id)
+        self._evict()
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _evict(self):
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @callback
+    def _data_to_save(self):
+        return {"entries": {match_id: box.to_storage() for match_id, box in self._entries.items()}}
+
+    async def async_save(self):
+        await self._store.async_save(self._data_to_save())
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,301 @@
+import asyncio
+import hashlib
+import json
+import time
+import zlib
+import aiohttp
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+from .const import DOMAIN, _LOGGER
+from .metrics import Metrics, async_get_metrics
+from .resilience import (
+    CircuitBreaker,
+    RequestBudget,
+    STATE_HALF_OPEN,
+    PRIORITY_LIVE,
+    PRIORITY_STANDINGS,
+    PRIORITY_BOXSCORE,
+)
+
+try:
+    import brotli
+except ImportError:  # brotli est optionnel, on négocie seulement gzip/deflate sans lui
+    brotli = None
+
+try:
+    import orjson
+except ImportError:  # orjson est fourni par Home Assistant, json reste le repli
+    orjson = None
+
+DATA_CLIENT = "client"
+
+# Paramètres du pool de connexions partagé
+CONNECTION_LIMIT = 20
+CONNECTION_LIMIT_PER_HOST = 6
+DNS_CACHE_TTL = 300        # secondes
+KEEPALIVE_TIMEOUT = 60     # secondes
+DEFAULT_TIMEOUT = 10       # secondes
+MAX_VALIDATORS = 64        # URLs conditionnelles mémorisées (celles des coordinators)
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Requête refusée sans appel réseau: le circuit de l'hôte est ouvert"""
+
+
+class EspnResponse:
+    """Réponse ESPN déjà lue et décompressée"""
+
+    def __init__(self, response, body, wire_bytes, not_modified=False):
+        self.status = response.status
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.body = body
+        self.wire_bytes = wire_bytes
+        # True sur un 304 ou si le corps est identique au précédent (même hash)
+        self.not_modified = not_modified
+        self._request_info = response.request_info
+        self._history = response.history
+        # Renseignés par le client: temps de décodage par endpoint
+        self.request_url = self.url
+        self.metrics = None
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                self._request_info, self._history, status=self.status, message=f"HTTP {self.status}"
+            )
+
+    def json(self):
+        if self.metrics is None:
+            return json_loads(self.body)
+        start = time.perf_counter()
+        data = json_loads(self.body)
+        self.metrics.record_decode(self.request_url, time.perf_counter() - start)
+        return data
+
+
+class EspnHttpClient:
+    """
+    Client HTTP partagé par toute l'intégration: pool de connexions keep-alive,
+    limite par hôte, cache DNS, compression négociée et comptage des octets reçus.
+    """
+
+    def __init__(self, metrics=None):
+        self._session = None
+        self.request_count = 0
+        self.bytes_received = 0   # octets sur le réseau (compressés)
+        self.bytes_decoded = 0    # octets après décompression
+        self.host_stats = {}
+        self.not_modified_count = 0
+        # Validateurs HTTP des URLs demandées en conditionnel: ETag, Last-Modified et
+        # hash du dernier corps. Les URLs datées du scoreboard changent chaque jour: LRU
+        self._validators = OrderedDict()
+        self._breakers = {}
+        self.budget = RequestBudget()
+        self.metrics = metrics if metrics is not None else Metrics()
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                auto_decompress=False,
+                headers={"Accept-Encoding": ACCEPT_ENCODING},
+            )
+        return self._session
+
+    async def async_get(self, url, timeout=DEFAULT_TIMEOUT, conditional=False, priority=None):
+        """
+        Exécute un GET sur le pool partagé
+
+        Args:
+            url (str): URL ESPN
+            timeout (int): timeout total en secondes
+            conditional (bool): envoie les validateurs connus (If-None-Match /
+                If-Modified-Since) et marque la réponse not_modified sur un 304
+                ou un corps identique au précédent. Seules ces URLs (celles des
+                coordinators) ont leurs validateurs mémorisés
+            priority (int): priorité dans le budget global de requêtes,
+                déduite de l'URL si absente
+
+        Returns:
+            EspnResponse: statut, en-têtes et corps décompressé
+        """
+        breaker = self.get_circuit_breaker(url)
+        if not breaker.allow_request():
+            if breaker.state == STATE_HALF_OPEN:
+                raise CircuitOpenError(f"Circuit half_open pour {breaker.host}, requête d'essai en cours")
+            raise CircuitOpenError(f"Circuit ouvert pour {breaker.host}, nouvel essai dans {breaker.remaining_open_time():.0f}s")
+
+        # Budget global: on attend un jeton plutôt que de se faire limiter par ESPN
+        await self.budget.async_acquire(priority_for_url(url) if priority is None else priority)
+
+        session = self._get_session()
+        validators = self._validators.get(url) if conditional else None
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        start = time.perf_counter()
+        try:
+            response = await self._async_request(session, url, headers, timeout, conditional, validators, breaker)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            breaker.record_failure()
+            self.metrics.record_error(url)
+            raise
+
+        self.metrics.record_fetch(
+            url, time.perf_counter() - start, response.wire_bytes, len(response.body), response.not_modified
+        )
+        response.request_url = url
+        response.metrics = self.metrics
+        return response
+
+    async def _async_request(self, session, url, headers, timeout, conditional, validators, breaker):
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            raw = await response.read()
+
+            # 5xx et 429: ESPN en difficulté, compte comme un échec pour le circuit
+            if response.status >= 500 or response.status == 429:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if response.status == 304 and validators:
+                self._account(url, len(raw), 0)
+                self.not_modified_count += 1
+                return EspnResponse(response, b"", len(raw), not_modified=True)
+
+            body = _decompress(raw, response.headers.get("Content-Encoding", ""))
+            self._account(url, len(raw), len(body))
+
+            if response.status != 200:
+                return EspnResponse(response, body, len(raw))
+
+            if not conditional:
+                # Summaries, config flow...: demandés une fois, rien à mémoriser
+                return EspnResponse(response, body, len(raw))
+
+            body_hash = hashlib.blake2b(body, digest_size=16).digest()
+            not_modified = bool(validators) and validators.get("hash") == body_hash
+            if not_modified:
+                self.not_modified_count += 1
+
+            self._validators[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "hash": body_hash,
+            }
+            self._validators.move_to_end(url)
+            while len(self._validators) > MAX_VALIDATORS:
+                self._validators.popitem(last=False)
+            return EspnResponse(response, body, len(raw), not_modified=not_modified)
+
+    def get_circuit_breaker(self, url):
+        """Retourne le disjoncteur de l'hôte de l'URL"""
+        host = urlsplit(url).hostname or "unknown"
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host)
+            self._breakers[host] = breaker
+        return breaker
+
+    def forget_validators(self, url):
+        """Force un téléchargement complet au prochain GET conditionnel de l'URL"""
+        self._validators.pop(url, None)
+
+    async def async_get_json(self, url, timeout=DEFAULT_TIMEOUT, priority=None):
+        """GET + raise_for_status + décodage JSON"""
+        response = await self.async_get(url, timeout=timeout, priority=priority)
+        response.raise_for_status()
+        return response.json()
+
+    def _account(self, url, wire_bytes, decoded_bytes):
+        host = urlsplit(url).hostname or "unknown"
+        stats = self.host_stats.setdefault(host, {"requests": 0, "bytes_received": 0, "bytes_decoded": 0})
+        stats["requests"] += 1
+        stats["bytes_received"] += wire_bytes
+        stats["bytes_decoded"] += decoded_bytes
+        self.request_count += 1
+        self.bytes_received += wire_bytes
+        self.bytes_decoded += decoded_bytes
+
+    def stats(self):
+        return {
+            "request_count": self.request_count,
+            "bytes_received": self.bytes_received,
+            "bytes_decoded": self.bytes_decoded,
+            "not_modified_count": self.not_modified_count,
+            "hosts": {host: dict(stats) for host, stats in self.host_stats.items()},
+            "circuit_breakers": {host: breaker.as_dict() for host, breaker in self._breakers.items()},
+            "request_budget": self.budget.as_dict(),
+        }
+
+    async def async_close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+def json_loads(raw):
+    """Décode un corps JSON brut (bytes), avec orjson quand il est disponible"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def priority_for_url(url):
+    """Priorité par défaut d'une URL ESPN: live > standings > box scores"""
+    if "/summary" in url:
+        return PRIORITY_BOXSCORE
+    if "/standings" in url:
+        return PRIORITY_STANDINGS
+    return PRIORITY_LIVE
+
+
+def _decompress(raw, encoding):
+    encoding = encoding.strip().lower()
+    if not encoding or encoding == "identity":
+        return raw
+    if encoding == "gzip":
+        return zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(raw)
+
+    _LOGGER.warning(f"Content-Encoding non supporté: {encoding}")
+    return raw
+
+
+def async_get_client(hass):
+    """Retourne le client HTTP partagé de l'intégration, en le créant si besoin"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    client = domain_data.get(DATA_CLIENT)
+    if client is None:
+        # Import local: le module reste utilisable sans Home Assistant (benchmarks)
+        from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+
+        client = EspnHttpClient(async_get_metrics(hass))
+        domain_data[DATA_CLIENT] = client
+
+        async def _async_close_client(event):
+            await client.async_close()
+
+        # Fermeture du pool à l'arrêt, quel que soit le premier appelant (entrée, config flow...)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    return client
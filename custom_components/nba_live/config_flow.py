@@ -5,7 +5,19 @@ import logging
 import aiohttp
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
-from .const import DOMAIN
+from .client import async_get_client
+from .const import (
+    DOMAIN,
+    CONF_BOXSCORE_CONCURRENCY,
+    CONF_BOXSCORE_DEADLINE,
+    CONF_PERFORMANCE_SENSOR,
+    CONF_SLIM_ATTRIBUTES,
+    DEFAULT_BOXSCORE_CONCURRENCY,
+    DEFAULT_BOXSCORE_DEADLINE,
+    DEFAULT_PERFORMANCE_SENSOR,
+    DEFAULT_SLIM_ATTRIBUTES,
+    ESPN_SITE_API,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -224,29 +236,23 @@ class CalcioLiveConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             #_LOGGER.warning("Competition code 99999 escluso dal recupero del calendario.")
             return None, None
 
-        calendar_url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{competition_code}/scoreboard"
+        calendar_url = f"{ESPN_SITE_API}/apis/site/v2/sports/soccer/{competition_code}/scoreboard"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(calendar_url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    # Estrai le date di inizio e fine dal calendario
-                    calendar_start_date = data.get("calendarStartDate", "2024-07-01T04:00Z")
-                    calendar_end_date = data.get("calendarEndDate", "2025-07-01T03:59Z")
-                    return calendar_start_date[:10], calendar_end_date[:10]
+            data = await async_get_client(self.hass).async_get_json(calendar_url)
+            # Estrai le date di inizio e fine dal calendario
+            calendar_start_date = data.get("calendarStartDate", "2024-07-01T04:00Z")
+            calendar_end_date = data.get("calendarEndDate", "2025-07-01T03:59Z")
+            return calendar_start_date[:10], calendar_end_date[:10]
         except Exception as e:
             _LOGGER.error(f"Errore nel recupero del calendario: {e}")
             return None, None
     
 
     async def _get_competitions(self):
-        url = "https://site.api.espn.com/apis/site/v2/leagues/dropdown?lang=en&region=us&calendartype=whitelist&limit=200&sport=soccer"
+        url = f"{ESPN_SITE_API}/apis/site/v2/leagues/dropdown?lang=en&region=us&calendartype=whitelist&limit=200&sport=soccer"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    competitions_data = await response.json()
-                    return {league['slug']: league['name'] for league in competitions_data.get("leagues", [])}
+            competitions_data = await async_get_client(self.hass).async_get_json(url)
+            return {league['slug']: league['name'] for league in competitions_data.get("leagues", [])}
         except aiohttp.ClientError as e:
             _LOGGER.error(f"Errore nel caricamento delle competizioni: {e}")
             return {}
@@ -257,22 +263,19 @@ class CalcioLiveConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return competitions.get(competition_code, "Nome Sconosciuto")
 
     async def _get_teams(self, competition_code):
-        url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{competition_code}/teams"
+        url = f"{ESPN_SITE_API}/apis/site/v2/sports/soccer/{competition_code}/teams"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    teams_data = await response.json()
-                
-                    leagues = teams_data.get("sports", [{}])[0].get("leagues", [{}])
-                    if not leagues:
-                        self._teams = []
-                        return
-
-                    self._teams = [
-                        {"id": team["team"]["id"], "displayName": team["team"]["displayName"]}
-                        for league in leagues for team in league.get("teams", [])
-                    ]
+            teams_data = await async_get_client(self.hass).async_get_json(url)
+
+            leagues = teams_data.get("sports", [{}])[0].get("leagues", [{}])
+            if not leagues:
+                self._teams = []
+                return
+
+            self._teams = [
+                {"id": team["team"]["id"], "displayName": team["team"]["displayName"]}
+                for league in leagues for team in league.get("teams", [])
+            ]
         except aiohttp.ClientError as e:
             _LOGGER.error(f"Errore nel caricamento delle squadre per {competition_code}: {e}")
             self._teams = []
@@ -309,6 +312,22 @@ class CalcioLiveOptionsFlow(config_entries.OptionsFlow):
             data_schema=vol.Schema({
                 vol.Optional("start_date", default=start_date): str,
                 vol.Optional("end_date", default=end_date): str,
+                vol.Optional(
+                    CONF_BOXSCORE_CONCURRENCY,
+                    default=self._config_entry.options.get(CONF_BOXSCORE_CONCURRENCY, DEFAULT_BOXSCORE_CONCURRENCY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                vol.Optional(
+                    CONF_BOXSCORE_DEADLINE,
+                    default=self._config_entry.options.get(CONF_BOXSCORE_DEADLINE, DEFAULT_BOXSCORE_DEADLINE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                vol.Optional(
+                    CONF_SLIM_ATTRIBUTES,
+                    default=self._config_entry.options.get(CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES),
+                ): bool,
+                vol.Optional(
+                    CONF_PERFORMANCE_SENSOR,
+                    default=self._config_entry.options.get(CONF_PERFORMANCE_SENSOR, DEFAULT_PERFORMANCE_SENSOR),
+                ): bool,
                 vol.Optional("info", default="⚠ Dopo la modifica, riavvia Home Assistant.", description=""): str,
             }),
         )
@@ -1,5 +1,61 @@
 import logging
+import os
+from datetime import timedelta
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "nba_live"
 CONF_COMPETITION_CODE = "competition_code"
+
+# Hôtes ESPN. NBA_LIVE_ESPN_BASE_URL (ex. http://127.0.0.1:8765) les redirige tous
+# vers un serveur de substitution local (tools/espn_standin.py)
+ESPN_BASE_URL_OVERRIDE = os.environ.get("NBA_LIVE_ESPN_BASE_URL", "").rstrip("/")
+ESPN_SITE_API = ESPN_BASE_URL_OVERRIDE or "https://site.api.espn.com"
+ESPN_SITE_WEB_API = ESPN_BASE_URL_OVERRIDE or "https://site.web.api.espn.com"
+ESPN_BASKETBALL_URL = f"{ESPN_SITE_API}/apis/site/v2/sports/basketball"
+ESPN_STANDINGS_URL = f"{ESPN_SITE_WEB_API}/apis/v2/sports/basketball/nba/standings?"
+
+# Clé hass.data[DOMAIN] du cache persistant des box scores (boxscore_store.py)
+DATA_BOXSCORE_STORE = "boxscore_store"
+
+# Récupération des box scores (summary) des matchs terminés
+CONF_BOXSCORE_CONCURRENCY = "boxscore_concurrency"
+CONF_BOXSCORE_DEADLINE = "boxscore_deadline"
+DEFAULT_BOXSCORE_CONCURRENCY = 4    # requêtes summary simultanées
+DEFAULT_BOXSCORE_DEADLINE = 8       # secondes pour l'ensemble des box scores d'un cycle
+
+# Attributs allégés: résumé des matchs dans l'état, détail complet via le service get_matches
+CONF_SLIM_ATTRIBUTES = "slim_attributes"
+DEFAULT_SLIM_ATTRIBUTES = False
+
+# Capteur de performance optionnel (latences, décodage, traitement, caches)
+CONF_PERFORMANCE_SENSOR = "performance_sensor"
+DEFAULT_PERFORMANCE_SENSOR = False
+
+# Clé hass.data[DOMAIN] des capteurs par entity_id (service get_matches)
+DATA_SENSORS = "sensors"
+SERVICE_GET_MATCHES = "get_matches"
+
+# Clé hass.data[DOMAIN] des entités par match en cours, par match_id (toutes entrées confondues)
+DATA_LIVE_GAMES = "live_games"
+LIVE_GAME_UNIQUE_ID_PREFIX = "calciolive_live_"   # + match_id
+
+# Événements publiés sur le bus (events.py) et clé hass.data[DOMAIN] du tracker
+DATA_GAME_EVENTS = "game_events"
+EVENT_SCORE_CHANGE = f"{DOMAIN}_score_change"
+EVENT_PERIOD_END = f"{DOMAIN}_period_end"
+EVENT_GAME_FINAL = f"{DOMAIN}_game_final"
+EVENT_TIPOFF = f"{DOMAIN}_tipoff"
+
+# Service de profilage des cycles de mise à jour (profiler.py) et clé hass.data[DOMAIN] de la session
+DATA_PROFILER = "profiler"
+SERVICE_PROFILE = "profile"
+PROFILE_DIR = f"{DOMAIN}_profiles"      # sous le dossier de configuration
+
+# Cadences de rafraîchissement (planifiées par le coordinator à partir du scoreboard)
+SCAN_INTERVAL_LIVE = timedelta(seconds=10)      # Match en cours
+SCAN_INTERVAL_IDLE = timedelta(minutes=10)      # Payload sans calendrier (classement)
+SCAN_INTERVAL_SLOW = timedelta(hours=1)         # Plus aucun match à venir dans la fenêtre
+SCAN_INTERVAL_PENDING = timedelta(minutes=1)    # Box scores encore en attente
+SCAN_INTERVAL_MAX_SLEEP = timedelta(hours=3)    # Sommeil maximal avant un tipoff (reports d'horaire)
+TIPOFF_LEAD = timedelta(minutes=2)              # Réveil avant le tipoff prévu
+DIAGNOSTIC_UPDATE_INTERVAL = timedelta(minutes=5) # Écriture des capteurs de diagnostic et de performance
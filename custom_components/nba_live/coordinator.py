@@ -0,0 +1,272 @@
+import asyncio
+import aiohttp
+from datetime import datetime, timedelta
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .client import CircuitOpenError, async_get_client
+from .profiler import async_get_profile_session, profiled_section
+from .resilience import RetryPolicy
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    SCAN_INTERVAL_LIVE,
+    SCAN_INTERVAL_IDLE,
+    SCAN_INTERVAL_SLOW,
+    SCAN_INTERVAL_PENDING,
+    SCAN_INTERVAL_MAX_SLEEP,
+    TIPOFF_LEAD,
+)
+
+DATA_COORDINATORS = "coordinators"
+
+# Politique de retry commune à tous les coordinators
+RETRY_POLICY = RetryPolicy()
+
+# Sentinelle renvoyée par _async_fetch sur un 304 ou un corps inchangé
+NOT_MODIFIED = object()
+
+
+class EspnFetchCoordinator:
+    """
+    Récupère une URL ESPN une seule fois et diffuse le payload décodé
+    à tous les capteurs abonnés à cette URL.
+
+    Le coordinator planifie lui-même ses réveils à partir des matchs du
+    payload: cadence live tant qu'un match est en cours, sommeil jusqu'au
+    prochain tipoff sinon, cadence lente une fois tous les matchs terminés.
+    """
+
+    def __init__(self, hass: HomeAssistant, url):
+        self.hass = hass
+        self.url = url
+        self.data = None
+        self.last_update = None
+        self.request_count = 0
+        self.last_request_time = None
+        self.update_interval = SCAN_INTERVAL_IDLE
+        self.next_refresh = None
+        self.has_live_match = False
+        self._listeners = {}
+        self._lock = asyncio.Lock()
+        self._unsub_refresh = None
+        self._derived = {}
+
+    @callback
+    def async_add_listener(self, update_callback):
+        """
+        Abonne un capteur aux nouveaux payloads.
+
+        Args:
+            update_callback: coroutine appelée avec le payload décodé
+
+        Returns:
+            callable: fonction de désabonnement
+        """
+        token = object()
+        self._listeners[token] = update_callback
+
+        @callback
+        def remove_listener():
+            self._listeners.pop(token, None)
+            if not self._listeners:
+                self._async_cancel_refresh()
+                coordinators = self.hass.data.get(DOMAIN, {}).get(DATA_COORDINATORS, {})
+                if coordinators.get(self.url) is self:
+                    del coordinators[self.url]
+
+        return remove_listener
+
+    async def async_refresh(self, max_age=timedelta(0)):
+        """
+        Télécharge l'URL si le dernier payload est plus vieux que max_age,
+        puis le diffuse aux abonnés et planifie le prochain réveil.
+
+        Un 304 ou un corps identique au précédent ne déclenche ni décodage
+        ni diffusion: l'état des capteurs reste inchangé.
+
+        Returns:
+            bool: True si un nouveau payload a été diffusé
+        """
+        refreshed = await self._async_refresh(max_age)
+        # Service nba_live.profile: un cycle compte dès qu'un nouveau payload a été diffusé
+        profile_session = async_get_profile_session(self.hass)
+        if refreshed and profile_session is not None:
+            profile_session.cycle_done()
+        return refreshed
+
+    async def _async_refresh(self, max_age):
+        async with self._lock:
+            now = dt_util.utcnow()
+            if self.data is not None and self.last_update is not None and now - self.last_update < max_age:
+                _LOGGER.debug(f"Coordinator {self.url}: payload encore frais, pas de requête")
+                return False
+
+            data = await self._async_fetch()
+            if data is NOT_MODIFIED:
+                # Rien n'a changé: pas de décodage, pas de _process_data
+                self.last_update = now
+                self._async_schedule_refresh(self._compute_update_interval(self.data))
+                return False
+            if data is None:
+                # Échec: on garde le dernier payload valide et on réessaie au plus tard
+                # dans SCAN_INTERVAL_IDLE, sans réveil inutile tant que le circuit est ouvert
+                retry_in = min(self.update_interval, SCAN_INTERVAL_IDLE)
+                open_for = timedelta(seconds=self.circuit_breaker.remaining_open_time())
+                self._async_schedule_refresh(max(retry_in, open_for), keep_interval=True)
+                return False
+
+            self.data = data
+            self._derived = {}
+            self.last_update = now
+            self._async_schedule_refresh(self._compute_update_interval(data))
+
+        for listener in list(self._listeners.values()):
+            if data is not self.data:
+                # Un rafraîchissement plus récent a pris le relais (diffusion plus longue que la cadence
+                # live, box scores en attente): il diffuse lui-même son payload à tous les abonnés
+                break
+            try:
+                await listener(data)
+            except Exception as e:
+                _LOGGER.error(f"Erreur lors de la diffusion du payload {self.url}: {e}")
+
+        return True
+
+    def get_derived(self, data, key, factory):
+        """
+        Structure calculée une seule fois par payload et partagée par les abonnés
+        (index des événements, classement...). Recalculée si `data` n'est pas
+        le payload courant.
+        """
+        if data is not self.data:
+            return factory(data)
+        hit = key in self._derived
+        async_get_client(self.hass).metrics.record_cache("derived", hit)
+        if not hit:
+            self._derived[key] = factory(data)
+        return self._derived[key]
+
+    @callback
+    def async_invalidate(self):
+        """
+        Oublie les validateurs de l'URL: le prochain rafraîchissement sera un
+        téléchargement complet, diffusé même si le contenu n'a pas changé.
+        Ce rafraîchissement est avancé à SCAN_INTERVAL_PENDING au plus tard.
+        """
+        async_get_client(self.hass).forget_validators(self.url)
+        if self.next_refresh is None or self.next_refresh - dt_util.utcnow() > SCAN_INTERVAL_PENDING:
+            self._async_schedule_refresh(SCAN_INTERVAL_PENDING, keep_interval=True)
+
+    def _compute_update_interval(self, data):
+        """
+        Calcule le délai avant le prochain réveil à partir des matchs du payload
+
+        Returns:
+            timedelta: cadence live si un match est en cours ou imminent, délai
+            jusqu'au prochain tipoff sinon, cadence lente s'il n'y en a plus
+        """
+        events = data.get("events") if isinstance(data, dict) else None
+        self.has_live_match = False
+        if not events:
+            return SCAN_INTERVAL_IDLE
+
+        now = dt_util.utcnow()
+        next_tipoff = None
+        for event in events:
+            state = event.get("status", {}).get("type", {}).get("state")
+            if state == "in":
+                self.has_live_match = True
+                return SCAN_INTERVAL_LIVE
+            if state != "pre":
+                continue
+
+            tipoff = dt_util.parse_datetime(event.get("date") or "")
+            if tipoff is None:
+                continue
+            if tipoff - now <= TIPOFF_LEAD:
+                # Tipoff imminent ou retardé: on surveille à la cadence live
+                return SCAN_INTERVAL_LIVE
+            if next_tipoff is None or tipoff < next_tipoff:
+                next_tipoff = tipoff
+
+        if next_tipoff is None:
+            return SCAN_INTERVAL_SLOW
+
+        return min(next_tipoff - TIPOFF_LEAD - now, SCAN_INTERVAL_MAX_SLEEP)
+
+    @callback
+    def _async_schedule_refresh(self, delay, keep_interval=False):
+        self._async_cancel_refresh()
+        if not keep_interval:
+            self.update_interval = delay
+        if not self._listeners:
+            return
+
+        self.next_refresh = dt_util.utcnow() + delay
+        self._unsub_refresh = async_track_point_in_utc_time(
+            self.hass, self._async_handle_refresh, self.next_refresh
+        )
+        _LOGGER.debug(f"Coordinator {self.url}: prochain réveil dans {delay.total_seconds():.0f}s")
+
+    @callback
+    def _async_cancel_refresh(self):
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+        self.next_refresh = None
+
+    async def _async_handle_refresh(self, _now):
+        self._unsub_refresh = None
+        self.next_refresh = None
+        await self.async_refresh()
+
+    @property
+    def circuit_breaker(self):
+        return async_get_client(self.hass).get_circuit_breaker(self.url)
+
+    async def _async_fetch(self):
+        client = async_get_client(self.hass)
+        for attempt in range(RETRY_POLICY.attempts):
+            if attempt:
+                client.metrics.record_retry(self.url)
+            try:
+                self.request_count += 1
+                self.last_request_time = datetime.now()
+                if self.data is None:
+                    # Pas encore de payload à resservir sur un 304: téléchargement complet
+                    client.forget_validators(self.url)
+                response = await client.async_get(self.url, conditional=True)
+                if response.not_modified:
+                    _LOGGER.debug(f"{self.url} inchangé depuis le dernier téléchargement")
+                    return NOT_MODIFIED
+                if response.status == 200:
+                    with profiled_section(self.hass):
+                        data = response.json()
+                    _LOGGER.debug(f"Data received for {self.url}: {data}")
+                    return data
+                _LOGGER.debug(f"{self.url}: HTTP {response.status} (tentative {attempt + 1})")
+            except CircuitOpenError as e:
+                # ESPN indisponible: échec immédiat, le dernier payload reste servi
+                _LOGGER.debug(str(e))
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                _LOGGER.debug(f"{self.url}: {e!r} (tentative {attempt + 1})")
+
+            if attempt + 1 < RETRY_POLICY.attempts:
+                await asyncio.sleep(RETRY_POLICY.backoff(attempt))
+
+        _LOGGER.warning(f"Impossible de récupérer {self.url} après {RETRY_POLICY.attempts} tentatives")
+        return None
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant, url):
+    """Retourne le coordinator partagé pour une URL, en le créant si besoin"""
+    coordinators = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_COORDINATORS, {})
+    coordinator = coordinators.get(url)
+    if coordinator is None:
+        coordinator = EspnFetchCoordinator(hass, url)
+        coordinators[url] = coordinator
+    return coordinator
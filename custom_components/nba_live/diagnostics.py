@@ -0,0 +1,57 @@
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .client import async_get_client
+from .const import DOMAIN, DATA_BOXSCORE_STORE, DATA_SENSORS
+from .coordinator import DATA_COORDINATORS
+from .metrics import async_get_metrics
+from .sensori.scoreboard import match_memo_stats
+
+
+@callback
+def async_collect_metrics(hass: HomeAssistant):
+    """Métriques de fetch, décodage, traitement et caches (diagnostics et capteur de performance)"""
+    client = async_get_client(hass)
+    extra_caches = {
+        "match_memo": match_memo_stats(),
+        "http_validators": {
+            "hits": client.not_modified_count,
+            "misses": client.request_count - client.not_modified_count,
+        },
+    }
+    boxscore_store = hass.data.get(DOMAIN, {}).get(DATA_BOXSCORE_STORE)
+    if boxscore_store is not None:
+        extra_caches["boxscore_store"] = {
+            "hits": boxscore_store.hits,
+            "misses": boxscore_store.misses,
+            "size": len(boxscore_store),
+        }
+    return async_get_metrics(hass).as_dict(extra_caches)
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
+    """Téléchargement de diagnostics: options de l'entrée, coordinators, client HTTP et métriques"""
+    domain_data = hass.data.get(DOMAIN, {})
+    sensors = [
+        sensor for sensor in domain_data.get(DATA_SENSORS, {}).values()
+        if sensor.config_entry_id == entry.entry_id
+    ]
+    coordinators = {}
+    for coordinator in domain_data.get(DATA_COORDINATORS, {}).values():
+        coordinators[coordinator.url] = {
+            "request_count": coordinator.request_count,
+            "last_request_time": coordinator.last_request_time,
+            "last_update": coordinator.last_update,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "next_refresh": coordinator.next_refresh,
+            "has_live_match": coordinator.has_live_match,
+            "listeners": len(coordinator._listeners),
+        }
+
+    return {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "sensors": {sensor.entity_id: sensor._sensor_type for sensor in sensors},
+        "coordinators": coordinators,
+        "client": async_get_client(hass).stats(),
+        "metrics": async_collect_metrics(hass),
+    }
@@ -0,0 +1,181 @@
+from collections import OrderedDict
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    DATA_GAME_EVENTS,
+    EVENT_SCORE_CHANGE,
+    EVENT_PERIOD_END,
+    EVENT_GAME_FINAL,
+    EVENT_TIPOFF,
+)
+
+# Statuts ESPN (type.description) d'une fin de quart-temps
+PERIOD_END_STATUSES = ("end of period", "halftime", "end of quarter")
+MAX_TRACKED_MATCHES = 512
+STATE_ORDER = {"pre": 0, "in": 1, "post": 2}
+
+
+class GameSnapshot:
+    """Dernier état connu d'un match, réduit à ce qui déclenche des événements"""
+
+    __slots__ = ("state", "period", "home_score", "away_score", "status", "period_end_fired")
+
+    def __init__(self, match, period_end_fired=None):
+        self.state = match.state
+        self.period = match.period
+        self.home_score = match.home.score
+        self.away_score = match.away.score
+        self.status = match.status
+        self.period_end_fired = period_end_fired
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class GameEventTracker:
+    """
+    Compare les scoreboards successifs match par match et publie sur le bus
+    des événements compacts: tipoff, panier, fin de quart-temps, fin de match.
+
+    Partagé par toutes les entrées: plusieurs capteurs peuvent lui soumettre le
+    même match, seul le premier changement observé déclenche un événement.
+    La première observation d'un match ne fait que mémoriser son état.
+
+    Les capteurs lisent des payloads différents (nba/scoreboard, all/scoreboard)
+    téléchargés à des instants différents: une observation qui recule (score,
+    période ou état antérieurs) vient d'un payload plus ancien et est ignorée.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._snapshots = OrderedDict()
+        self.fired = {EVENT_TIPOFF: 0, EVENT_SCORE_CHANGE: 0, EVENT_PERIOD_END: 0, EVENT_GAME_FINAL: 0}
+
+    @callback
+    def async_process(self, matches):
+        for match in matches:
+            previous = self._snapshots.get(match.match_id)
+            if previous is not None and (self._unchanged(previous, match) or self._is_behind(previous, match)):
+                continue
+
+            period_end_fired = previous.period_end_fired if previous is not None else None
+            if previous is not None:
+                period_end_fired = self._fire_transitions(previous, match, period_end_fired)
+
+            self._snapshots[match.match_id] = GameSnapshot(match, period_end_fired)
+            self._snapshots.move_to_end(match.match_id)
+
+        while len(self._snapshots) > MAX_TRACKED_MATCHES:
+            self._snapshots.popitem(last=False)
+
+    @staticmethod
+    def _unchanged(previous, match):
+        return (
+            previous.state == match.state
+            and previous.period == match.period
+            and previous.home_score == match.home.score
+            and previous.away_score == match.away.score
+            and previous.status == match.status
+        )
+
+    @staticmethod
+    def _is_behind(previous, match):
+        """True si `match` est antérieur au dernier état connu (payload plus ancien)"""
+        previous_rank, rank = STATE_ORDER.get(previous.state), STATE_ORDER.get(match.state)
+        if previous_rank is not None and rank is not None and rank != previous_rank:
+            return rank < previous_rank
+        for before, now in (
+            (previous.period, match.period),
+            (previous.home_score, match.home.score),
+            (previous.away_score, match.away.score),
+        ):
+            before, now = _to_int(before), _to_int(now)
+            if before is not None and now is not None and now < before:
+                return True
+        return False
+
+    def _fire_transitions(self, previous, match, period_end_fired):
+        if previous.state == "pre" and match.state == "in":
+            self._fire(EVENT_TIPOFF, match)
+
+        if self._scored(previous, match):
+            self._fire(EVENT_SCORE_CHANGE, match, {
+                "previous_home_score": previous.home_score,
+                "previous_away_score": previous.away_score,
+                "scoring_team": self._scoring_team(previous, match),
+            })
+
+        if match.state in ("in", "post") and previous.state == "in":
+            # Fin de quart-temps vue via le statut, ou déduite d'un changement de période manqué
+            ended = None
+            if match.status.lower() in PERIOD_END_STATUSES:
+                ended = match.period
+            elif _to_int(match.period) is not None and _to_int(previous.period) is not None \
+                    and _to_int(match.period) > _to_int(previous.period):
+                ended = previous.period
+            if ended is not None and ended != period_end_fired:
+                self._fire(EVENT_PERIOD_END, match, {"ended_period": ended})
+                period_end_fired = ended
+
+        if previous.state != "post" and match.state == "post":
+            self._fire(EVENT_GAME_FINAL, match, {"winner": self._leader(match)})
+
+        return period_end_fired
+
+    @staticmethod
+    def _scored(previous, match):
+        """Au moins une équipe a marqué (un score qui baisse n'est jamais un panier)"""
+        return (
+            (_to_int(match.home.score) or 0) > (_to_int(previous.home_score) or 0)
+            or (_to_int(match.away.score) or 0) > (_to_int(previous.away_score) or 0)
+        )
+
+    @staticmethod
+    def _scoring_team(previous, match):
+        home_delta = (_to_int(match.home.score) or 0) - (_to_int(previous.home_score) or 0)
+        away_delta = (_to_int(match.away.score) or 0) - (_to_int(previous.away_score) or 0)
+        if home_delta > 0 and away_delta <= 0:
+            return match.home.team
+        if away_delta > 0 and home_delta <= 0:
+            return match.away.team
+        return None
+
+    @staticmethod
+    def _leader(match):
+        home, away = _to_int(match.home.score), _to_int(match.away.score)
+        if home is None or away is None or home == away:
+            return None
+        return match.home.team if home > away else match.away.team
+
+    def _fire(self, event_type, match, extra=None):
+        data = {
+            "match_id": match.match_id,
+            "home_team": match.home.team,
+            "away_team": match.away.team,
+            "home_score": match.home.score,
+            "away_score": match.away.score,
+            "period": match.period,
+            "clock": match.clock,
+        }
+        if extra:
+            data.update(extra)
+        self.fired[event_type] += 1
+        _LOGGER.debug(f"{event_type}: {data}")
+        self.hass.bus.async_fire(event_type, data)
+
+
+@callback
+def async_get_event_tracker(hass: HomeAssistant):
+    """Retourne le tracker d'événements partagé, en le créant si besoin"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    tracker = domain_data.get(DATA_GAME_EVENTS)
+    if tracker is None:
+        tracker = GameEventTracker(hass)
+        domain_data[DATA_GAME_EVENTS] = tracker
+    return tracker
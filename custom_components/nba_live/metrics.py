@@ -0,0 +1,149 @@
+from collections import deque
+from urllib.parse import urlsplit
+
+from .const import DOMAIN
+
+DATA_METRICS = "metrics"
+SAMPLE_SIZE = 256          # derniers échantillons conservés par série
+
+
+def endpoint_key(url):
+    """Endpoint d'une URL ESPN sans la query string (hôte + chemin)"""
+    parts = urlsplit(url)
+    return f"{parts.hostname}{parts.path}"
+
+
+def _percentiles(samples):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+
+    def pick(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1)
+
+    return {"p50_ms": pick(0.5), "p90_ms": pick(0.9), "p99_ms": pick(0.99), "max_ms": round(ordered[-1] * 1000, 1)}
+
+
+class EndpointMetrics:
+    """Compteurs et échantillons de latence d'un endpoint ESPN"""
+
+    __slots__ = ("requests", "errors", "retries", "not_modified", "bytes_received", "bytes_decoded",
+                 "latencies", "decode_times")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.latencies = deque(maxlen=SAMPLE_SIZE)
+        self.decode_times = deque(maxlen=SAMPLE_SIZE)
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "not_modified": self.not_modified,
+            "bytes_received": self.bytes_received,
+            "bytes_decoded": self.bytes_decoded,
+            "fetch_latency": _percentiles(self.latencies),
+            "decode_time": _percentiles(self.decode_times),
+        }
+
+
+class ProcessMetrics:
+    """Durées de traitement d'un type de capteur: temps total et temps CPU pris à la boucle"""
+
+    __slots__ = ("cycles", "wall_times", "loop_times")
+
+    def __init__(self):
+        self.cycles = 0
+        self.wall_times = deque(maxlen=SAMPLE_SIZE)
+        self.loop_times = deque(maxlen=SAMPLE_SIZE)
+
+    def as_dict(self):
+        return {
+            "cycles": self.cycles,
+            "process_time": _percentiles(self.wall_times),
+            "event_loop_time": _percentiles(self.loop_times),
+        }
+
+
+class Metrics:
+    """
+    Métriques d'exécution de l'intégration (fetch, décodage, traitement, caches)
+
+    Alimentées par le client HTTP, les coordinators et les capteurs; exposées
+    par le téléchargement de diagnostics et le capteur de performance optionnel.
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        self.processing = {}
+        self.caches = {}
+
+    def endpoint(self, url):
+        key = endpoint_key(url)
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            metrics = EndpointMetrics()
+            self.endpoints[key] = metrics
+        return metrics
+
+    def record_fetch(self, url, latency, wire_bytes, decoded_bytes, not_modified=False):
+        metrics = self.endpoint(url)
+        metrics.requests += 1
+        metrics.latencies.append(latency)
+        metrics.bytes_received += wire_bytes
+        metrics.bytes_decoded += decoded_bytes
+        if not_modified:
+            metrics.not_modified += 1
+
+    def record_error(self, url):
+        self.endpoint(url).errors += 1
+
+    def record_retry(self, url):
+        self.endpoint(url).retries += 1
+
+    def record_decode(self, url, seconds):
+        self.endpoint(url).decode_times.append(seconds)
+
+    def record_process(self, sensor_type, wall_time, loop_time):
+        metrics = self.processing.get(sensor_type)
+        if metrics is None:
+            metrics = ProcessMetrics()
+            self.processing[sensor_type] = metrics
+        metrics.cycles += 1
+        metrics.wall_times.append(wall_time)
+        metrics.loop_times.append(loop_time)
+
+    def record_cache(self, name, hit):
+        stats = self.caches.setdefault(name, {"hits": 0, "misses": 0})
+        stats["hits" if hit else "misses"] += 1
+
+    def cache_stats(self, extra=None):
+        caches = {name: dict(stats) for name, stats in self.caches.items()}
+        caches.update(extra or {})
+        for stats in caches.values():
+            total = stats["hits"] + stats["misses"]
+            stats["hit_ratio"] = round(stats["hits"] / total, 3) if total else None
+        return caches
+
+    def as_dict(self, extra_caches=None):
+        return {
+            "endpoints": {key: metrics.as_dict() for key, metrics in self.endpoints.items()},
+            "processing": {key: metrics.as_dict() for key, metrics in self.processing.items()},
+            "caches": self.cache_stats(extra_caches),
+        }
+
+
+def async_get_metrics(hass):
+    """Retourne les métriques partagées de l'intégration, en les créant si besoin"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    metrics = domain_data.get(DATA_METRICS)
+    if metrics is None:
+        metrics = Metrics()
+        domain_data[DATA_METRICS] = metrics
+    return metrics
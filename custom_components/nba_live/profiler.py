@@ -0,0 +1,289 @@
+import asyncio
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DATA_PROFILER, PROFILE_DIR, _LOGGER
+
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLER = "sampler"
+SAMPLE_INTERVAL = 0.005     # période de l'échantillonneur de piles, en secondes
+INTEGRATION_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _frame_label(code, lineno):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{lineno})"
+
+
+def _collapse(frame):
+    """
+    Pile d'appels au format « replié » des flamegraphs: racine;...;feuille
+
+    Returns:
+        str: la pile, ou None si aucun frame n'appartient à l'intégration
+            (échantillon pris juste après la fin d'une section)
+    """
+    labels = []
+    in_integration = False
+    while frame is not None:
+        code = frame.f_code
+        in_integration = in_integration or code.co_filename.startswith(INTEGRATION_DIR)
+        labels.append(_frame_label(code, code.co_firstlineno))
+        frame = frame.f_back
+    return ";".join(reversed(labels)) if in_integration else None
+
+
+class StackSampler:
+    """
+    Échantillonneur de piles du thread de la boucle d'événements
+
+    Un thread relève la pile courante de la boucle toutes les SAMPLE_INTERVAL
+    secondes pendant les cycles profilés. Coût bien plus faible que cProfile
+    (aucun hook par appel), au prix d'une mesure statistique.
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._running = threading.Event()
+        self._closed = False
+        self._thread = None
+
+    def enable(self):
+        self._running.set()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"{DOMAIN}_sampler", daemon=True)
+            self._thread.start()
+
+    def disable(self):
+        self._running.clear()
+
+    def close(self):
+        self._closed = True
+        self._running.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            self._running.wait()
+            if self._closed:
+                return
+            # Le thread n'obtient le GIL qu'entre deux tranches de la boucle: la section a pu se
+            # terminer entre-temps, _collapse écarte alors la pile (epoll, reste de Home Assistant)
+            frame = sys._current_frames().get(self.thread_id)
+            stack = _collapse(frame) if frame is not None else None
+            del frame
+            if stack is not None:
+                self.stacks[stack] += 1
+                self.samples += 1
+            time.sleep(self.interval)
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            for stack, count in self.stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+
+    def top(self, limit):
+        """Fonctions les plus vues en feuille de pile (temps propre), avec leur part inclusive"""
+        own, inclusive = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for label in set(frames):
+                inclusive[label] += count
+        total = self.samples or 1
+        return [
+            {
+                "function": label,
+                "samples": count,
+                "self_pct": round(100 * count / total, 1),
+                "total_pct": round(100 * inclusive[label] / total, 1),
+            }
+            for label, count in own.most_common(limit)
+        ]
+
+
+def _cprofile_top(profile, limit):
+    """Fonctions triées par temps propre (tottime), comme `pstats ... sort_stats("tottime")`"""
+    stats = pstats.Stats(profile).stats
+    ordered = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [
+        {
+            "function": f"{name} ({os.path.basename(filename)}:{lineno})",
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 2),
+            "cumtime_ms": round(cumtime * 1000, 2),
+        }
+        for (filename, lineno, name), (_, calls, tottime, cumtime, _) in ordered[:limit]
+    ]
+
+
+class ProfileSession:
+    """
+    Profilage des N prochains cycles de rafraîchissement des coordinators
+
+    Le profileur n'est actif que dans les sections CPU de l'intégration:
+    décodage JSON des payloads, _process_data des capteurs, décodage et parsing
+    des box scores. Les attentes réseau et l'attente des box scores en sont
+    exclues, pour que le profil ne mesure ni l'epoll de la boucle ni le reste
+    de Home Assistant. Les sections concurrentes partagent le même profileur,
+    actif tant qu'au moins une est ouverte; seuls les cycles qui ont diffusé
+    un nouveau payload comptent.
+    """
+
+    def __init__(self, hass: HomeAssistant, cycles, mode=MODE_CPROFILE, top=20):
+        self.hass = hass
+        self.cycles = cycles
+        self.mode = mode
+        self.top = top
+        self.completed = 0
+        self.profiled_time = 0.0
+        self.done = hass.loop.create_future()
+        self._active = 0
+        self._closed = False
+        self._section_start = None
+        if mode == MODE_SAMPLER:
+            self._profiler = StackSampler(threading.get_ident())
+        else:
+            self._profiler = cProfile.Profile()
+
+    def start_section(self):
+        """
+        Entrée dans une section CPU (appelé aussi depuis sensori/, sans import de HA)
+
+        Returns:
+            bool: False si la session est terminée (la section n'est pas profilée)
+        """
+        if self._closed:
+            return False
+        if self._active == 0:
+            try:
+                self._profiler.enable()
+            except ValueError as e:
+                # Un autre profileur (intégration profiler de HA...) occupe déjà le hook
+                self._closed = True
+                if not self.done.done():
+                    self.done.set_exception(HomeAssistantError(f"Profilage impossible: {e}"))
+                return False
+            self._section_start = time.perf_counter()
+        self._active += 1
+        return True
+
+    def end_section(self):
+        if self._closed:
+            return
+        self._active -= 1
+        if self._active == 0:
+            self._profiler.disable()
+            self.profiled_time += time.perf_counter() - self._section_start
+            self._check_done()
+
+    @callback
+    def cycle_done(self):
+        """Un coordinator a diffusé un nouveau payload à tous ses abonnés"""
+        if self._closed:
+            return
+        self.completed += 1
+        self._check_done()
+
+    def _check_done(self):
+        if self._active == 0 and self.completed >= self.cycles and not self.done.done():
+            self.done.set_result(None)
+
+    def _stop(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._active:
+            self._profiler.disable()
+            self.profiled_time += time.perf_counter() - self._section_start
+            self._active = 0
+
+    def _write(self):
+        """Écrit le profil sous <config>/nba_live_profiles et calcule le top (exécuté hors boucle)"""
+        directory = self.hass.config.path(PROFILE_DIR)
+        os.makedirs(directory, exist_ok=True)
+        stamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+        if self.mode == MODE_SAMPLER:
+            self._profiler.close()
+            path = os.path.join(directory, f"profile_{stamp}.collapsed")
+            self._profiler.write(path)
+        else:
+            path = os.path.join(directory, f"profile_{stamp}.pstats")
+            self._profiler.dump_stats(path)
+        top = self._profiler.top(self.top) if self.mode == MODE_SAMPLER else _cprofile_top(self._profiler, self.top)
+        return path, top
+
+    async def async_finish(self):
+        self._stop()
+        if not self.profiled_time:
+            # Aucun cycle n'a démarré pendant le délai: pas de profil à écrire
+            if self.mode == MODE_SAMPLER:
+                self._profiler.close()
+            return {"file": None, "mode": self.mode, "cycles": 0, "profiled_seconds": 0, "top": []}
+        path, top = await self.hass.async_add_executor_job(self._write)
+        _LOGGER.info(f"Profil de {self.completed} cycle(s) écrit dans {path}")
+        return {
+            "file": path,
+            "mode": self.mode,
+            "cycles": self.completed,
+            "profiled_seconds": round(self.profiled_time, 3),
+            "top": top,
+        }
+
+
+@callback
+def async_get_profile_session(hass: HomeAssistant):
+    """Session de profilage en cours, ou None"""
+    return hass.data.get(DOMAIN, {}).get(DATA_PROFILER)
+
+
+@contextmanager
+def profiled_section(hass: HomeAssistant):
+    """
+    Section CPU profilée si une session est en cours
+
+    Yields:
+        ProfileSession: la session (à transmettre aux sections imbriquées), ou None
+    """
+    session = async_get_profile_session(hass)
+    if session is None or not session.start_section():
+        yield None
+        return
+    try:
+        yield session
+    finally:
+        session.end_section()
+
+
+async def async_run_profile(hass: HomeAssistant, cycles, mode, top, timeout):
+    """
+    Profile les `cycles` prochains cycles de rafraîchissement et retourne le rapport
+
+    Si le délai expire avant, le rapport porte sur les cycles déjà profilés.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get(DATA_PROFILER) is not None:
+        raise HomeAssistantError("Un profilage est déjà en cours")
+
+    session = ProfileSession(hass, cycles, mode, top)
+    domain_data[DATA_PROFILER] = session
+    try:
+        await asyncio.wait_for(asyncio.shield(session.done), timeout)
+    except asyncio.TimeoutError:
+        _LOGGER.warning(f"Profilage: {session.completed}/{cycles} cycle(s) après {timeout}s, rapport partiel")
+    finally:
+        domain_data.pop(DATA_PROFILER, None)
+    return await session.async_finish()
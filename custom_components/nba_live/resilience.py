@@ -0,0 +1,192 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+
+from .const import _LOGGER
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Priorités du budget de requêtes (plus petit = servi en premier)
+PRIORITY_LIVE = 0          # scoreboards et appels interactifs du config flow
+PRIORITY_STANDINGS = 1     # classements
+PRIORITY_BOXSCORE = 2      # box scores (summary)
+PRIORITY_NAMES = {PRIORITY_LIVE: "live", PRIORITY_STANDINGS: "standings", PRIORITY_BOXSCORE: "boxscore"}
+
+# Budget global de l'intégration, toutes entrées confondues
+BUDGET_RATE = 1.0          # jetons par seconde (60 requêtes/minute en régime établi)
+BUDGET_CAPACITY = 20       # rafale maximale
+
+
+class RetryPolicy:
+    """
+    Politique de retry partagée: backoff exponentiel avec full jitter
+
+    Le délai avant la tentative n+1 est tiré uniformément dans
+    [0, min(max_delay, base_delay * 2**n)], ce qui désynchronise les retries.
+    """
+
+    def __init__(self, attempts=3, base_delay=1.0, max_delay=15.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur par hôte
+
+    Après `failure_threshold` échecs consécutifs le circuit s'ouvre: les requêtes
+    échouent immédiatement pendant `reset_timeout` secondes. Le circuit passe
+    ensuite en half_open: une seule requête d'essai passe et décide de sa
+    fermeture, les autres restent refusées jusqu'à son résultat. Un essai sans
+    résultat (requête annulée) est remplacé après `reset_timeout` secondes.
+    """
+
+    def __init__(self, host, failure_threshold=5, reset_timeout=60.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self._opened_at = None
+        self._probe_started = None
+
+    def allow_request(self):
+        now = time.monotonic()
+        if self.state == STATE_OPEN:
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            self.state = STATE_HALF_OPEN
+            _LOGGER.info(f"Circuit {self.host}: half_open, tentative de reprise")
+        elif self.state == STATE_HALF_OPEN:
+            # Essai déjà en vol: les autres appelants attendent son résultat
+            if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                return False
+        else:
+            return True
+        self._probe_started = now
+        return True
+
+    def record_success(self):
+        if self.state != STATE_CLOSED:
+            _LOGGER.info(f"Circuit {self.host}: fermé")
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = None
+        self._probe_started = None
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                self.opened_count += 1
+                _LOGGER.warning(
+                    f"Circuit {self.host}: ouvert après {self.consecutive_failures} échecs, "
+                    f"nouvel essai dans {self.reset_timeout:.0f}s"
+                )
+            self.state = STATE_OPEN
+            self._opened_at = time.monotonic()
+            self._probe_started = None
+
+    def remaining_open_time(self):
+        """Secondes restantes avant le passage en half_open (0 si le circuit n'est pas ouvert)"""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def as_dict(self):
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_count": self.opened_count,
+            "retry_in": round(self.remaining_open_time(), 1),
+        }
+
+
+class RequestBudget:
+    """
+    Token bucket global partagé par toutes les entrées de l'intégration
+
+    Quand le budget est épuisé les requêtes attendent leur tour au lieu
+    d'échouer; les jetons libérés vont d'abord à la priorité la plus haute
+    (live > standings > boxscore), puis dans l'ordre d'arrivée.
+    """
+
+    def __init__(self, rate=BUDGET_RATE, capacity=BUDGET_CAPACITY):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._dispatch_handle = None
+        self.granted = {name: 0 for name in PRIORITY_NAMES.values()}
+        self.queued = {name: 0 for name in PRIORITY_NAMES.values()}
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    async def async_acquire(self, priority=PRIORITY_LIVE):
+        """Attend un jeton du budget (sans jamais échouer)"""
+        name = PRIORITY_NAMES.get(priority, str(priority))
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self.granted[name] = self.granted.get(name, 0) + 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.queued[name] = self.queued.get(name, 0) + 1
+        self._schedule_dispatch(loop)
+
+        started = time.monotonic()
+        await future
+        waited = time.monotonic() - started
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.granted[name] = self.granted.get(name, 0) + 1
+
+    def _schedule_dispatch(self, loop):
+        if self._dispatch_handle is not None:
+            return
+        delay = max(0.0, (1 - self._tokens) / self.rate)
+        self._dispatch_handle = loop.call_later(delay, self._dispatch, loop)
+
+    def _dispatch(self, loop):
+        self._dispatch_handle = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():  # requête annulée entre-temps
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        if self._waiters:
+            self._schedule_dispatch(loop)
+
+    def as_dict(self):
+        self._refill()
+        return {
+            "tokens_available": round(self._tokens, 1),
+            "capacity": self.capacity,
+            "rate_per_minute": round(self.rate * 60),
+            "queue_depth": len(self._waiters),
+            "granted": dict(self.granted),
+            "queued": dict(self.queued),
+            "total_wait_seconds": round(self.total_wait, 2),
+            "max_wait_seconds": round(self.max_wait, 2),
+        }
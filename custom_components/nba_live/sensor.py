@@ -1,17 +1,39 @@
 import asyncio
-import aiohttp
 from datetime import datetime, timedelta
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity, EntityCategory
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change, async_track_time_interval
 import random
-from .const import DOMAIN, _LOGGER
-
-# Intervalles de mise à jour
-SCAN_INTERVAL_LIVE = timedelta(seconds=10)     # Match en cours
-SCAN_INTERVAL_IDLE = timedelta(minutes=10)     # Pas de match en cours
-SCAN_INTERVAL = SCAN_INTERVAL_IDLE  # Par défaut
+import time
+from .client import async_get_client
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    CONF_BOXSCORE_CONCURRENCY,
+    CONF_BOXSCORE_DEADLINE,
+    CONF_PERFORMANCE_SENSOR,
+    CONF_SLIM_ATTRIBUTES,
+    DATA_LIVE_GAMES,
+    DATA_SENSORS,
+    DEFAULT_BOXSCORE_CONCURRENCY,
+    DEFAULT_BOXSCORE_DEADLINE,
+    DEFAULT_PERFORMANCE_SENSOR,
+    DEFAULT_SLIM_ATTRIBUTES,
+    DIAGNOSTIC_UPDATE_INTERVAL,
+    ESPN_BASKETBALL_URL,
+    ESPN_SITE_WEB_API,
+    ESPN_STANDINGS_URL,
+    LIVE_GAME_UNIQUE_ID_PREFIX,
+    SCAN_INTERVAL_LIVE,
+    SCAN_INTERVAL_IDLE,
+)
+from .coordinator import async_get_coordinator
+from .events import async_get_event_tracker
+from .metrics import async_get_metrics
+from .profiler import profiled_section
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     try:
@@ -33,7 +55,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         
         
         base_scan_interval = timedelta(minutes=entry.options.get("scan_interval", 3))
+        sensor_options = {
+            "boxscore_concurrency": entry.options.get(CONF_BOXSCORE_CONCURRENCY, DEFAULT_BOXSCORE_CONCURRENCY),
+            "boxscore_deadline": entry.options.get(CONF_BOXSCORE_DEADLINE, DEFAULT_BOXSCORE_DEADLINE),
+            "slim_attributes": entry.options.get(CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES),
+        }
+        sensor_class = CalcioLiveSlimSensor if sensor_options["slim_attributes"] else CalcioLiveSensor
         sensors = []
+        # Une entité légère par match en cours, créée/retirée au fil du scoreboard
+        live_games = LiveGameManager(hass, entry, async_add_entities)
 
         if DOMAIN not in hass.data:
             hass.data[DOMAIN] = {}
@@ -45,52 +75,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             competition_name = competition_code.replace(" ", "_").replace(".", "_").lower()
 
             sensors += [
-                CalcioLiveSensor(
+                sensor_class(
                     hass, f"calciolive_next_{competition_name}_{team_name_normalized}", competition_code, "team_match",
                     base_scan_interval + timedelta(seconds=random.randint(0, 30)), team_name=team_name,
-                    config_entry_id=entry.entry_id, start_date=start_date, end_date=end_date, team_id=team_id
+                    config_entry_id=entry.entry_id, start_date=start_date, end_date=end_date, team_id=team_id, **sensor_options
                 ),
-                CalcioLiveSensor(
+                sensor_class(
                     hass, f"calciolive_all_{competition_name}_{team_name_normalized}", competition_code, "team_matches",
                     base_scan_interval + timedelta(seconds=random.randint(0, 30)), team_name=team_name,
-                    config_entry_id=entry.entry_id, start_date=start_date, end_date=end_date, team_id=team_id
+                    config_entry_id=entry.entry_id, start_date=start_date, end_date=end_date, team_id=team_id, live_games=live_games, **sensor_options
                 ),
-                CalcioLiveSensor(
+                sensor_class(
                     hass, f"calciolive_all_mixed_{team_name_normalized}", competition_code, "team_matches_mixed",
                     base_scan_interval + timedelta(seconds=random.randint(0, 30)), team_name=team_name,
-                    config_entry_id=entry.entry_id, start_date=start_date, end_date=end_date, team_id=team_id
+                    config_entry_id=entry.entry_id, start_date=start_date, end_date=end_date, team_id=team_id, **sensor_options
                 )
             ]
         elif competition_code:
             if competition_code == "99999":  # Se il competition_code è fittizio, crea il sensore per tutte le partite
                 sensors += [
-                    CalcioLiveSensor(
+                    sensor_class(
                         hass, "calciolive_all_today", competition_code, "all_matches_today",
                         base_scan_interval + timedelta(seconds=random.randint(0, 30)), config_entry_id=entry.entry_id,
-                        start_date=start_date, end_date=end_date, team_id=team_id
+                        start_date=start_date, end_date=end_date, team_id=team_id, live_games=live_games, **sensor_options
                     )
                 ]
             else:
                 competition_name = competition_name.replace(" ", "_").replace(".", "_").lower()
 
                 sensors += [
-                    CalcioLiveSensor(
+                    sensor_class(
                         hass, "calciolive_classifica_nba_east", competition_code, "standings",
                         SCAN_INTERVAL_IDLE, config_entry_id=entry.entry_id,
-                        start_date=start_date, end_date=end_date, team_id=team_id, conference="East"
+                        start_date=start_date, end_date=end_date, team_id=team_id, conference="East", **sensor_options
                     ),
-                    CalcioLiveSensor(
+                    sensor_class(
                         hass, "calciolive_classifica_nba_west", competition_code, "standings",
                         SCAN_INTERVAL_IDLE, config_entry_id=entry.entry_id,
-                        start_date=start_date, end_date=end_date, team_id=team_id, conference="West"
+                        start_date=start_date, end_date=end_date, team_id=team_id, conference="West", **sensor_options
                     ),
-                    CalcioLiveSensor(
+                    sensor_class(
                         hass, f"calciolive_all_nba", competition_code, "match_day",
                         base_scan_interval + timedelta(seconds=random.randint(0, 30)), config_entry_id=entry.entry_id,
-                        start_date=start_date, end_date=end_date, team_id=team_id
+                        start_date=start_date, end_date=end_date, team_id=team_id, live_games=live_games, **sensor_options
                     )
                 ]
 
+        if sensors:
+            # Compteurs de requêtes, cadence et état réseau, hors des capteurs de matchs
+            sensors.append(CalcioLiveDiagnosticSensor(hass, entry, list(sensors)))
+            if entry.options.get(CONF_PERFORMANCE_SENSOR, DEFAULT_PERFORMANCE_SENSOR):
+                sensors.append(CalcioLivePerformanceSensor(hass, entry))
+
         async_add_entities(sensors, True)
 
     except Exception as e:
@@ -98,10 +134,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 
 class CalcioLiveSensor(Entity):
-    _cache = {}
 
     def __init__(self, hass, name, code, sensor_type=None, scan_interval=timedelta(seconds=5),
-                 team_name=None, config_entry_id=None, start_date=None, end_date=None, team_id=None, conference=None):
+                 team_name=None, config_entry_id=None, start_date=None, end_date=None, team_id=None, conference=None,
+                 boxscore_concurrency=DEFAULT_BOXSCORE_CONCURRENCY, boxscore_deadline=DEFAULT_BOXSCORE_DEADLINE,
+                 slim_attributes=DEFAULT_SLIM_ATTRIBUTES, live_games=None):
         self.hass = hass
         self.interval = timedelta(seconds=10)
         self._name = name
@@ -114,6 +151,10 @@ class CalcioLiveSensor(Entity):
         self._config_entry_id = config_entry_id
         self._team_name = team_name
         self._conference = conference
+        self._boxscore_concurrency = boxscore_concurrency
+        self._boxscore_deadline = boxscore_deadline
+        self._slim_attributes = slim_attributes
+        self._live_games = live_games
         # Usa le date fornite dal config_entry
         self._start_date = start_date  # (start_date o valore di default)
         self._end_date = end_date      # (end_date o valore di default)
@@ -122,16 +163,20 @@ class CalcioLiveSensor(Entity):
         self._start_date = datetime.strptime(self._start_date, "%Y-%m-%d")
         self._end_date = datetime.strptime(self._end_date, "%Y-%m-%d")
         
-        self._request_count = 0
-        self._last_request_time = datetime.now()
-        
         # Tracking for live matches
         self._has_live_match = False
-        self._last_update_time = None
-
-        self.base_url = "https://site.web.api.espn.com/apis/v2/sports/soccer"
-        self.base_url_2 = "https://site.api.espn.com/apis/site/v2/sports/basketball"
-        self.base_url_3 = "https://site.web.api.espn.com/apis/site/v2/sports/soccer"
+        self._unsub_day_change = None
+
+        # Coordinator partagé par URL (voir coordinator.py)
+        self._coordinator = None
+        self._remove_listener = None
+        self._last_payload = None
+        self._payload_lock = asyncio.Lock()
+        self._written_hash = None
+
+        self.base_url = f"{ESPN_SITE_WEB_API}/apis/v2/sports/soccer"
+        self.base_url_2 = ESPN_BASKETBALL_URL
+        self.base_url_3 = f"{ESPN_SITE_WEB_API}/apis/site/v2/sports/soccer"
         
         
     @property
@@ -144,23 +189,63 @@ class CalcioLiveSensor(Entity):
 
     @property
     def extra_state_attributes(self):
+        # Compteurs et état réseau: voir CalcioLiveDiagnosticSensor
         return {
-            **self._attributes,
-            "request_count": self._request_count,
-            "last_request_time": self._last_request_time,
+            **self._export_attributes(),
             "start_date": self._start_date.strftime("%Y-%m-%d"),
             "end_date": self._end_date.strftime("%Y-%m-%d"),
             "has_live_match": self._has_live_match,
-            "update_interval": self._get_update_interval_seconds(),
         }
 
-    def _get_update_interval_seconds(self):
-        """Retourne l'intervalle de mise à jour en secondes"""
-        if self._has_live_match:
-            return 10  # 10 secondes si match live
-        else:
-            return 600  # 10 minutes sinon
-    
+    def _content_hash(self):
+        """
+        Empreinte du contenu visible du capteur: état, matchs (empreinte ESPN +
+        box score) et autres attributs. Inchangée = pas d'écriture d'état.
+        """
+        matches = self._attributes.get("matches") or ()
+        others = {k: v for k, v in self._attributes.items() if k != "matches"}
+        return hash((
+            self._state,
+            self._has_live_match,
+            tuple(match.content_key() for match in matches),
+            repr(others),
+        ))
+
+    def _async_write_if_changed(self):
+        """Écrit l'état seulement si le contenu a changé depuis la dernière écriture"""
+        if self.entity_id is None:
+            return
+        content_hash = self._content_hash()
+        if content_hash == self._written_hash:
+            _LOGGER.debug(f"{self._name}: contenu inchangé, pas d'écriture d'état")
+            return
+        self._written_hash = content_hash
+        self.async_write_ha_state()
+
+    def _export_attributes(self, full=False):
+        """
+        Matérialise les Match partagés en dictionnaires (dates locales) au moment de l'export
+
+        Args:
+            full (bool): détail complet même en mode slim (service get_matches)
+        """
+        from .sensori.scoreboard import local_timezone
+
+        matches = self._attributes.get("matches")
+        if not matches:
+            return self._attributes
+        tz = local_timezone(self.hass)
+        if self._slim_attributes and not full:
+            return {**self._attributes, "matches": [match.as_summary(tz) for match in matches]}
+        return {**self._attributes, "matches": [match.as_dict(tz) for match in matches]}
+
+    def get_matches(self, match_id=None):
+        """Détail complet des matchs du capteur (réponse du service get_matches)"""
+        matches = self._export_attributes(full=True).get("matches", [])
+        if match_id is not None:
+            matches = [m for m in matches if m.get("match_id") == match_id]
+        return matches
+
     def _check_for_live_matches(self, matches_data):
         """
         Vérifie s'il y a des matchs en cours (state = 'in')
@@ -175,8 +260,8 @@ class CalcioLiveSensor(Entity):
             return False
         
         for match in matches_data:
-            match_state = match.get("match_state", "").lower()
-            status = match.get("status", "").lower()
+            match_state = match.state.lower()
+            status = match.status.lower()
             
             # Vérifier si le match est en cours
             if match_state == "in" or "live" in status or "in progress" in status:
@@ -186,17 +271,34 @@ class CalcioLiveSensor(Entity):
 
     @property
     def should_poll(self):
-        return True
+        # Les réveils sont planifiés par le coordinator (tipoff, live, fin de journée)
+        return False
     
     async def async_added_to_hass(self):
         """Appelé quand l'entité est ajoutée à Home Assistant"""
         await super().async_added_to_hass()
-        # Forcer la première mise à jour immédiate
-        self._last_update_time = None
+        self.hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SENSORS, {})[self.entity_id] = self
+        # L'URL du scoreboard dépend de la date: on se réabonne après minuit
+        self._unsub_day_change = async_track_time_change(
+            self.hass, self._async_handle_day_change, hour=0, minute=0, second=30
+        )
+        if self._coordinator is None:
+            await self.async_update()
 
     async def async_will_remove_from_hass(self):
         """Appelé avant que l'entité soit retirée"""
         await super().async_will_remove_from_hass()
+        self.hass.data.get(DOMAIN, {}).get(DATA_SENSORS, {}).pop(self.entity_id, None)
+        if self._unsub_day_change is not None:
+            self._unsub_day_change()
+            self._unsub_day_change = None
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+    async def _async_handle_day_change(self, _now):
+        await self.async_update()
+        self._async_write_if_changed()
 
 
     @property
@@ -208,75 +310,63 @@ class CalcioLiveSensor(Entity):
         return self._config_entry_id
 
     async def async_update(self):
-        """Mise à jour avec intervalle dynamique"""
-        now = datetime.now()
-        
-        # Calculer l'intervalle basé sur l'état actuel
-        update_interval = SCAN_INTERVAL_LIVE if self._has_live_match else SCAN_INTERVAL_IDLE
-        
-        # Vérifier si on doit faire une mise à jour
-        if self._last_update_time is not None:
-            time_since_update = now - self._last_update_time
-            if time_since_update < update_interval:
-                _LOGGER.debug(
-                    f"Skipping update for {self._name} - "
-                    f"Last update: {time_since_update.total_seconds():.0f}s ago, "
-                    f"Interval: {update_interval.total_seconds():.0f}s, "
-                    f"Live match: {self._has_live_match}"
-                )
-                return
-        
-        _LOGGER.info(
-            f"Starting update for {self._name} - "
-            f"Interval: {update_interval.total_seconds():.0f}s, "
-            f"Live match: {self._has_live_match}"
-        )
-
-        cache_key = f"{self._sensor_type}_{self._code}_{self._team_name}"
-        if cache_key in CalcioLiveSensor._cache and (datetime.now() - CalcioLiveSensor._cache[cache_key]["time"]).seconds < 10:
-            await self._process_data(CalcioLiveSensor._cache[cache_key]["data"])
-            _LOGGER.info(f"Using cached data for {self._name}")
-            self._last_update_time = now
-            return
-
+        """Abonnement au coordinator de l'URL et premier chargement"""
         url = await self._build_url()
         _LOGGER.debug(f"url asked : {url}")
         if url is None:
-            self._last_update_time = now
             return
 
-        retries = 0
-        while retries < 3:
-            try:
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            _LOGGER.debug(f"Data received for {self._name}: {data}")
-                            CalcioLiveSensor._cache[cache_key] = {"data": data, "time": datetime.now()}
-                            await self._process_data(data)
-                            self._last_update_time = now
-                            _LOGGER.info(f"Finished update for {self._name}")
-                            break
-                        else:
-                            await asyncio.sleep(5)
-                            retries += 1
-            except aiohttp.ClientError as error:
-                await asyncio.sleep(5)
-                retries += 1
-            except asyncio.TimeoutError:
-                await asyncio.sleep(5)
-                retries += 1
-        
-        # Mettre à jour le timestamp même en cas d'erreur
-        if self._last_update_time is None:
-            self._last_update_time = now
+        self._async_subscribe(url)
+        refreshed = await self._coordinator.async_refresh(max_age=SCAN_INTERVAL_LIVE)
+
+        # Payload déjà téléchargé par un autre capteur abonné à la même URL
+        if not refreshed and self._coordinator.data is not None:
+            await self._async_handle_payload(self._coordinator.data)
+
+        _LOGGER.info(f"Finished update for {self._name}")
+
+    def _async_subscribe(self, url):
+        """Abonne le capteur au coordinator de l'URL (change chaque jour pour le scoreboard)"""
+        if self._coordinator is not None and self._coordinator.url == url:
+            return
+
+        if self._remove_listener is not None:
+            self._remove_listener()
+
+        self._coordinator = async_get_coordinator(self.hass, url)
+        self._remove_listener = self._coordinator.async_add_listener(self._async_coordinator_update)
+
+    async def _async_coordinator_update(self, data):
+        """Reçoit un nouveau payload du coordinator partagé"""
+        await self._async_handle_payload(data)
+        self._async_write_if_changed()
+
+    async def _async_handle_payload(self, data):
+        # Un traitement à la fois: un payload plus ancien ne doit pas finir après le suivant
+        async with self._payload_lock:
+            if data is self._last_payload:
+                return
+            if self._coordinator is not None and data is not self._coordinator.data:
+                _LOGGER.debug(f"{self._name}: payload dépassé par un rafraîchissement plus récent, ignoré")
+                return
+            self._last_payload = data
+            await self._async_process_payload(data)
+
+    async def _async_process_payload(self, data):
+        # Durée du cycle et temps CPU du thread de la boucle (métriques de diagnostic),
+        # hors attente des box scores où la boucle exécute le reste de Home Assistant
+        from .sensori.scoreboard import excluded_waits
+
+        start, loop_start = time.perf_counter(), time.thread_time()
+        # Service nba_live.profile: section profilée, suspendue pendant l'attente des box scores
+        with profiled_section(self.hass) as profile, excluded_waits(profile) as waits:
+            await self._process_data(data)
+        async_get_metrics(self.hass).record_process(
+            self._sensor_type, time.perf_counter() - start, time.thread_time() - loop_start - waits.thread_time
+        )
 
     
     async def _build_url(self):
-        base_url    = "https://site.web.api.espn.com/apis/v2/sports/soccer"
-        base_url_2  = "https://site.api.espn.com/apis/site/v2/sports/basketball"  #"https://site.api.espn.com/apis/site/v2/sports/soccer"
-        base_url_3  = "https://site.web.api.espn.com/apis/site/v2/sports/soccer"
         season_data = ""
         season_start = ""
         season_end = ""
@@ -300,7 +390,7 @@ class CalcioLiveSensor(Entity):
         season_start = season_start[:10].replace("-", "")
         season_end = season_end[:10].replace("-", "")
     
-        standings_url = "https://site.web.api.espn.com/apis/v2/sports/basketball/nba/standings?"
+        standings_url = ESPN_STANDINGS_URL
         scoreboard_url = f"{self.base_url_2}/nba/scoreboard?limit=25&dates={start_date}-{end_date}"
         all_matches_today_url = f"{self.base_url_2}/all/scoreboard"
         team_url_schedule_mixed = f"{self.base_url_3}/all/teams/{self._team_id}/schedule?fixture=true"
@@ -326,32 +416,37 @@ class CalcioLiveSensor(Entity):
 
         calendar_url = f"{self.base_url_2}/nba/scoreboard"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(calendar_url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    # Estrai le date di inizio e fine dal calendario
-                    calendar_start_date = data.get("calendarStartDate", "2024-07-01T04:00Z")
-                    calendar_end_date = data.get("calendarEndDate", "2025-07-01T03:59Z")
-                    return calendar_start_date, calendar_end_date
+            data = await async_get_client(self.hass).async_get_json(calendar_url)
+            # Estrai le date di inizio e fine dal calendario
+            calendar_start_date = data.get("calendarStartDate", "2024-07-01T04:00Z")
+            calendar_end_date = data.get("calendarEndDate", "2025-07-01T03:59Z")
+            return calendar_start_date, calendar_end_date
         except Exception as e:
             _LOGGER.error(f"Erreur lors de la récupération du calendrier: {e}")
             return None, None
 
 
     async def _process_data(self, data):
-        from .sensori.scoreboard import process_match_data
+        from .sensori.scoreboard import process_match_data, pending_player_stats, build_event_index
 
         if self._sensor_type == "standings":
-            from .sensori.classifica import classifica_data
-            processed_data = classifica_data(data, self._conference)
+            from .sensori.classifica import classifica_data, build_standings_table
+            # Est et Ouest partagent l'URL: le classement est calculé une fois par payload
+            table = self._coordinator.get_derived(data, "standings_table", build_standings_table)
+            processed_data = classifica_data(data, self._conference, table=table)
             conf_label = self._conference if self._conference else "NBA"
             self._state = f"NBA Standings {conf_label}"
             self._attributes = processed_data
             self._has_live_match = False
 
         elif self._sensor_type == "match_day":
-            match_data = await process_match_data(data, self.hass, start_date=self._start_date.strftime("%Y-%m-%d"), end_date=self._end_date.strftime("%Y-%m-%d"))
+            match_data = await process_match_data(
+                data, self.hass, start_date=self._start_date.strftime("%Y-%m-%d"), end_date=self._end_date.strftime("%Y-%m-%d"),
+                stats_concurrency=self._boxscore_concurrency, stats_deadline=self._boxscore_deadline
+            )
+            if not match_data:
+                self._async_processing_failed()
+                return
             matches = match_data.get("matches", [])
             
             # Détecter si un match est live
@@ -363,26 +458,34 @@ class CalcioLiveSensor(Entity):
                 "matches": matches
             }
             
-            _LOGGER.debug(f"{self._name}: Found {len(matches)} matches, {sum(1 for m in matches if m.get('match_state') == 'in')} live")
+            _LOGGER.debug(f"{self._name}: Found {len(matches)} matches, {sum(1 for m in matches if m.state == 'in')} live")
         
         elif self._sensor_type in ["team_matches", "team_match", "team_matches_mixed", "all_matches_today"]:
             async def get_team_match_data(next_match_only=False):
+                event_index = None
+                if self._coordinator is not None and (self._team_id or self._team_name):
+                    event_index = self._coordinator.get_derived(data, "event_index", build_event_index)
                 return await process_match_data(
                     data, self.hass, team_name=self._team_name, next_match_only=next_match_only,
-                    start_date=self._start_date.strftime("%Y-%m-%d"), end_date=self._end_date.strftime("%Y-%m-%d")
+                    start_date=self._start_date.strftime("%Y-%m-%d"), end_date=self._end_date.strftime("%Y-%m-%d"),
+                    stats_concurrency=self._boxscore_concurrency, stats_deadline=self._boxscore_deadline,
+                    team_id=self._team_id, event_index=event_index
                 )
 
             if self._sensor_type in ["team_matches", "team_matches_mixed", "all_matches_today"]:
                 match_data = await get_team_match_data()
+                if not match_data:
+                    self._async_processing_failed()
+                    return
                 matches = match_data.get("matches", [])
                 
                 # Détecter si un match est live
                 self._has_live_match = self._check_for_live_matches(matches)
                 
                 if matches:
-                    live_matches = [m for m in matches if m.get("match_state") == "in"]
+                    live_matches = [m for m in matches if m.state == "in"]
                     if live_matches:
-                        self._state = f"{live_matches[0]['home_score']} - {live_matches[0]['away_score']} ({live_matches[0]['clock']})"
+                        self._state = f"{live_matches[0].home.score} - {live_matches[0].away.score} ({live_matches[0].clock})"
                     else:
                         self._state = f"{len(matches)} partite per {match_data.get('team_name', 'N/A')}"
                 else:
@@ -399,21 +502,326 @@ class CalcioLiveSensor(Entity):
 
             elif self._sensor_type == "team_match":
                 team_match = await get_team_match_data(next_match_only=True)
+                if not team_match:
+                    self._async_processing_failed()
+                    return
                 matches = team_match.get("matches", [])
                 
                 # Détecter si un match est live
                 self._has_live_match = self._check_for_live_matches(matches)
                 
                 if matches:
-                    live_matches = [m for m in matches if m.get("match_state") == "in"]
+                    live_matches = [m for m in matches if m.state == "in"]
                     if live_matches:
                         next_match = live_matches[0]
-                        self._state = f"{next_match['home_score']} - {next_match['away_score']} ({next_match['clock']})"
+                        self._state = f"{next_match.home.score} - {next_match.away.score} ({next_match.clock})"
                     else:
                         next_match = matches[0]
-                        self._state = f"Prochain match: {next_match.get('home_team', 'N/A')} vs {next_match.get('away_team', 'N/A')}"
+                        self._state = f"Prochain match: {next_match.home.team} vs {next_match.away.team}"
                     self._attributes = team_match
                 else:
                     self._state = "Aucun match disponible"
                     self._attributes = team_match
 
+        # Transitions par match_id (tipoff, panier, fin de quart-temps, fin de match) sur le bus
+        matches = self._attributes.get("matches") if isinstance(self._attributes, dict) else None
+        if matches:
+            async_get_event_tracker(self.hass).async_process(matches)
+
+        # Capteur agrégé de l'entrée: tenir à jour les entités des matchs en cours
+        if self._live_games is not None:
+            self._live_games.async_update_matches(self._attributes.get("matches") or [])
+
+        # Box scores hors délai pour les matchs de ce capteur: forcer un traitement complet
+        # au prochain cycle (sinon un scoreboard inchangé court-circuiterait _process_data)
+        if self._coordinator is not None and matches:
+            pending = pending_player_stats()
+            if pending and any(match.match_id in pending for match in matches):
+                self._coordinator.async_invalidate()
+
+
+    @callback
+    def _async_processing_failed(self):
+        """
+        process_match_data a échoué (dictionnaire vide): l'état, les attributs et les
+        entités live du dernier traitement réussi sont conservés, et le prochain
+        rafraîchissement est un traitement complet même si le scoreboard n'a pas changé
+        """
+        _LOGGER.debug(f"{self._name}: traitement du payload en échec, dernier état conservé")
+        if self._coordinator is not None:
+            self._coordinator.async_invalidate()
+
+
+class CalcioLiveSlimSensor(CalcioLiveSensor):
+    """
+    Capteur en mode attributs allégés (option slim_attributes): les listes
+    volumineuses restent dans l'état courant mais ne sont pas écrites dans le
+    recorder. Classe distincte car Home Assistant lit _unrecorded_attributes
+    au niveau de la classe.
+    """
+
+    _unrecorded_attributes = frozenset({"matches", "standings", "standings_groups"})
+
+
+class CalcioLiveThrottledSensor(Entity):
+    """
+    Capteur non interrogé par Home Assistant, écrit toutes les DIAGNOSTIC_UPDATE_INTERVAL
+
+    Ses valeurs changent à chaque requête: un poll toutes les 30 s (défaut de HA)
+    écrirait une ligne dans le recorder à chaque fois.
+    """
+
+    _unsub_interval = None
+
+    @property
+    def should_poll(self):
+        return False
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self._unsub_interval = async_track_time_interval(
+            self.hass, self._async_handle_interval, DIAGNOSTIC_UPDATE_INTERVAL
+        )
+
+    async def async_will_remove_from_hass(self):
+        await super().async_will_remove_from_hass()
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+
+    @callback
+    def _async_handle_interval(self, _now):
+        self.async_write_ha_state()
+
+
+class CalcioLiveDiagnosticSensor(CalcioLiveThrottledSensor):
+    """
+    Capteur de diagnostic d'une entrée: requêtes et cadence de ses coordinators.
+    Ces valeurs changent à chaque poll, elles sont donc tenues à l'écart des
+    capteurs de matchs. Les statistiques du client HTTP partagé (octets reçus,
+    disjoncteurs, budget de requêtes) sont communes à toutes les entrées: elles
+    figurent une seule fois, dans le téléchargement des diagnostics.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _unrecorded_attributes = frozenset({"sensors"})
+
+    def __init__(self, hass, entry, sensors):
+        self.hass = hass
+        self._sensors = sensors
+        self._config_entry_id = entry.entry_id
+        title = entry.title or entry.data.get("name") or entry.entry_id
+        self._name = f"calciolive_diagnostic_{title.replace(' ', '_').replace('.', '_').lower()}"
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def unique_id(self):
+        return f"{self._config_entry_id}_diagnostic"
+
+    @property
+    def state(self):
+        # Requêtes émises par les coordinators de l'entrée (un coordinator par URL)
+        return sum(coordinator.request_count for coordinator in self._coordinators().values())
+
+    @property
+    def extra_state_attributes(self):
+        sensors = {}
+        for sensor in self._sensors:
+            coordinator = sensor._coordinator
+            if coordinator is None:
+                continue
+            sensors[sensor.name] = {
+                "url": coordinator.url,
+                "request_count": coordinator.request_count,
+                "last_request_time": coordinator.last_request_time,
+                "update_interval": int(coordinator.update_interval.total_seconds()),
+                "next_refresh": coordinator.next_refresh,
+                "circuit_breaker": coordinator.circuit_breaker.state,
+            }
+        return {"sensors": sensors}
+
+    def _coordinators(self):
+        return {
+            sensor._coordinator.url: sensor._coordinator
+            for sensor in self._sensors
+            if sensor._coordinator is not None
+        }
+
+
+class LiveGameManager:
+    """
+    Entités par match en cours d'une entrée: ajoutées au tipoff, retirées à la fin
+    du match. Un match suivi par plusieurs entrées n'a qu'une seule entité.
+
+    Les entités ont un unique_id stable (match_id): elles sont retirées du registre
+    des entités à la fin du match, y compris celles d'un match terminé pendant que
+    Home Assistant était arrêté (au premier traitement réussi).
+    """
+
+    def __init__(self, hass, entry, async_add_entities):
+        self.hass = hass
+        self._config_entry_id = entry.entry_id
+        self._async_add_entities = async_add_entities
+        self._entities = {}
+        self._stale_checked = False
+
+    @callback
+    def _async_remove_stale(self, live):
+        """Retire du registre les entités live de l'entrée dont le match n'est plus en cours"""
+        entity_registry = er.async_get(self.hass)
+        for entry in er.async_entries_for_config_entry(entity_registry, self._config_entry_id):
+            if entry.domain != "sensor" or not entry.unique_id.startswith(LIVE_GAME_UNIQUE_ID_PREFIX):
+                continue
+            match_id = entry.unique_id[len(LIVE_GAME_UNIQUE_ID_PREFIX):]
+            if match_id not in live and match_id not in self._entities:
+                _LOGGER.debug(f"Match {match_id} terminé hors ligne, entité {entry.entity_id} retirée")
+                entity_registry.async_remove(entry.entity_id)
+
+    @callback
+    def async_update_matches(self, matches):
+        live = {match.match_id: match for match in matches if match.state == "in"}
+        registry = self.hass.data.setdefault(DOMAIN, {}).setdefault(DATA_LIVE_GAMES, {})
+        if not self._stale_checked:
+            self._stale_checked = True
+            self._async_remove_stale(live)
+
+        new_entities = []
+        for match_id, match in live.items():
+            entity = self._entities.get(match_id)
+            if entity is not None:
+                entity.async_set_match(match)
+                continue
+            if match_id in registry:  # déjà suivi par une autre entrée
+                continue
+            entity = CalcioLiveGameSensor(match)
+            self._entities[match_id] = entity
+            registry[match_id] = entity
+            new_entities.append(entity)
+
+        if new_entities:
+            _LOGGER.debug(f"Entités live ajoutées: {[e.name for e in new_entities]}")
+            self._async_add_entities(new_entities)
+
+        for match_id in [match_id for match_id in self._entities if match_id not in live]:
+            entity = self._entities.pop(match_id)
+            registry.pop(match_id, None)
+            _LOGGER.debug(f"Match {match_id} terminé, entité {entity.name} retirée")
+            if entity.registry_entry is not None:
+                # Retirer l'entrée du registre retire aussi l'entité
+                er.async_get(self.hass).async_remove(entity.entity_id)
+            elif entity.hass is not None:
+                self.hass.async_create_task(entity.async_remove())
+
+
+class CalcioLiveGameSensor(Entity):
+    """Match en cours: état = score, attributs réduits à l'horloge et à la dernière action"""
+
+    def __init__(self, match):
+        self._match = match
+        self._match_id = match.match_id
+        home = match.home.team.replace(" ", "_").replace(".", "_").lower()
+        away = match.away.team.replace(" ", "_").replace(".", "_").lower()
+        self._name = f"calciolive_live_{away}_{home}"
+        self._written = None
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def unique_id(self):
+        return f"{LIVE_GAME_UNIQUE_ID_PREFIX}{self._match_id}"
+
+    @property
+    def should_poll(self):
+        return False
+
+    @property
+    def state(self):
+        return f"{self._match.home.score} - {self._match.away.score}"
+
+    @property
+    def extra_state_attributes(self):
+        match = self._match
+        return {
+            "match_id": match.match_id,
+            "home_team": match.home.team,
+            "away_team": match.away.team,
+            "home_score": match.home.score,
+            "away_score": match.away.score,
+            "clock": match.clock,
+            "period": match.period,
+            "status": match.status,
+            "last_play": match.last_play,
+        }
+
+    @callback
+    def async_set_match(self, match):
+        self._match = match
+        if self.hass is None:
+            return
+        content = (match.home.score, match.away.score, match.clock, match.period, match.status, match.last_play)
+        if content == self._written:
+            return
+        self._written = content
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        # Match terminé avant la fin de l'ajout: le gestionnaire l'a déjà oublié
+        if self.hass.data.get(DOMAIN, {}).get(DATA_LIVE_GAMES, {}).get(self._match_id) is not self:
+            self.hass.async_create_task(self.async_remove())
+
+    async def async_will_remove_from_hass(self):
+        await super().async_will_remove_from_hass()
+        registry = self.hass.data.get(DOMAIN, {}).get(DATA_LIVE_GAMES, {})
+        if registry.get(self._match_id) is self:
+            del registry[self._match_id]
+
+
+class CalcioLivePerformanceSensor(CalcioLiveThrottledSensor):
+    """
+    Capteur de performance optionnel: état = latence p90 des fetchs (ms),
+    attributs = métriques par endpoint, par type de capteur et par cache.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _unrecorded_attributes = frozenset({"endpoints", "processing", "caches"})
+
+    def __init__(self, hass, entry):
+        self.hass = hass
+        self._config_entry_id = entry.entry_id
+        title = entry.title or entry.data.get("name") or entry.entry_id
+        self._name = f"calciolive_performance_{title.replace(' ', '_').replace('.', '_').lower()}"
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def unique_id(self):
+        return f"{self._config_entry_id}_performance"
+
+    @property
+    def unit_of_measurement(self):
+        return "ms"
+
+    @property
+    def state(self):
+        latencies = [
+            latency
+            for endpoint in async_get_metrics(self.hass).endpoints.values()
+            for latency in endpoint.latencies
+        ]
+        if not latencies:
+            return None
+        latencies.sort()
+        return round(latencies[int(0.9 * (len(latencies) - 1))] * 1000, 1)
+
+    @property
+    def extra_state_attributes(self):
+        from .diagnostics import async_collect_metrics
+        return async_collect_metrics(self.hass)
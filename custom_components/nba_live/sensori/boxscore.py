@@ -0,0 +1,219 @@
+from array import array
+from .const import _LOGGER
+
+# Ordre positionnel des stats ESPN, utilisé pour l'export historique par joueur:
+# MIN, FG, 3PT, FT, OREB, DREB, REB, AST, STL, BLK, TO, PF, +/-, PTS
+STAT_LABELS = (
+    "minutes", "fg", "3pt", "ft", "oreb", "dreb", "reb",
+    "ast", "stl", "blk", "to", "pf", "plusMinus", "pts",
+)
+# Stat absente d'un enregistrement de l'ancien format: garde sa position, lue comme 0
+MISSING_STAT = None
+
+# Colonnes numériques: nom -> (libellé ESPN, position par défaut, partie "made-att")
+NUMERIC_COLUMNS = {
+    "min": ("MIN", 0, None),
+    "fgm": ("FG", 1, 0),
+    "fga": ("FG", 1, 1),
+    "3pm": ("3PT", 2, 0),
+    "3pa": ("3PT", 2, 1),
+    "ftm": ("FT", 3, 0),
+    "fta": ("FT", 3, 1),
+    "reb": ("REB", 6, None),
+    "ast": ("AST", 7, None),
+    "pts": ("PTS", 13, None),
+}
+
+
+def _parse_int(value, part=None):
+    """'32' -> 32, '7-15' -> 7 ou 15 selon part; 0 si absent ou illisible ('--', 'DNP')"""
+    if not value:
+        return 0
+    if part is not None:
+        pieces = value.split("-")
+        if len(pieces) != 2:
+            return 0
+        value = pieces[part]
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _column_positions(labels):
+    """Position de chaque colonne numérique, d'après les libellés du groupe ESPN s'ils existent"""
+    index = {label.upper(): i for i, label in enumerate(labels or ())}
+    return {
+        name: (index.get(label, default), part)
+        for name, (label, default, part) in NUMERIC_COLUMNS.items()
+    }
+
+
+class TeamBoxScore:
+    """
+    Box score d'une équipe stocké par colonnes
+
+    Les stats chiffrées sont décodées une seule fois dans des array('i')
+    (une entrée par joueur); les chaînes ESPN d'origine sont conservées
+    pour reproduire à l'export le format historique par joueur.
+    """
+
+    __slots__ = ("team_name", "team_abbreviation", "names", "ids", "positions",
+                 "jerseys", "headshots", "starters", "raw", "columns")
+
+    def __init__(self, team_name="N/A", team_abbreviation="N/A"):
+        self.team_name = team_name
+        self.team_abbreviation = team_abbreviation
+        self.names = []
+        self.ids = []
+        self.positions = []
+        self.jerseys = []
+        self.headshots = []
+        self.starters = []
+        self.raw = []
+        self.columns = {name: array("i") for name in NUMERIC_COLUMNS}
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_player(self, name, player_id, position, jersey, headshot, starter, stats, positions=None):
+        if positions is None:
+            positions = _column_positions(None)
+        self.names.append(name)
+        self.ids.append(player_id)
+        self.positions.append(position)
+        self.jerseys.append(jersey)
+        self.headshots.append(headshot)
+        self.starters.append(starter)
+        self.raw.append(list(stats[:len(STAT_LABELS)]))
+        for column, (i, part) in positions.items():
+            self.columns[column].append(_parse_int(stats[i], part) if i < len(stats) else 0)
+
+    def totals(self):
+        """Sommes de l'équipe pour chaque colonne numérique"""
+        return {name: sum(values) for name, values in self.columns.items()}
+
+    def player(self, i):
+        """Joueur i au format historique des attributs"""
+        return {
+            "name": self.names[i],
+            "id": self.ids[i],
+            "position": self.positions[i],
+            "jersey": self.jerseys[i],
+            "headshot": self.headshots[i],
+            "stats": {label: value for label, value in zip(STAT_LABELS, self.raw[i]) if value is not MISSING_STAT},
+            "starter": self.starters[i],
+        }
+
+    def as_dict(self):
+        return {
+            "team_name": self.team_name,
+            "team_abbreviation": self.team_abbreviation,
+            "players": [self.player(i) for i in range(len(self))],
+            "totals": self.totals(),
+        }
+
+    def to_storage(self):
+        """Forme JSON compacte pour le cache persistant (colonnes d'identité + chaînes ESPN)"""
+        return {
+            "team_name": self.team_name,
+            "team_abbreviation": self.team_abbreviation,
+            "names": self.names,
+            "ids": self.ids,
+            "positions": self.positions,
+            "jerseys": self.jerseys,
+            "headshots": self.headshots,
+            "starters": self.starters,
+            "raw": self.raw,
+        }
+
+    @classmethod
+    def from_storage(cls, stored):
+        team = cls(stored.get("team_name", "N/A"), stored.get("team_abbreviation", "N/A"))
+        for i, stats in enumerate(stored.get("raw", [])):
+            team.add_player(
+                stored["names"][i], stored["ids"][i], stored["positions"][i],
+                stored["jerseys"][i], stored["headshots"][i], stored["starters"][i], stats,
+            )
+        return team
+
+    @classmethod
+    def from_players(cls, team_dict):
+        """Relit l'ancien format par joueur (entrées du cache antérieures au stockage par colonnes)"""
+        team = cls(team_dict.get("team_name", "N/A"), team_dict.get("team_abbreviation", "N/A"))
+        for player in team_dict.get("players", []):
+            stats = player.get("stats", {})
+            team.add_player(
+                player.get("name", "N/A"), player.get("id", ""), player.get("position", "N/A"),
+                player.get("jersey", "N/A"), player.get("headshot", ""), player.get("starter", False),
+                [stats.get(label, MISSING_STAT) for label in STAT_LABELS],
+            )
+        return team
+
+
+class BoxScore:
+    """Box score d'un match: les deux équipes, exportées au format historique à la demande"""
+
+    __slots__ = ("home", "away")
+
+    def __init__(self, home, away):
+        self.home = home
+        self.away = away
+
+    def as_dict(self):
+        return {
+            "home_players": self.home.as_dict(),
+            "away_players": self.away.as_dict(),
+            "has_detailed_stats": True,
+        }
+
+    def to_storage(self):
+        return {"home": self.home.to_storage(), "away": self.away.to_storage()}
+
+    @classmethod
+    def from_storage(cls, stored):
+        if "home_players" in stored:
+            return cls(
+                TeamBoxScore.from_players(stored["home_players"]),
+                TeamBoxScore.from_players(stored["away_players"]),
+            )
+        return cls(TeamBoxScore.from_storage(stored["home"]), TeamBoxScore.from_storage(stored["away"]))
+
+
+def parse_team_boxscore(team_data):
+    """
+    Parse les statistiques des joueurs d'une équipe
+
+    Args:
+        team_data (dict): Données d'une équipe depuis l'API summary
+
+    Returns:
+        TeamBoxScore: box score de l'équipe par colonnes
+    """
+    team_info = team_data.get("team", {})
+    team = TeamBoxScore(team_info.get("displayName", "N/A"), team_info.get("abbreviation", "N/A"))
+
+    # Tous les groupes qui contiennent des athlètes (starters, bench...)
+    for stat_group in team_data.get("statistics", []):
+        athletes = stat_group.get("athletes", [])
+        if not athletes:
+            continue
+        is_starter = stat_group.get("name", "").lower() in ["starters", "starter"]
+        positions = _column_positions(stat_group.get("labels"))
+
+        for athlete_data in athletes:
+            athlete = athlete_data.get("athlete", {})
+            team.add_player(
+                athlete.get("displayName", "N/A"),
+                athlete.get("id", ""),
+                athlete.get("position", {}).get("abbreviation", "N/A"),
+                athlete.get("jersey", "N/A"),
+                athlete.get("headshot", {}).get("href", ""),
+                is_starter,
+                athlete_data.get("stats", []),
+                positions,
+            )
+
+    _LOGGER.debug(f"Total players parsed for {team.team_name}: {len(team)}")
+    return team
+
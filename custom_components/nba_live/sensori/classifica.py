@@ -1,66 +1,158 @@
+from dataclasses import dataclass
 from .const import _LOGGER
-from dateutil import parser
 
-def classifica_data(data, conference=None):
-    try:
-        children = data.get("children", [])
+# Statistiques ESPN exportées telles quelles (displayValue), dans l'ordre des attributs
+_DISPLAY_STATS = (
+    ("overall", "overall", "N/A"),
+    ("wins", "wins", "N/A"),
+    ("losses", "losses", "N/A"),
+    ("win_pct", "winPercent", "N/A"),
+    ("games_behind", "gamesBehind", "N/A"),
+    ("home", "Home", "N/A"),
+    ("road", "Road", "N/A"),
+    ("differential", "differential", "N/A"),
+    ("streak", "streak", "N/A"),
+    ("last_ten", "Last Ten Games", "N/A"),
+    ("playoff_seed", "playoffSeed", "N/A"),
+    ("clincher", "clincher", ""),
+)
 
-        if conference:
-            children = [c for c in children if c.get("abbreviation") == conference]
-
-        standings_list = []
-
-        for child in children:
-            entries = child.get("standings", {}).get("entries", [])
-            season_display_name = child.get("standings", {}).get("seasonDisplayName", "N/A")
-            standings = []
-
-            for index, entry in enumerate(entries, start=1):
-                team = entry.get("team", {})
-                stats = {s["name"]: s["displayValue"] for s in entry.get("stats", [])}
-
-                team_data = {
-                    "rank": index,
-                    "team_id": team.get("id"),
-                    "team_name": team.get("displayName"),
-                    "team_abbreviation": team.get("abbreviation"),
-                    "team_logo": team.get("logos", [{}])[0].get("href"),
-                    "overall": stats.get("overall", "N/A"),
-                    "wins": stats.get("wins", "N/A"),
-                    "losses": stats.get("losses", "N/A"),
-                    "win_pct": stats.get("winPercent", "N/A"),
-                    "games_behind": stats.get("gamesBehind", "N/A"),
-                    "home": stats.get("Home", "N/A"),
-                    "road": stats.get("Road", "N/A"),
-                    "differential": stats.get("differential", "N/A"),
-                    "streak": stats.get("streak", "N/A"),
-                    "last_ten": stats.get("Last Ten Games", "N/A"),
-                    "playoff_seed": stats.get("playoffSeed", "N/A"),
-                    "clincher": stats.get("clincher", ""),
-                }
-                standings.append(team_data)
 
-            standings.sort(key=lambda t: float(t["win_pct"].lstrip(".") or 0) if t["win_pct"] not in ("N/A", "") else 0, reverse=True)
-            for i, t in enumerate(standings, start=1):
-                t["rank"] = i
+@dataclass(slots=True)
+class TeamStanding:
+    """Ligne de classement: valeurs numériques pour le tri, chaînes ESPN pour l'export"""
+
+    team_id: str
+    team_name: str
+    team_abbreviation: str
+    team_logo: str
+    wins: int
+    losses: int
+    win_pct: float
+    playoff_seed: float  # inf si ESPN ne fournit pas de seed
+    display: dict
+
+    def sort_key(self):
+        # % victoires décroissant, puis seed playoffs croissant, puis victoires
+        return (-self.win_pct, self.playoff_seed, -self.wins)
+
+    def as_dict(self, rank):
+        team_data = {
+            "rank": rank,
+            "team_id": self.team_id,
+            "team_name": self.team_name,
+            "team_abbreviation": self.team_abbreviation,
+            "team_logo": self.team_logo,
+        }
+        for key, _, default in _DISPLAY_STATS:
+            team_data[key] = self.display.get(key, default)
+        return team_data
+
 
-            standings_list.append({
+class StandingsTable:
+    """
+    Classement calculé une seule fois par payload et partagé par les capteurs
+    de conférence: chaque groupe est déjà trié et exporté.
+    """
+
+    def __init__(self, data):
+        self.groups = []
+        self.by_abbreviation = {}
+
+        for child in data.get("children", []):
+            standings = child.get("standings", {})
+            rows = sorted(
+                (_build_team_standing(entry) for entry in standings.get("entries", [])),
+                key=TeamStanding.sort_key,
+            )
+            group = {
                 "conference": child.get("name", "Unknown"),
                 "abbreviation": child.get("abbreviation", ""),
-                "season": season_display_name,
-                "standings": standings,
-            })
-
-        if conference and standings_list:
-            return {
-                "season": standings_list[0]["season"],
-                "conference": standings_list[0]["conference"],
-                "abbreviation": standings_list[0]["abbreviation"],
-                "standings": standings_list[0]["standings"],
+                "season": standings.get("seasonDisplayName", "N/A"),
+                "standings": [row.as_dict(rank) for rank, row in enumerate(rows, start=1)],
             }
+            self.groups.append(group)
+            self.by_abbreviation.setdefault(group["abbreviation"], group)
+
+    def conference(self, abbreviation):
+        return self.by_abbreviation.get(abbreviation)
+
+
+def build_standings_table(data):
+    try:
+        return StandingsTable(data)
+    except Exception as e:
+        _LOGGER.error(f"Errore nel processare i dati della classifica: {e}")
+        return StandingsTable({})
+
+
+def _stat_number(stat, cast):
+    """Valeur numérique d'une statistique ESPN (value, sinon displayValue)"""
+    value = stat.get("value")
+    if value is None:
+        value = stat.get("displayValue")
+    try:
+        return cast(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _build_team_standing(entry):
+    team = entry.get("team", {})
+    stats = {s.get("name"): s for s in entry.get("stats", [])}
+    display = {
+        key: stats[name].get("displayValue", default)
+        for key, name, default in _DISPLAY_STATS
+        if name in stats
+    }
+
+    wins = _stat_number(stats.get("wins", {}), int)
+    losses = _stat_number(stats.get("losses", {}), int)
+    win_pct = _stat_number(stats.get("winPercent", {}), float)
+    if win_pct is None and wins is not None and losses is not None and wins + losses:
+        win_pct = wins / (wins + losses)
+    playoff_seed = _stat_number(stats.get("playoffSeed", {}), int)
+
+    return TeamStanding(
+        team_id=team.get("id"),
+        team_name=team.get("displayName"),
+        team_abbreviation=team.get("abbreviation"),
+        team_logo=team.get("logos", [{}])[0].get("href"),
+        wins=wins or 0,
+        losses=losses or 0,
+        win_pct=win_pct or 0.0,
+        playoff_seed=playoff_seed if playoff_seed else float("inf"),
+        display=display,
+    )
+
+
+def classifica_data(data, conference=None, table=None):
+    """
+    Args:
+        data (dict): payload standings ESPN
+        conference (str): abréviation de la conférence, None pour tous les groupes
+        table (StandingsTable): classement déjà calculé pour ce payload
+
+    Returns:
+        dict: attributs du capteur de classement
+    """
+    try:
+        if table is None:
+            table = build_standings_table(data)
+
+        if conference:
+            group = table.conference(conference)
+            if group is not None:
+                return {
+                    "season": group["season"],
+                    "conference": group["conference"],
+                    "abbreviation": group["abbreviation"],
+                    "standings": group["standings"],
+                }
+            return {"standings_groups": []}
 
         return {
-            "standings_groups": standings_list,
+            "standings_groups": table.groups,
         }
 
     except Exception as e:
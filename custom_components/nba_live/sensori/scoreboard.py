@@ -1,7 +1,80 @@
+import asyncio
+import aiohttp
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from .const import _LOGGER
+from .boxscore import BoxScore, parse_team_boxscore
+from ..client import async_get_client
+from ..const import (
+    DOMAIN,
+    DATA_BOXSCORE_STORE,
+    DEFAULT_BOXSCORE_CONCURRENCY,
+    DEFAULT_BOXSCORE_DEADLINE,
+    ESPN_BASKETBALL_URL,
+)
 from dateutil import parser
 from zoneinfo import ZoneInfo
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+# Requêtes summary en cours, conservées d'un cycle à l'autre quand elles dépassent le délai
+_player_stats_tasks = {}
+
+# Limite de requêtes summary simultanées, commune à tous les capteurs (voir _player_stats_semaphore)
+_stats_semaphore = None
+_stats_semaphore_size = None
+
+# Matchs déjà construits par match_id: (empreinte, Match), partagés entre capteurs
+MATCH_MEMO_SIZE = 512
+_match_memo = OrderedDict()
+_match_memo_stats = {"hits": 0, "misses": 0}
+
+# Temps CPU du thread de la boucle écoulé pendant l'attente des box scores (voir excluded_waits)
+_wait_accounting = ContextVar("nba_live_wait_accounting", default=None)
+
+
+class WaitAccounting:
+    __slots__ = ("thread_time", "profile")
+
+    def __init__(self, profile=None):
+        self.thread_time = 0.0
+        self.profile = profile
+
+
+@contextmanager
+def excluded_waits(profile=None):
+    """
+    Mesure le temps CPU consommé sur la boucle pendant les attentes de box scores
+    du bloc, pour le retirer du coût de traitement d'un capteur: pendant
+    asyncio.wait, la boucle exécute le travail du reste de Home Assistant.
+
+    Args:
+        profile: session du service nba_live.profile (start_section/end_section),
+            suspendue pendant les attentes; None hors profilage
+    """
+    accounting = WaitAccounting(profile)
+    token = _wait_accounting.set(accounting)
+    try:
+        yield accounting
+    finally:
+        _wait_accounting.reset(token)
+
+
+@contextmanager
+def _profiled_section():
+    """Section CPU profilée si le capteur à l'origine de la tâche est en cours de profilage"""
+    accounting = _wait_accounting.get()
+    profile = accounting.profile if accounting is not None else None
+    if profile is None or not profile.start_section():
+        yield
+        return
+    try:
+        yield
+    finally:
+        profile.end_section()
 
 # Helper function to check if team is TBD/unknown
 def _is_team_valid(competitor):
@@ -129,12 +202,368 @@ def get_season_slug_or_displayname(match):
     display_name = season_data.get("displayName")
     return display_name
     
-async def process_match_data(data, hass, team_name=None, next_match_only=False, start_date=None, end_date=None):
+@dataclass(slots=True)
+class TeamLine:
+    """Ligne d'une équipe dans un match (exportée en clés home_* / away_*)"""
+
+    team_id: str
+    team: str
+    logo: object
+    form: str
+    score: str
+    linescores: list
+    statistics: dict
+    leaders: dict
+    overall: str
+    home: str
+    road: str
+
+    def as_dict(self, prefix):
+        return {
+            f"{prefix}_team": self.team,
+            f"{prefix}_logo": self.logo,
+            f"{prefix}_form": self.form,
+            f"{prefix}_score": self.score,
+            f"{prefix}_linescores": self.linescores,
+            f"{prefix}_statistics": self.statistics,
+            f"{prefix}_leaders": self.leaders,  # Leaders complets (points, rebounds, assists)
+            f"{prefix}_overall": self.overall,
+            f"{prefix}_home": self.home,
+            f"{prefix}_road": self.road,
+        }
+
+
+@dataclass(slots=True)
+class Match:
+    """
+    Match traité, partagé entre capteurs
+
+    Converti en dictionnaire plat (format historique des attributs
+    `matches`) uniquement à l'export via as_dict().
+    """
+
+    match_id: str
+    date: object  # datetime UTC, formaté à l'export
+    season_info: object
+    home: TeamLine
+    away: TeamLine
+    state: str
+    status: str
+    clock: str
+    period: object
+    venue: str
+    series_summary: object
+    match_details: list
+    # Box score par colonnes (BoxScore, uniquement si match terminé)
+    player_stats: object = None
+    # Dernière action (situation.lastPlay, matchs en cours), pour les entités live
+    last_play: str = None
+    # Empreinte de l'événement ESPN (_match_fingerprint), non exportée
+    fingerprint: tuple = ()
+
+    def as_dict(self, tz=None):
+        return {
+            "date": format_date(self.date, tz),
+            "match_id": self.match_id,
+            "season_info": self.season_info,  # per il mixed
+            **self.home.as_dict("home"),
+            **self.away.as_dict("away"),
+            "state": self.state,
+            "status": self.status,
+            "clock": self.clock,
+            "period": self.period,
+            "venue": self.venue,
+            "series_summary": self.series_summary,
+            "match_details": self.match_details,
+            "player_stats": self.player_stats.as_dict() if self.player_stats is not None else None,
+        }
+
+    def content_key(self):
+        """Ce qui rend le match visiblement différent: empreinte de l'événement et box score"""
+        return (self.match_id, self.fingerprint, self.player_stats is not None)
+
+    def as_summary(self, tz=None):
+        """Version allégée pour le mode slim: ni box score, ni leaders, ni statistiques"""
+        return {
+            "date": format_date(self.date, tz),
+            "match_id": self.match_id,
+            "home_team": self.home.team,
+            "away_team": self.away.team,
+            "home_logo": self.home.logo,
+            "away_logo": self.away.logo,
+            "home_score": self.home.score,
+            "away_score": self.away.score,
+            "state": self.state,
+            "status": self.status,
+            "clock": self.clock,
+            "period": self.period,
+            "series_summary": self.series_summary,
+            "has_player_stats": self.player_stats is not None,
+        }
+
+
+def _build_team_line(competitor, default_name):
+    """Construit la TeamLine d'un competitor (valeurs par défaut si équipe TBD)"""
+    team_data = _get_safe_team_data(competitor, default_name)
+    is_valid = _is_team_valid(competitor)
+    return TeamLine(
+        team_id=str(competitor.get("team", {}).get("id", "")),
+        team=team_data["team_name"],
+        logo=team_data["logo"],
+        form=team_data["form"],
+        score=team_data["score"],
+        linescores=_get_linescores(competitor) if is_valid else [],
+        statistics=_get_statistics(competitor) if is_valid else {},
+        leaders=_get_leaders(competitor) if is_valid else {},
+        overall=team_data["records"]["overall"],
+        home=team_data["records"]["home"],
+        road=team_data["records"]["road"],
+    )
+
+
+class EventIndex:
+    """
+    Index des événements d'un payload par équipe participante
+
+    Construit une seule fois par payload (voir EspnFetchCoordinator.get_derived):
+    chaque capteur d'équipe retrouve ses matchs en O(1) au lieu de parcourir
+    et comparer le nom de tous les événements.
+    """
+
+    __slots__ = ("by_team_id", "by_abbreviation", "by_name")
+
+    def __init__(self, data):
+        self.by_team_id = {}
+        self.by_abbreviation = {}
+        self.by_name = {}
+        for event in data.get("events", []):
+            competitions = event.get("competitions") or [{}]
+            for competitor in competitions[0].get("competitors", []):
+                team = competitor.get("team", {})
+                self._add(self.by_team_id, str(team.get("id", "")), event)
+                self._add(self.by_abbreviation, (team.get("abbreviation") or "").upper(), event)
+                self._add(self.by_name, (team.get("displayName") or "").lower(), event)
+
+    @staticmethod
+    def _add(index, key, event):
+        if not key:
+            return
+        events = index.setdefault(key, [])
+        # Un même événement ne doit apparaître qu'une fois par clé
+        if not events or events[-1] is not event:
+            events.append(event)
+
+    def events_for_team(self, team_id=None, team_name=None):
+        """
+        Événements d'une équipe, dans l'ordre du payload
+
+        L'id n'est pas toujours celui des competitors du payload (ids d'équipe
+        soccer enregistrés par le config flow): sans résultat, on retombe sur
+        le nom puis l'abréviation.
+
+        Returns:
+            list: événements trouvés, ou None si l'équipe n'est pas indexée
+                  (l'appelant filtre alors par sous-chaîne du nom)
+        """
+        if team_id:
+            events = self.by_team_id.get(str(team_id))
+            if events:
+                return events
+        if team_name:
+            return self.by_name.get(team_name.lower()) or self.by_abbreviation.get(team_name.upper())
+        return None
+
+
+def build_event_index(data):
+    return EventIndex(data)
+
+
+def _build_match_data(match, match_id):
+    """
+    Construit le Match complet d'un événement (équipes, leaders, stats, détails)
+
+    Returns:
+        Match: match traité, ou None si l'événement est inexploitable
+    """
+    #Solo per il mixed
+    season_info = get_season_slug_or_displayname(match)
+
+    competitions = match.get("competitions", [])
+    
+    # Vérifier que competitions n'est pas vide
+    if not competitions or len(competitions) == 0:
+        _LOGGER.warning(f"Match {match_id}: Pas de competitions, skipping")
+        return None
+    
+    competitors = competitions[0].get("competitors", [])
+    
+    # Vérifier qu'on a exactement 2 competitors
+    if len(competitors) != 2:
+        _LOGGER.warning(f"Match {match_id}: {len(competitors)} competitors (attendu: 2), skipping")
+        return None
+    
+    # Récupération sécurisée des données des deux équipes
+    home = _build_team_line(competitors[0], "TBD Home")
+    away = _build_team_line(competitors[1], "TBD Away")
+    
+    # Log si équipes TBD détectées
+    if not _is_team_valid(competitors[0]) or not _is_team_valid(competitors[1]):
+        _LOGGER.info(f"Match {match_id}: {away.team} @ {home.team} - Équipe(s) TBD/non déterminée(s)")
+
+    status = match.get("status", {})
+    status_type = status.get("type", {})
+
+    return Match(
+        match_id=match_id,
+        date=_parse_utc(match.get("date")),
+        season_info=season_info,
+        home=home,
+        away=away,
+        state=status_type.get("state", "N/A"),
+        status=status_type.get("description", "N/A"),
+        clock=status.get("displayClock", "N/A"),
+        period=status.get("period", "N/A"),
+        venue=competitions[0].get("venue", {}).get("fullName", "N/A"),
+        series_summary=competitions[0].get("series", {}).get("summary", None),
+        match_details=_get_details(competitions[0].get("details", [])),
+        last_play=(competitions[0].get("situation") or {}).get("lastPlay", {}).get("text"),
+    )
+
+
+def _match_fingerprint(match):
+    """
+    Empreinte bon marché d'un événement: si elle ne change pas entre deux
+    polls, l'enregistrement déjà construit est réutilisé tel quel
+    """
+    status = match.get("status", {})
+    competitions = match.get("competitions") or [{}]
+    competition = competitions[0]
+    return (
+        status.get("type", {}).get("state"),
+        status.get("type", {}).get("description"),
+        status.get("displayClock"),
+        status.get("period"),
+        match.get("date"),
+        tuple((c.get("team", {}).get("id"), c.get("score")) for c in competition.get("competitors", [])),
+        len(competition.get("details", [])),
+        (competition.get("situation") or {}).get("lastPlay", {}).get("id"),
+    )
+
+
+def _iter_window_events(matches_data, team_name, filter_by_name, start_date, end_date):
+    """
+    Parcourt les événements de la fenêtre en ne lisant que des champs bon marché
+
+    Yields:
+        tuple: (événement brut, match_id, date UTC)
+    """
+    for match in matches_data:
+        # Repli historique (nom saisi à la main absent de l'index): recherche dans le nom
+        if filter_by_name and team_name.lower() not in match.get("name", "").lower():
+            continue
+
+        match_date_str = match.get("date", "")
+        match_date = _parse_utc(match_date_str)
+        if match_date_str and match_date is None:
+            _LOGGER.error(f"Errore nel parsing della data della partita: {match_date_str}")
+            continue
+
+        if start_date and match_date and match_date < start_date:
+            continue
+        if end_date and match_date and match_date > end_date:
+            continue
+
+        yield match, match.get("id", ""), match_date
+
+
+def _is_event_usable(match):
+    """Même contrôle que _build_match_data, sans rien construire"""
+    competitions = match.get("competitions")
+    return bool(competitions) and len(competitions[0].get("competitors", [])) == 2
+
+
+def _select_next_event(candidates):
+    """
+    Choisit l'événement à afficher pour un capteur "prochain match"
+
+    Priorité: match en cours, puis match terminé le plus récent (48 h),
+    puis prochain match à venir. Seuls l'état et la date sont lus.
+
+    Returns:
+        tuple: (événement brut, match_id) ou None
+    """
+    recent_finished = None
+    upcoming = None
+    for match, match_id, match_date in candidates:
+        if not _is_event_usable(match):
+            continue
+        state = match.get("status", {}).get("type", {}).get("state")
+        if state == "in":
+            return match, match_id
+        if state == "post" and match_date is not None and is_within_last_48_hours(match_date):
+            if recent_finished is None or match_date > recent_finished[2]:
+                recent_finished = (match, match_id, match_date)
+        elif state == "pre":
+            sort_date = match_date or datetime.max.replace(tzinfo=timezone.utc)
+            if upcoming is None or sort_date < upcoming[2]:
+                upcoming = (match, match_id, sort_date)
+
+    selected = recent_finished or upcoming
+    return (selected[0], selected[1]) if selected else None
+
+
+def _get_or_build_match(match, match_id):
+    """Match mémorisé si l'empreinte de l'événement n'a pas changé, sinon reconstruit"""
+    fingerprint = _match_fingerprint(match)
+    memo = _match_memo.get(match_id)
+    if memo is not None and memo[0] == fingerprint:
+        _match_memo.move_to_end(match_id)
+        _match_memo_stats["hits"] += 1
+        return memo[1]
+
+    _match_memo_stats["misses"] += 1
+    match_data = _build_match_data(match, match_id)
+    if match_data is None:
+        return None
+    match_data.fingerprint = fingerprint
+    _match_memo[match_id] = (fingerprint, match_data)
+    while len(_match_memo) > MATCH_MEMO_SIZE:
+        _match_memo.popitem(last=False)
+    return match_data
+
+
+def _team_logo(match_data, team_name, team_id):
+    if team_id:
+        if match_data.home.team_id == str(team_id):
+            return match_data.home.logo
+        if match_data.away.team_id == str(team_id):
+            return match_data.away.logo
+        # Identifiant périmé (ancien id d'une autre ligue...): on retombe sur le nom
+    if team_name:
+        home_team = match_data.home.team.lower()
+        away_team = match_data.away.team.lower()
+        if team_name.lower() in home_team or team_name.lower() in away_team:
+            return match_data.home.logo if team_name.lower() in home_team else match_data.away.logo
+    return None
+
+
+async def process_match_data(data, hass, team_name=None, next_match_only=False, start_date=None, end_date=None,
+                             stats_concurrency=DEFAULT_BOXSCORE_CONCURRENCY, stats_deadline=DEFAULT_BOXSCORE_DEADLINE,
+                             team_id=None, event_index=None):
     try:
         matches_data = data.get("events", [])
+        team_events = None
+        if team_id or team_name:
+            if event_index is None:
+                event_index = build_event_index(data)
+            team_events = event_index.events_for_team(team_id=team_id, team_name=team_name)
+        if team_events is not None:
+            # Équipe trouvée dans l'index: plus besoin de filtrer par nom
+            matches_data = team_events
+        filter_by_name = team_events is None and bool(team_name)
         league_info = process_league_data(data, hass)
         matches = []
-        scores = []
+        finished_matches = []
         team_logo = None
 
         if isinstance(start_date, str):
@@ -142,162 +571,48 @@ async def process_match_data(data, hass, team_name=None, next_match_only=False,
         if isinstance(end_date, str):
             end_date = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
 
-        for match in matches_data:
-            match_name = match.get("name", "").lower()
-            if team_name and team_name.lower() not in match_name:
-                continue
-
-            match_date_str = match.get("date", "")
-            match_id = match.get("id", "")
-            try:
-                match_date = parser.isoparse(match_date_str).astimezone(timezone.utc) if match_date_str else None
-            except ValueError:
-                _LOGGER.error(f"Errore nel parsing della data della partita: {match_date_str}")
-                continue
-
-            if start_date and match_date and match_date < start_date:
-                continue
-            if end_date and match_date and match_date > end_date:
-                continue
-            
-            #Solo per il mixed
-            season_info = get_season_slug_or_displayname(match)
-
-            competitions = match.get("competitions", [])
-            
-            # Vérifier que competitions n'est pas vide
-            if not competitions or len(competitions) == 0:
-                _LOGGER.warning(f"Match {match_id}: Pas de competitions, skipping")
-                continue
-            
-            competitors = competitions[0].get("competitors", [])
-            
-            # Vérifier qu'on a exactement 2 competitors
-            if len(competitors) != 2:
-                _LOGGER.warning(f"Match {match_id}: {len(competitors)} competitors (attendu: 2), skipping")
-                continue
-            
-            # Récupération sécurisée des données HOME team
-            home_data = _get_safe_team_data(competitors[0], "TBD Home")
-            home_team = home_data["team_name"]
-            home_logo = home_data["logo"]
-            home_form = home_data["form"]
-            home_score = home_data["score"]
-            home_linescores = _get_linescores(competitors[0]) if _is_team_valid(competitors[0]) else []
-            home_statistics = _get_statistics(competitors[0]) if _is_team_valid(competitors[0]) else {}
-            home_leaders = _get_leaders(competitors[0]) if _is_team_valid(competitors[0]) else {}
-            home_overall = home_data["records"]["overall"]
-            home_home = home_data["records"]["home"]
-            home_road = home_data["records"]["road"]
-            
-            # Récupération sécurisée des données AWAY team
-            away_data = _get_safe_team_data(competitors[1], "TBD Away")
-            away_team = away_data["team_name"]
-            
-            # Log si équipes TBD détectées
-            if not _is_team_valid(competitors[0]) or not _is_team_valid(competitors[1]):
-                _LOGGER.info(f"Match {match_id}: {away_team} @ {home_team} - Équipe(s) TBD/non déterminée(s)")
-
-            away_logo = away_data["logo"]
-            away_form = away_data["form"]
-            away_score = away_data["score"]
-            away_linescores = _get_linescores(competitors[1]) if _is_team_valid(competitors[1]) else []
-            away_statistics = _get_statistics(competitors[1]) if _is_team_valid(competitors[1]) else {}
-            away_leaders = _get_leaders(competitors[1]) if _is_team_valid(competitors[1]) else {}
-            away_overall = away_data["records"]["overall"]
-            away_home = away_data["records"]["home"]
-            away_road = away_data["records"]["road"]
-
-            status_type = match.get("status", {}).get("type", {})
-            match_state = status_type.get("state", "N/A")
-            match_status = status_type.get("description", "N/A")
-            clock = match.get("status", {}).get("displayClock", "N/A")
-            period = match.get("status", {}).get("period", "N/A")
-            venue = competitions[0].get("venue", {}).get("fullName", "N/A")
-            series_summary = competitions[0].get("series", {}).get("summary", None)
-            match_details = _get_details(competitions[0].get("details", []))
-            
-            # Récupérer les statistiques détaillées des joueurs si le match est terminé (ASYNC)
-            player_stats = await _get_player_stats(hass, match_id, match_state) if match_state == "post" else None
-
-            if team_name and (team_name.lower() in home_team.lower() or team_name.lower() in away_team.lower()):
-                team_logo = home_logo if team_name.lower() in home_team.lower() else away_logo
-
-            match_data = {
-                "date": _parse_date(hass, match.get("date")),
-                "match_id": match_id,
-                "season_info": season_info, #per il mixed
-                "home_team": home_team,
-                "home_logo": home_logo,
-                "home_form": home_form,
-                "home_score": home_score,
-                "home_linescores": home_linescores,
-                #"home_period1": home_period1,
-                "home_statistics": home_statistics,
-                "home_leaders": home_leaders,  # Leaders complets (points, rebounds, assists)
-                "home_overall": home_overall,
-                "home_home": home_home,
-                "home_road": home_road,
-                "away_team": away_team,
-                "away_logo": away_logo,
-                "away_form": away_form,
-                "away_score": away_score,
-                "away_linescores": away_linescores,
-                #"home_period0": append(f"{home_linescores[0]} - {away_linescores[0]}"),
-                #"home_period0": scores[0],
-                "away_statistics": away_statistics,
-                "away_leaders": away_leaders,  # Leaders complets (points, rebounds, assists)
-                "away_overall": away_overall,
-                "away_home": away_home,
-                "away_road": away_road,
-
-                "state": match_state,
-                "status": match_status,
-                "clock": clock,
-                "period": period,
-                "venue": venue,
-                "series_summary": series_summary,
-                "match_details": match_details,
-                
-                # Statistiques détaillées des joueurs (uniquement si match terminé)
-                "player_stats": player_stats,
-            }
-            matches.append(match_data)
-
         if next_match_only:
-            # Priorità 1: Partite in corso
-            live_matches = [m for m in matches if m["state"] == "in"]
-            if live_matches:
+            # Sélection sur les champs bon marché, puis enrichissement du seul match retenu
+            selected = _select_next_event(
+                _iter_window_events(matches_data, team_name, filter_by_name, start_date, end_date)
+            )
+            if selected is not None:
+                match_data = _get_or_build_match(*selected)
+                if match_data.state == "post" and match_data.player_stats is None:
+                    player_stats = await _get_player_stats_bounded(
+                        hass, [match_data.match_id], stats_concurrency, stats_deadline
+                    )
+                    match_data.player_stats = player_stats.get(match_data.match_id)
+
+                team_logo = _team_logo(match_data, team_name, team_id)
                 return {
                     "league_info": league_info,
                     "team_name": team_name if team_name else "Tutte le partite",
                     "team_logo": team_logo if team_logo else "N/A",
-                    "matches": [live_matches[0]]
+                    "matches": [match_data]
                 }
+            # Aucun match live, récent ou à venir: tous les matchs de la fenêtre (comportement historique)
 
-            # Priorità 2: Partite terminate entro 48 ore
-            recent_finished_matches = [m for m in matches
-                if m["state"] == "post" and is_within_last_48_hours(m["date"])
-            ]
-            
-            if recent_finished_matches:
-                return {
-                    "league_info": league_info,
-                    "team_name": team_name if team_name else "Tutte le partite",
-                    "team_logo": team_logo if team_logo else "N/A",
-                    "matches": [recent_finished_matches[0]]
-                }
+        for match, match_id, _ in _iter_window_events(matches_data, team_name, filter_by_name, start_date, end_date):
+            # Match inchangé depuis le dernier poll: on réutilise l'enregistrement
+            match_data = _get_or_build_match(match, match_id)
+            if match_data is None:
+                continue
+
+            team_logo = _team_logo(match_data, team_name, team_id) or team_logo
+
+            matches.append(match_data)
+            if match_data.state == "post" and match_data.player_stats is None:
+                finished_matches.append(match_data)
+
+        # Box scores des matchs terminés, en parallèle et dans un délai global
+        if finished_matches:
+            player_stats = await _get_player_stats_bounded(
+                hass, [m.match_id for m in finished_matches], stats_concurrency, stats_deadline
+            )
+            for match_data in finished_matches:
+                match_data.player_stats = player_stats.get(match_data.match_id)
 
-            # Priorità 3: Prossime partite
-            upcoming_matches = [m for m in matches if m["state"] == "pre"]
-            if upcoming_matches:
-                return {
-                    "league_info": league_info,
-                    "team_name": team_name if team_name else "Tutte le partite",
-                    "team_logo": team_logo if team_logo else "N/A",
-                    "matches": [upcoming_matches[0]]
-                }
-                
         return {
             "league_info": league_info,
             "team_name": team_name if team_name else "Tutte le partite",
@@ -374,6 +689,95 @@ def _get_leaders(competitor):
     return leaders_data
 
 
+def _player_stats_semaphore(concurrency):
+    """
+    Sémaphore partagé par toute l'intégration pour les requêtes summary
+
+    Sa taille suit l'option `boxscore_concurrency`; il n'est recréé pour une
+    nouvelle valeur que lorsqu'aucune requête n'est en vol, pour que la limite
+    reste globale même si deux entrées ont des réglages différents.
+    """
+    global _stats_semaphore, _stats_semaphore_size
+    size = max(1, int(concurrency))
+    if _stats_semaphore is None or (size != _stats_semaphore_size and not _player_stats_tasks):
+        _stats_semaphore = asyncio.Semaphore(size)
+        _stats_semaphore_size = size
+    return _stats_semaphore
+
+
+async def _get_player_stats_bounded(hass, match_ids, concurrency, deadline):
+    """
+    Récupère les box scores de plusieurs matchs en parallèle
+
+    Au plus `concurrency` requêtes sont en vol en même temps, tous capteurs
+    confondus, et l'ensemble est limité à `deadline` secondes. Les requêtes
+    qui dépassent le délai ne sont pas annulées: leur résultat sera repris
+    au cycle suivant.
+
+    Returns:
+        dict: match_id -> statistiques des joueurs (absent si pas encore disponible)
+    """
+    semaphore = _player_stats_semaphore(concurrency)
+
+    async def fetch(match_id):
+        async with semaphore:
+            return await _get_player_stats(hass, match_id, "post")
+
+    tasks = {}
+    for match_id in match_ids:
+        task = _player_stats_tasks.get(match_id)
+        if task is None:
+            # Tâche de fond de Home Assistant: annulée à l'arrêt, voir aussi cancel_player_stats
+            task = hass.async_create_background_task(fetch(match_id), f"nba_live box score {match_id}")
+            _player_stats_tasks[match_id] = task
+        tasks[match_id] = task
+
+    pending = {task for task in tasks.values() if not task.done()}
+    if pending:
+        accounting = _wait_accounting.get()
+        profile = accounting.profile if accounting is not None else None
+        wait_start = time.thread_time()
+        if profile is not None:
+            profile.end_section()
+        try:
+            _, pending = await asyncio.wait(pending, timeout=deadline)
+        finally:
+            if profile is not None:
+                profile.start_section()
+        if accounting is not None:
+            accounting.thread_time += time.thread_time() - wait_start
+
+    results = {}
+    for match_id, task in tasks.items():
+        if not task.done():
+            continue
+        _player_stats_tasks.pop(match_id, None)
+        if not task.cancelled() and task.exception() is None:
+            results[match_id] = task.result()
+
+    if pending:
+        _LOGGER.info(f"{len(pending)} box score(s) hors délai ({deadline}s), publiés au prochain cycle")
+
+    return results
+
+
+def match_memo_stats():
+    """Succès/échecs du cache des Match (diagnostics)"""
+    return {**_match_memo_stats, "size": len(_match_memo)}
+
+
+def pending_player_stats():
+    """Retourne les match_id dont le box score est encore en cours de récupération"""
+    return set(_player_stats_tasks)
+
+
+def cancel_player_stats():
+    """Annule les récupérations de box scores en cours (retrait de la dernière entrée)"""
+    for task in _player_stats_tasks.values():
+        task.cancel()
+    _player_stats_tasks.clear()
+
+
 async def _get_player_stats(hass, match_id, match_state):
     """
     Récupère les statistiques détaillées de tous les joueurs pour un match terminé
@@ -385,44 +789,46 @@ async def _get_player_stats(hass, match_id, match_state):
         match_state (str): État du match ("post" pour terminé)
     
     Returns:
-        dict: Statistiques des joueurs par équipe ou None si non disponible
+        BoxScore: box score par colonnes des deux équipes ou None si non disponible
     """
     
     # Ne récupérer que si le match est terminé
     if match_state != "post":
         return None
+
+    # Un box score final ne change plus: le cache persistant passe avant le réseau
+    boxscore_store = hass.data.get(DOMAIN, {}).get(DATA_BOXSCORE_STORE)
+    if boxscore_store is not None:
+        cached = boxscore_store.get(match_id)
+        if cached is not None:
+            return cached
     
     try:
         # URL de l'API Summary ESPN
-        url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event={match_id}"
+        url = f"{ESPN_BASKETBALL_URL}/nba/summary?event={match_id}"
         
         _LOGGER.debug(f"Fetching player stats for match {match_id} from {url}")
         
-        # Utiliser aiohttp depuis Home Assistant
-        import aiohttp
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                response.raise_for_status()
-                data = await response.json()
-        
-        # Extraire les statistiques des box scores
-        boxscore = data.get("boxscore", {})
-        players = boxscore.get("players", [])
-        
-        if not players or len(players) < 2:
-            _LOGGER.warning(f"No player stats found for match {match_id}")
-            return None
-        
-        # Structure: players[0] = équipe 1, players[1] = équipe 2
-        home_stats = _parse_team_player_stats(players[0])
-        away_stats = _parse_team_player_stats(players[1])
-        
-        return {
-            "home_players": home_stats,
-            "away_players": away_stats,
-            "has_detailed_stats": True
-        }
+        # Client HTTP partagé de l'intégration (pool keep-alive)
+        response = await async_get_client(hass).async_get(url)
+        response.raise_for_status()
+
+        with _profiled_section():
+            data = response.json()
+
+            # Extraire les statistiques des box scores
+            boxscore = data.get("boxscore", {})
+            players = boxscore.get("players", [])
+
+            if not players or len(players) < 2:
+                _LOGGER.warning(f"No player stats found for match {match_id}")
+                return None
+
+            # Structure: players[0] = équipe 1, players[1] = équipe 2
+            player_stats = BoxScore(parse_team_boxscore(players[0]), parse_team_boxscore(players[1]))
+        if boxscore_store is not None:
+            boxscore_store.put(match_id, player_stats)
+        return player_stats
         
     except aiohttp.ClientError as e:
         _LOGGER.error(f"Error fetching player stats for match {match_id}: {e}")
@@ -432,88 +838,6 @@ async def _get_player_stats(hass, match_id, match_state):
         return None
 
 
-def _parse_team_player_stats(team_data):
-    """
-    Parse les statistiques des joueurs d'une équipe
-    
-    Args:
-        team_data (dict): Données d'une équipe depuis l'API summary
-    
-    Returns:
-        dict: Dictionnaire avec team info et liste des joueurs
-    """
-    
-    players_stats = []
-    
-    # Informations de l'équipe
-    team_info = team_data.get("team", {})
-    team_name = team_info.get("displayName", "N/A")
-    team_abbreviation = team_info.get("abbreviation", "N/A")
-    
-    # Statistiques des joueurs
-    statistics = team_data.get("statistics", [])
-    
-    _LOGGER.debug(f"Team {team_name}: found {len(statistics)} statistics groups")
-    
-    # Parser tous les groupes de statistiques qui contiennent des athlètes
-    for stat_group in statistics:
-        stat_name = stat_group.get("name", "")
-        athletes = stat_group.get("athletes", [])
-        
-        _LOGGER.debug(f"  Group '{stat_name}': {len(athletes)} athletes")
-        
-        # Si le groupe contient des athlètes, on les traite
-        # (au lieu de filtrer par nom exact, on accepte tout ce qui a des données)
-        if athletes and len(athletes) > 0:
-            for athlete_data in athletes:
-                athlete = athlete_data.get("athlete", {})
-                stats = athlete_data.get("stats", [])
-                
-                # Informations du joueur
-                player_name = athlete.get("displayName", "N/A")
-                player_id = athlete.get("id", "")
-                player_position = athlete.get("position", {}).get("abbreviation", "N/A")
-                player_jersey = athlete.get("jersey", "N/A")
-                player_headshot = athlete.get("headshot", {}).get("href", "")
-                
-                # Convertir les stats en dictionnaire
-                player_stats = {}
-                
-                # Les stats sont dans l'ordre:
-                # MIN, FG, 3PT, FT, OREB, DREB, REB, AST, STL, BLK, TO, PF, +/-, PTS
-                stat_labels = [
-                    "minutes", "fg", "3pt", "ft", "oreb", "dreb", "reb", 
-                    "ast", "stl", "blk", "to", "pf", "plusMinus", "pts"
-                ]
-                
-                for i, stat_value in enumerate(stats):
-                    if i < len(stat_labels):
-                        player_stats[stat_labels[i]] = stat_value
-                
-                # Déterminer si titulaire (starters) ou remplaçant (bench)
-                is_starter = stat_name.lower() in ["starters", "starter"]
-                
-                # Ajouter le joueur à la liste
-                players_stats.append({
-                    "name": player_name,
-                    "id": player_id,
-                    "position": player_position,
-                    "jersey": player_jersey,
-                    "headshot": player_headshot,
-                    "stats": player_stats,
-                    "starter": is_starter
-                })
-                
-                _LOGGER.debug(f"    Added player: {player_name} - {len(stats)} stats")
-    
-    _LOGGER.debug(f"Total players parsed for {team_name}: {len(players_stats)}")
-    
-    return {
-        "team_name": team_name,
-        "team_abbreviation": team_abbreviation,
-        "players": players_stats
-    }
-
 def _get_linescores(competitor):
     linescores = []
     stats = competitor.get("linescores", [])
@@ -531,17 +855,54 @@ def _get_details(details):
         events.append(f"{event_type} - {clock}: {athletes_str}")
     return events
 
-def _parse_date(hass, date_str, show_time=True):
+@lru_cache(maxsize=8)
+def _get_timezone(time_zone):
+    return ZoneInfo(time_zone)
+
+
+def local_timezone(hass):
+    """Fuseau horaire de l'utilisateur (objet ZoneInfo mis en cache)"""
     try:
-        user_timezone = hass.config.time_zone
-        parsed_date = parser.isoparse(date_str).replace(tzinfo=timezone.utc)
-        local_tz = ZoneInfo(user_timezone)
-        local_date = parsed_date.astimezone(local_tz)
+        return _get_timezone(hass.config.time_zone)
+    except (AttributeError, ValueError, TypeError, KeyError):
+        return timezone.utc
 
-        if show_time:
-            return local_date.strftime("%d/%m/%Y %H:%M")
-        else:
-            return local_date.strftime("%d/%m/%Y")
-    except (ValueError, TypeError) as e:
-        #_LOGGER.error(f"Errore nel parsing della data {date_str}: {e}")
-        return "N/A"
\ No newline at end of file
+
+@lru_cache(maxsize=2048)
+def _parse_utc(date_str):
+    """
+    Convertit une date ISO ESPN ("2025-01-10T00:30Z") en datetime UTC
+
+    Les mêmes chaînes reviennent à chaque poll: le résultat est mis en cache.
+
+    Returns:
+        datetime: date UTC, ou None si la chaîne est vide ou invalide
+    """
+    if not date_str:
+        return None
+    try:
+        parsed = datetime.fromisoformat(date_str)
+    except ValueError:
+        try:
+            parsed = parser.isoparse(date_str)
+        except (ValueError, OverflowError):
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def format_date(date, tz=None, show_time=True):
+    """Chaîne d'affichage locale d'une date UTC ("dd/mm/YYYY HH:MM"), "N/A" si absente"""
+    if date is None:
+        return "N/A"
+    local_date = date.astimezone(tz or timezone.utc)
+    if show_time:
+        return local_date.strftime("%d/%m/%Y %H:%M")
+    return local_date.strftime("%d/%m/%Y")
+
+
+def _parse_date(hass, date_str, show_time=True):
+    if not isinstance(date_str, str):
+        return "N/A"
+    return format_date(_parse_utc(date_str), local_timezone(hass), show_time)
@@ -0,0 +1,374 @@
+"""
+Serveur ESPN de substitution pour tester l'intégration hors ligne
+
+Sert les endpoints utilisés par l'intégration (scoreboard nba/all, standings,
+summary?event=, schedule d'équipe) à partir:
+  - d'une timeline enregistrée (--timeline, voir tools/record_timeline.py), ou
+  - d'une soirée synthétique de N matchs qui se déroulent en accéléré (--games).
+
+Le temps de la timeline avance à --speed fois le temps réel. Les réponses
+portent un ETag (304 sur If-None-Match) et sont compressées en gzip si le
+client le demande, comme l'API réelle.
+
+Pour y brancher Home Assistant:
+    NBA_LIVE_ESPN_BASE_URL=http://127.0.0.1:8765 hass -c <config>
+
+Endpoints de contrôle:
+    GET  /_standin/status              temps de timeline, requêtes, état des matchs
+    POST /_standin/seek?at=SECONDES    saute à un instant de la timeline
+    POST /_standin/speed?x=FACTEUR     change l'accélération
+
+Usage: python tools/espn_standin.py [--port 8765] [--speed 10] [--games 8 --stagger 900] [--timeline FICHIER]
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks", "fixtures"))
+
+import generate  # noqa: E402  (fixtures au format ESPN)
+
+PERIODS = 4
+PERIOD_SECONDS = 12 * 60                # durée d'un quart-temps (horloge de jeu)
+BREAK_SECONDS = 2 * 60                  # pause entre quart-temps
+HALFTIME_SECONDS = 15 * 60
+POSSESSION_SECONDS = 24
+
+
+class SyntheticSlate:
+    """
+    Soirée synthétique: N matchs NBA avec tipoffs échelonnés
+
+    L'état de chaque match (score, quart-temps, horloge, statut) est calculé
+    à partir du temps de timeline; les paniers sont tirés une fois pour toutes
+    (graine fixe), donc deux instants identiques donnent le même payload.
+    """
+
+    def __init__(self, games, stagger, seed=7, first_tipoff=60):
+        self.rng = random.Random(seed)
+        self.base = generate.make_scoreboard(seed, games, states=("pre",))
+        self.standings = generate.make_standings(seed)
+        self.games = []
+        for index, event in enumerate(self.base["events"]):
+            # points marqués par possession pour chaque équipe (cumul précalculé)
+            home, away = self._scoring(), self._scoring()
+            if home[-1] == away[-1]:
+                home[-1] += 1   # pas de prolongation simulée: lancer franc décisif sur la dernière possession
+            self.games.append({
+                "event": event,
+                "tipoff": first_tipoff + index * stagger,
+                "home": home,
+                "away": away,
+            })
+        self.duration = max(game["tipoff"] for game in self.games) + self._game_length() if self.games else 0
+        self._summaries = {}
+
+    def _scoring(self):
+        possessions = PERIODS * PERIOD_SECONDS // POSSESSION_SECONDS
+        total, cumulative = 0, []
+        for _ in range(possessions):
+            total += self.rng.choices((0, 1, 2, 3), weights=(48, 4, 34, 14))[0]
+            cumulative.append(total)
+        return cumulative
+
+    @staticmethod
+    def _game_length():
+        return PERIODS * PERIOD_SECONDS + (PERIODS - 2) * BREAK_SECONDS + HALFTIME_SECONDS
+
+    @staticmethod
+    def _game_clock(elapsed):
+        """(state, période, secondes jouées, statut) à `elapsed` secondes après le tipoff"""
+        played = 0
+        for period in range(1, PERIODS + 1):
+            if elapsed < PERIOD_SECONDS:
+                return "in", period, played + elapsed, "In Progress"
+            elapsed -= PERIOD_SECONDS
+            played += PERIOD_SECONDS
+            pause = HALFTIME_SECONDS if period == 2 else BREAK_SECONDS
+            if period < PERIODS and elapsed < pause:
+                return "in", period, played, "Halftime" if period == 2 else "End of Period"
+            if period < PERIODS:
+                elapsed -= pause
+        return "post", PERIODS, played, "Final"
+
+    def game_state(self, game, at):
+        elapsed = at - game["tipoff"]
+        if elapsed < 0:
+            return {"state": "pre", "period": 0, "played": 0, "status": "Scheduled", "home": 0, "away": 0}
+        state, period, played, status = self._game_clock(elapsed)
+        possession = min(int(played // POSSESSION_SECONDS), len(game["home"]) - 1)
+        return {
+            "state": state, "period": period, "played": played, "status": status,
+            "home": game["home"][possession] if played else 0,
+            "away": game["away"][possession] if played else 0,
+        }
+
+    def _apply(self, game, at, wall_clock):
+        event = game["event"]
+        # Date du tipoff en heure réelle, pour que les fenêtres de dates des capteurs l'incluent
+        event["date"] = wall_clock(game["tipoff"]).strftime("%Y-%m-%dT%H:%MZ")
+        event["competitions"][0]["date"] = event["date"]
+        current = self.game_state(game, at)
+        remaining = PERIOD_SECONDS - (current["played"] - (current["period"] - 1) * PERIOD_SECONDS) if current["period"] else 0
+        status_type = {
+            "pre": {"id": "1", "name": "STATUS_SCHEDULED", "state": "pre", "completed": False},
+            "in": {"id": "2", "name": "STATUS_IN_PROGRESS", "state": "in", "completed": False},
+            "post": {"id": "3", "name": "STATUS_FINAL", "state": "post", "completed": True},
+        }[current["state"]]
+        status_type = {**status_type, "description": current["status"], "detail": current["status"], "shortDetail": current["status"]}
+        clock = f"{int(remaining // 60)}:{int(remaining % 60):02d}" if current["state"] == "in" else "0.0"
+        status = {"clock": float(remaining), "displayClock": clock, "period": current["period"], "type": status_type}
+        event["status"] = status
+        competition = event["competitions"][0]
+        competition["status"] = status
+        for competitor, side in zip(competition["competitors"], ("home", "away")):
+            competitor["score"] = str(current[side])
+        if current["state"] == "in":
+            competition["situation"] = {"lastPlay": {
+                "id": f"{event['id']}{int(current['played'] // POSSESSION_SECONDS)}",
+                "text": f"{current['home']}-{current['away']} ({clock} Q{current['period']})",
+            }}
+        else:
+            competition.pop("situation", None)
+
+    def scoreboard(self, at, wall_clock):
+        for game in self.games:
+            self._apply(game, at, wall_clock)
+        return self.base
+
+    def summary(self, event_id, at):
+        for game in self.games:
+            if game["event"]["id"] == event_id and self.game_state(game, at)["state"] == "post":
+                if event_id not in self._summaries:
+                    summary = generate.make_summary(int(event_id) % 1000)
+                    summary["header"]["id"] = event_id
+                    self._summaries[event_id] = summary
+                return self._summaries[event_id]
+        return None
+
+    def status(self, at):
+        return {
+            game["event"]["id"]: {
+                "tipoff_at": game["tipoff"],
+                **self.game_state(game, at),
+                # Instant de timeline du dernier changement de score (mesure de latence de bout en bout)
+                "score_changed_at": self._last_score_change(game, at),
+            }
+            for game in self.games
+        }
+
+    def _last_score_change(self, game, at):
+        """Instant de timeline où le score courant est apparu (les paniers tombent en fin de possession)"""
+        current = self.game_state(game, at)
+        if current["state"] == "pre" or not current["played"]:
+            return None
+        possession = min(int(current["played"] // POSSESSION_SECONDS), len(game["home"]) - 1)
+        while possession > 0 and game["home"][possession - 1] == game["home"][possession] \
+                and game["away"][possession - 1] == game["away"][possession]:
+            possession -= 1
+        return game["tipoff"] + self._elapsed_for_played(possession * POSSESSION_SECONDS)
+
+    @staticmethod
+    def _elapsed_for_played(played):
+        """Temps écoulé depuis le tipoff quand `played` secondes de jeu ont été jouées (pauses incluses)"""
+        elapsed = played
+        for period in range(1, int(played // PERIOD_SECONDS) + 1):
+            if period < PERIODS and played > period * PERIOD_SECONDS:
+                elapsed += HALFTIME_SECONDS if period == 2 else BREAK_SECONDS
+        return elapsed
+
+
+class RecordedTimeline:
+    """
+    Timeline enregistrée: une ligne JSON par capture
+    {"at": secondes, "endpoint": "scoreboard"|"standings"|"summary", "key": ..., "payload": {...}}
+
+    À l'instant t, chaque (endpoint, key) sert sa dernière capture antérieure à t
+    (ou la première s'il n'y en a pas encore).
+    """
+
+    def __init__(self, path):
+        self.frames = {}
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    frame = json.loads(line)
+                    self.frames.setdefault((frame["endpoint"], frame.get("key")), []).append(frame)
+        for frames in self.frames.values():
+            frames.sort(key=lambda frame: frame["at"])
+        self.duration = max((frames[-1]["at"] for frames in self.frames.values()), default=0)
+
+    def _at(self, endpoint, key, at):
+        frames = self.frames.get((endpoint, key))
+        if not frames:
+            return None
+        selected = frames[0]
+        for frame in frames:
+            if frame["at"] > at:
+                break
+            selected = frame
+        return selected["payload"]
+
+    def scoreboard(self, at, league="nba"):
+        return self._at("scoreboard", league, at) or self._at("scoreboard", None, at)
+
+    @property
+    def standings(self):
+        return self._at("standings", None, 0)
+
+    def summary(self, event_id, at):
+        return self._at("summary", event_id, at)
+
+    def status(self, at):
+        scoreboard = self.scoreboard(at) or {}
+        return {
+            event.get("id"): {
+                "state": event.get("status", {}).get("type", {}).get("state"),
+                "status": event.get("status", {}).get("type", {}).get("description"),
+            }
+            for event in scoreboard.get("events", [])
+        }
+
+
+class StandIn:
+    def __init__(self, source, speed, latency_ms=0, error_rate=0.0):
+        self.source = source
+        self.speed = speed
+        self.latency = latency_ms / 1000
+        self.error_rate = error_rate
+        self._origin = time.monotonic()
+        self._offset = 0.0
+        self.requests = Counter()
+        self._cache = {}
+
+    def now(self):
+        """Temps de timeline courant (secondes)"""
+        return self._offset + (time.monotonic() - self._origin) * self.speed
+
+    def wall_clock(self, at):
+        """Heure réelle (UTC) à laquelle la timeline atteindra l'instant `at`"""
+        return datetime.now(timezone.utc) + timedelta(seconds=(at - self.now()) / self.speed)
+
+    def seek(self, at):
+        self._offset = at
+        self._origin = time.monotonic()
+
+    def set_speed(self, speed):
+        self.seek(self.now())
+        self.speed = speed
+
+    async def _respond(self, request, endpoint, payload):
+        self.requests[endpoint] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and random.random() < self.error_rate:
+            return web.Response(status=503, text="stand-in: erreur injectée")
+        if payload is None:
+            return web.json_response({"code": 404, "message": "not found"}, status=404)
+
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        headers = {"ETag": etag, "Content-Type": "application/json", "Cache-Control": "max-age=5"}
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        return web.Response(body=body, headers=headers)
+
+    async def scoreboard(self, request):
+        league = request.match_info["league"]
+        at = self.now()
+        if isinstance(self.source, RecordedTimeline):
+            payload = self.source.scoreboard(at, league)
+        else:
+            payload = self.source.scoreboard(at, self.wall_clock)
+        return await self._respond(request, f"scoreboard/{league}", payload)
+
+    async def standings(self, request):
+        return await self._respond(request, "standings", self.source.standings)
+
+    async def summary(self, request):
+        event_id = request.query.get("event", "")
+        return await self._respond(request, "summary", self.source.summary(event_id, self.now()))
+
+    async def schedule(self, request):
+        return await self._respond(request, "schedule", {"events": []})
+
+    async def status(self, request):
+        at = self.now()
+        return web.json_response({
+            "at": round(at, 1),
+            "speed": self.speed,
+            "duration": self.source.duration,
+            "requests": dict(self.requests),
+            "games": self.source.status(at),
+        })
+
+    async def seek_handler(self, request):
+        self.seek(float(request.query.get("at", 0)))
+        return await self.status(request)
+
+    async def speed_handler(self, request):
+        self.set_speed(float(request.query.get("x", self.speed)))
+        return await self.status(request)
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/apis/site/v2/sports/basketball/{league}/scoreboard", self.scoreboard)
+        app.router.add_get("/apis/site/v2/sports/basketball/nba/summary", self.summary)
+        app.router.add_get("/apis/v2/sports/basketball/nba/standings", self.standings)
+        app.router.add_get("/apis/site/v2/sports/soccer/all/teams/{team_id}/schedule", self.schedule)
+        app.router.add_get("/_standin/status", self.status)
+        app.router.add_post("/_standin/seek", self.seek_handler)
+        app.router.add_post("/_standin/speed", self.speed_handler)
+        return app
+
+
+def build_standin(args):
+    if args.timeline:
+        source = RecordedTimeline(args.timeline)
+    else:
+        source = SyntheticSlate(args.games, args.stagger, seed=args.seed)
+    standin = StandIn(source, args.speed, latency_ms=args.latency_ms, error_rate=args.error_rate)
+    if args.start_at:
+        standin.seek(args.start_at)
+    return standin
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--speed", type=float, default=1.0, help="accélération du temps de timeline")
+    parser.add_argument("--timeline", help="timeline enregistrée (JSON lines, tools/record_timeline.py)")
+    parser.add_argument("--games", type=int, default=8, help="matchs de la soirée synthétique")
+    parser.add_argument("--stagger", type=float, default=900, help="secondes entre deux tipoffs (synthétique)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--start-at", type=float, default=0, help="instant de départ dans la timeline")
+    parser.add_argument("--latency-ms", type=float, default=0, help="latence ajoutée à chaque réponse")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="proportion de réponses 503")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    standin = build_standin(args)
+    print(f"ESPN stand-in sur http://{args.host}:{args.port} (x{args.speed}, durée {standin.source.duration:.0f}s)")
+    print(f"NBA_LIVE_ESPN_BASE_URL=http://{args.host}:{args.port}")
+    web.run_app(standin.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Enregistre une soirée ESPN réelle en timeline rejouable par tools/espn_standin.py
+
+Interroge périodiquement le scoreboard NBA, les standings (une fois) et le
+summary de chaque match en cours, et ajoute une ligne JSON par capture:
+    {"at": secondes depuis le début, "endpoint": ..., "key": ..., "payload": {...}}
+
+Seuls les payloads qui ont changé depuis la capture précédente sont écrits.
+
+Usage: python tools/record_timeline.py FICHIER [--interval 20] [--duration 14400]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import aiohttp
+
+ESPN_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
+ESPN_SUMMARY_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event={}"
+ESPN_STANDINGS_URL = "https://site.web.api.espn.com/apis/v2/sports/basketball/nba/standings?"
+
+
+async def _fetch(session, url):
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            if response.status != 200:
+                print(f"{url}: HTTP {response.status}", file=sys.stderr)
+                return None
+            return await response.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"{url}: {e}", file=sys.stderr)
+        return None
+
+
+class TimelineWriter:
+    def __init__(self, handle):
+        self.handle = handle
+        self.origin = time.monotonic()
+        self._last = {}
+        self.frames = 0
+
+    def write(self, endpoint, key, payload):
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        if self._last.get((endpoint, key)) == encoded:
+            return
+        self._last[(endpoint, key)] = encoded
+        at = round(time.monotonic() - self.origin, 1)
+        self.handle.write(f'{{"at":{at},"endpoint":"{endpoint}","key":{json.dumps(key)},"payload":{encoded}}}\n')
+        self.handle.flush()
+        self.frames += 1
+
+
+async def record(path, interval, duration):
+    async with aiohttp.ClientSession() as session:
+        with open(path, "w", encoding="utf-8") as handle:
+            writer = TimelineWriter(handle)
+            standings = await _fetch(session, ESPN_STANDINGS_URL)
+            if standings is not None:
+                writer.write("standings", None, standings)
+
+            while time.monotonic() - writer.origin < duration:
+                scoreboard = await _fetch(session, ESPN_SCOREBOARD_URL)
+                if scoreboard is not None:
+                    writer.write("scoreboard", "nba", scoreboard)
+                    live = [
+                        event["id"] for event in scoreboard.get("events", [])
+                        if event.get("status", {}).get("type", {}).get("state") == "in"
+                    ]
+                    summaries = await asyncio.gather(*(_fetch(session, ESPN_SUMMARY_URL.format(event_id)) for event_id in live))
+                    for event_id, summary in zip(live, summaries):
+                        if summary is not None:
+                            writer.write("summary", event_id, summary)
+                    print(f"{time.strftime('%H:%M:%S')} {len(live)} match(s) en cours, {writer.frames} captures")
+                await asyncio.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="fichier JSON lines de sortie (écrasé s'il existe)")
+    parser.add_argument("--interval", type=float, default=20, help="secondes entre deux captures")
+    parser.add_argument("--duration", type=float, default=4 * 3600, help="durée d'enregistrement, en secondes")
+    args = parser.parse_args()
+    try:
+        asyncio.run(record(args.path, args.interval, args.duration))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,474 @@
+"""
+Harnais de montée en charge: N entrées d'équipe × M matchs en cours contre le stand-in ESPN
+
+Lance le stand-in (tools/espn_standin.py) dans ce processus, prépare une
+configuration Home Assistant temporaire avec N entrées d'équipe (+ l'entrée
+de ligue), démarre Home Assistant dans un sous-processus pointé sur le
+stand-in (NBA_LIVE_ESPN_BASE_URL), puis échantillonne pendant --duration:
+  - requêtes ESPN par minute, par endpoint (compteurs du stand-in)
+  - lag de la boucle d'événements (mesuré dans HA par un composant sonde)
+  - RSS du processus HA et sa croissance
+  - volume d'écriture du recorder (lignes states/state_attributes, taille de la base)
+  - state_changed émis par les entités nba_live et taille de leurs attributs
+
+Nécessite Home Assistant et son frontend (home-assistant-frontend, à la version
+attendue par HA) installés dans l'environnement Python courant.
+Le rapport final est affiché et écrit en JSON (--output).
+
+Usage: python tools/scale_harness.py [--entries 10] [--games 8] [--duration 600] [--speed 10] [--output rapport.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from aiohttp import web
+
+import espn_standin
+from espn_standin import generate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROBE_DOMAIN = "nba_live_scale_probe"
+PROBE_FILE = "scale_probe.json"
+RECORDER_DB = "home-assistant_v2.db"
+
+CONFIGURATION_YAML = """\
+homeassistant:
+  name: nba_live scale harness
+  time_zone: Europe/Paris
+  unit_system: metric
+
+logger:
+  default: warning
+  logs:
+    custom_components.nba_live: {log_level}
+
+recorder:
+  commit_interval: 1
+  purge_keep_days: 1
+
+{probe_domain}:
+"""
+
+PROBE_MANIFEST = {
+    "domain": PROBE_DOMAIN,
+    "name": "nba_live scale probe",
+    "codeowners": [],
+    "dependencies": [],
+    "documentation": "https://github.com/Tonio5978/nba-live",
+    "iot_class": "local_push",
+    "requirements": [],
+    "version": "1.0.0",
+}
+
+# Sonde chargée dans Home Assistant: lag de boucle et state_changed des entités nba_live,
+# réécrits dans un fichier JSON lu par le harnais.
+PROBE_INIT = '''\
+import asyncio
+import json
+import os
+import time
+from collections import deque
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import entity_registry as er
+
+DOMAIN = "{probe_domain}"
+INTERVAL = {interval}
+
+
+async def async_setup(hass, config):
+    registry = er.async_get(hass)
+    lags = deque(maxlen=4096)
+    stats = {{"state_changed": 0, "attribute_bytes": 0, "max_lag": 0.0}}
+    path = hass.config.path("{probe_file}")
+
+    def _on_state_changed(event):
+        entry = registry.async_get(event.data["entity_id"])
+        new_state = event.data.get("new_state")
+        if entry is None or entry.platform != "nba_live" or new_state is None:
+            return
+        stats["state_changed"] += 1
+        stats["attribute_bytes"] += len(json.dumps(dict(new_state.attributes), default=str))
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _on_state_changed)
+
+    def _write(snapshot):
+        with open(path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump(snapshot, handle)
+        os.replace(path + ".tmp", path)
+
+    async def _sample():
+        loop = asyncio.get_running_loop()
+        last_write = time.monotonic()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(INTERVAL)
+            lag = max(0.0, loop.time() - start - INTERVAL)
+            lags.append(lag)
+            stats["max_lag"] = max(stats["max_lag"], lag)
+            if time.monotonic() - last_write >= 1:
+                last_write = time.monotonic()
+                snapshot = dict(stats, lags=list(lags), entities=sum(
+                    1 for entry in registry.entities.values() if entry.platform == "nba_live"
+                ))
+                lags.clear()
+                await hass.async_add_executor_job(_write, snapshot)
+
+    hass.async_create_background_task(_sample(), "nba_live scale probe")
+    return True
+'''
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _slate_teams(slate):
+    """Équipes des matchs de la soirée d'abord (elles auront des matchs en cours), puis le reste de la ligue"""
+    teams = []
+    for game in slate.games:
+        for competitor in game["event"]["competitions"][0]["competitors"]:
+            team = (competitor["team"]["id"], competitor["team"]["displayName"])
+            if team not in teams:
+                teams.append(team)
+    for team_id, name, _ in generate.NBA_TEAMS:
+        if (team_id, name) not in teams:
+            teams.append((team_id, name))
+    return teams
+
+
+def _config_entry(title, data, options):
+    # Format 1.1 de core.config_entries: Home Assistant migre lui-même vers la version courante
+    return {
+        "entry_id": uuid.uuid4().hex,
+        "domain": "nba_live",
+        "title": title,
+        "data": data,
+        "options": options,
+        "source": "user",
+        "version": 1,
+    }
+
+
+def build_entries(teams, count, league_entry, all_today_entry, options):
+    today = datetime.now()
+    dates = {
+        "start_date": today.strftime("%Y-%m-%d"),
+        "end_date": (today + timedelta(days=30)).strftime("%Y-%m-%d"),
+    }
+    entries = []
+    for index in range(count):
+        team_id, team_name = teams[index % len(teams)]
+        entries.append(_config_entry(f"Team NBA {team_name}", {
+            "selection": "Equipe", "competition_code": "nba", "team_name": team_name, "team_id": team_id,
+            "name": f"Team NBA {team_name}", **dates,
+        }, options))
+    if league_entry:
+        entries.append(_config_entry("NBA", {
+            "selection": "Championnat", "competition_code": "nba", "name": "NBA", **dates,
+        }, options))
+    if all_today_entry:
+        entries.append(_config_entry("Tutte le partite di oggi", {
+            "selection": "Tous les matchs de la journée", "competition_code": "99999",
+        }, options))
+    return entries
+
+
+def prepare_config(config_dir, entries, args):
+    os.makedirs(os.path.join(config_dir, ".storage"), exist_ok=True)
+    os.makedirs(os.path.join(config_dir, "custom_components", PROBE_DOMAIN), exist_ok=True)
+
+    integration = os.path.join(config_dir, "custom_components", "nba_live")
+    if not os.path.exists(integration):
+        os.symlink(os.path.join(ROOT, "custom_components", "nba_live"), integration)
+
+    with open(os.path.join(config_dir, "configuration.yaml"), "w", encoding="utf-8") as handle:
+        handle.write(CONFIGURATION_YAML.format(probe_domain=PROBE_DOMAIN, log_level=args.log_level))
+    probe_dir = os.path.join(config_dir, "custom_components", PROBE_DOMAIN)
+    with open(os.path.join(probe_dir, "manifest.json"), "w", encoding="utf-8") as handle:
+        json.dump(PROBE_MANIFEST, handle, indent=2)
+    with open(os.path.join(probe_dir, "__init__.py"), "w", encoding="utf-8") as handle:
+        handle.write(PROBE_INIT.format(probe_domain=PROBE_DOMAIN, interval=args.lag_interval, probe_file=PROBE_FILE))
+    with open(os.path.join(config_dir, ".storage", "core.config_entries"), "w", encoding="utf-8") as handle:
+        json.dump({
+            "version": 1, "minor_version": 1, "key": "core.config_entries",
+            "data": {"entries": entries},
+        }, handle, indent=2)
+
+
+def _rss_bytes(pid):
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as handle:
+            for line in handle:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _recorder_stats(config_dir):
+    path = os.path.join(config_dir, RECORDER_DB)
+    if not os.path.exists(path):
+        return None
+    size = sum(os.path.getsize(path + suffix) for suffix in ("", "-wal") if os.path.exists(path + suffix))
+    stats = {"db_bytes": size}
+    try:
+        with sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=1) as connection:
+            for table in ("states", "state_attributes", "events"):
+                stats[f"{table}_rows"] = connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    except sqlite3.Error:
+        pass  # schéma pas encore créé, ou base verrouillée: on garde la taille
+    return stats
+
+
+def _read_probe(config_dir):
+    try:
+        with open(os.path.join(config_dir, PROBE_FILE), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _percentile(samples, q):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Sampler:
+    """Séries temporelles collectées pendant la mesure"""
+
+    def __init__(self, standin, process, config_dir):
+        self.standin = standin
+        self.process = process
+        self.config_dir = config_dir
+        self.samples = []
+        self.lags = []
+        self.started = None
+
+    def sample(self):
+        now = time.monotonic()
+        if self.started is None:
+            self.started = now
+        probe = _read_probe(self.config_dir) or {}
+        self.lags.extend(probe.pop("lags", []))
+        self.samples.append({
+            "elapsed": round(now - self.started, 1),
+            "timeline": round(self.standin.now(), 1),
+            "requests": dict(self.standin.requests),
+            "rss_bytes": _rss_bytes(self.process.pid),
+            "recorder": _recorder_stats(self.config_dir),
+            "probe": probe,
+            "live_games": sum(1 for game in self.standin.source.status(self.standin.now()).values() if game["state"] == "in"),
+        })
+
+    def report(self, args, entries):
+        first, last = self.samples[0], self.samples[-1]
+        minutes = max(last["elapsed"] - first["elapsed"], 1) / 60
+        requests = {
+            endpoint: round((count - first["requests"].get(endpoint, 0)) / minutes, 1)
+            for endpoint, count in last["requests"].items()
+        }
+        rss = [sample["rss_bytes"] for sample in self.samples if sample["rss_bytes"]]
+        recorder_first = first["recorder"] or {}
+        recorder_last = last["recorder"] or {}
+        probe_first = first["probe"] or {}
+        probe_last = last["probe"] or {}
+
+        def growth(key, start, end):
+            if key not in end:
+                return None
+            return end[key] - start.get(key, 0)
+
+        return {
+            "parameters": {
+                "team_entries": args.entries, "config_entries": len(entries), "games": args.games,
+                "stagger": args.stagger, "speed": args.speed, "duration": args.duration,
+                "slim_attributes": args.slim_attributes,
+            },
+            "entities": probe_last.get("entities"),
+            "max_live_games": max(sample["live_games"] for sample in self.samples),
+            "requests_per_minute": {"total": round(sum(requests.values()), 1), **requests},
+            "event_loop_lag_ms": {
+                "p50": _ms(_percentile(self.lags, 0.5)),
+                "p99": _ms(_percentile(self.lags, 0.99)),
+                "max": _ms(probe_last.get("max_lag")),
+                "samples": len(self.lags),
+            },
+            "rss": {
+                "start_mib": _mib(rss[0]) if rss else None,
+                "end_mib": _mib(rss[-1]) if rss else None,
+                "peak_mib": _mib(max(rss)) if rss else None,
+                "growth_mib": _mib(rss[-1] - rss[0]) if rss else None,
+            },
+            "recorder": {
+                "db_growth_kib": round(growth("db_bytes", recorder_first, recorder_last) / 1024, 1)
+                if "db_bytes" in recorder_last else None,
+                "states_rows": growth("states_rows", recorder_first, recorder_last),
+                "state_attributes_rows": growth("state_attributes_rows", recorder_first, recorder_last),
+                "state_changed": growth("state_changed", probe_first, probe_last),
+                "state_changed_per_minute": round(growth("state_changed", probe_first, probe_last) / minutes, 1)
+                if "state_changed" in probe_last else None,
+                "attribute_kib": round(growth("attribute_bytes", probe_first, probe_last) / 1024, 1)
+                if "attribute_bytes" in probe_last else None,
+            },
+            "samples": self.samples,
+        }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def _mib(size):
+    return round(size / (1024 * 1024), 1)
+
+
+def print_report(report):
+    parameters = report["parameters"]
+    print(f"\n{parameters['config_entries']} entrées ({parameters['team_entries']} équipes), "
+          f"{report['entities']} entités, jusqu'à {report['max_live_games']} matchs en cours")
+    print("requêtes/min:")
+    for endpoint, rate in report["requests_per_minute"].items():
+        print(f"  {endpoint:<28} {rate:>8}")
+    lag = report["event_loop_lag_ms"]
+    print(f"lag de boucle (ms): p50 {lag['p50']}  p99 {lag['p99']}  max {lag['max']}  ({lag['samples']} mesures)")
+    rss = report["rss"]
+    print(f"RSS (MiB): début {rss['start_mib']}  fin {rss['end_mib']}  pic {rss['peak_mib']}  croissance {rss['growth_mib']}")
+    recorder = report["recorder"]
+    print(f"recorder: +{recorder['states_rows']} states, +{recorder['state_attributes_rows']} state_attributes, "
+          f"+{recorder['db_growth_kib']} KiB")
+    print(f"state_changed nba_live: {recorder['state_changed']} ({recorder['state_changed_per_minute']}/min, "
+          f"{recorder['attribute_kib']} KiB d'attributs)")
+
+
+async def _wait_for_probe(config_dir, process, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Home Assistant s'est arrêté au démarrage (code {process.returncode})")
+        probe = _read_probe(config_dir)
+        if probe and probe.get("entities"):
+            return
+        await asyncio.sleep(1)
+    raise RuntimeError(f"Home Assistant pas prêt après {timeout}s")
+
+
+async def run(args):
+    standin_args = espn_standin.parse_args([
+        "--games", str(args.games), "--stagger", str(args.stagger), "--speed", str(args.speed),
+        "--seed", str(args.seed), "--latency-ms", str(args.latency_ms), "--error-rate", str(args.error_rate),
+    ])
+    standin = espn_standin.build_standin(standin_args)
+    port = _free_port()
+    runner = web.AppRunner(standin.app())
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+
+    config_dir = args.config_dir or tempfile.mkdtemp(prefix="nba_live_scale_")
+    options = {"slim_attributes": args.slim_attributes}
+    entries = build_entries(_slate_teams(standin.source), args.entries, not args.no_league_entry,
+                            args.all_today_entry, options)
+    prepare_config(config_dir, entries, args)
+
+    env = dict(os.environ, NBA_LIVE_ESPN_BASE_URL=f"http://127.0.0.1:{port}")
+    log = open(os.path.join(config_dir, "harness-hass.log"), "w", encoding="utf-8")
+    # cwd: avec -m, le dossier courant passe en tête de sys.path; lancé depuis le dépôt, son
+    # custom_components masquerait celui de la configuration (et la sonde)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "homeassistant", "--config", config_dir, "--skip-pip"],
+        env=env, stdout=log, stderr=subprocess.STDOUT, cwd=config_dir,
+    )
+    print(f"stand-in sur :{port}, Home Assistant (pid {process.pid}) dans {config_dir}")
+
+    try:
+        await _wait_for_probe(config_dir, process, args.startup_timeout)
+        # La soirée démarre quand HA est prêt, pour que les tipoffs tombent pendant la mesure
+        standin.seek(args.start_at)
+        sampler = Sampler(standin, process, config_dir)
+        deadline = time.monotonic() + args.duration
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"Home Assistant s'est arrêté pendant la mesure (code {process.returncode})")
+            sampler.sample()
+            await asyncio.sleep(args.sample_interval)
+        sampler.sample()
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, process.wait, 60)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        log.close()
+        await runner.cleanup()
+
+    report = sampler.report(args, entries)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"rapport: {args.output}")
+    if not args.config_dir and not args.keep:
+        shutil.rmtree(config_dir, ignore_errors=True)
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=10, help="entrées d'équipe (3 capteurs chacune)")
+    parser.add_argument("--no-league-entry", action="store_true", help="sans l'entrée de ligue (standings + match_day)")
+    parser.add_argument("--all-today-entry", action="store_true", help="ajoute l'entrée « tous les matchs du jour »")
+    parser.add_argument("--games", type=int, default=8, help="matchs de la soirée simulée")
+    parser.add_argument("--stagger", type=float, default=300, help="secondes de timeline entre deux tipoffs")
+    parser.add_argument("--speed", type=float, default=10, help="accélération de la timeline du stand-in")
+    parser.add_argument("--start-at", type=float, default=0, help="instant de la timeline au début de la mesure")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--duration", type=float, default=600, help="durée de la mesure, en secondes réelles")
+    parser.add_argument("--sample-interval", type=float, default=10, help="secondes entre deux échantillons")
+    parser.add_argument("--lag-interval", type=float, default=0.1, help="période de la sonde de lag, en secondes")
+    parser.add_argument("--slim-attributes", action="store_true", help="active l'option slim_attributes")
+    parser.add_argument("--latency-ms", type=float, default=0, help="latence ajoutée par le stand-in")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="proportion de réponses 503 du stand-in")
+    parser.add_argument("--startup-timeout", type=float, default=300)
+    parser.add_argument("--config-dir", help="dossier de configuration HA (temporaire par défaut)")
+    parser.add_argument("--keep", action="store_true", help="conserve le dossier temporaire (logs, base du recorder)")
+    parser.add_argument("--log-level", default="warning", help="niveau de log de custom_components.nba_live")
+    parser.add_argument("--output", help="fichier JSON du rapport (avec les séries échantillonnées)")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    try:
+        import homeassistant  # noqa: F401
+        import hass_frontend  # noqa: F401
+    except ImportError:
+        # HA démarre avec --skip-pip: sans le frontend, il bascule en recovery mode
+        print("Home Assistant et son frontend doivent être installés dans cet environnement "
+              "(pip install homeassistant home-assistant-frontend)", file=sys.stderr)
+        return 2
+    try:
+        asyncio.run(run(args))
+    except RuntimeError as e:
+        print(f"échec: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())